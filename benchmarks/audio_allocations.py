@@ -0,0 +1,118 @@
+"""
+benchmarks.audio_allocations - Vérifier que le callback audio n'alloue aucun tableau numpy
+
+Joue un son en boucle avec tous les effets actifs et compte avec tracemalloc les blocs mémoire
+de numpy (domaine numpy.lib.tracemalloc_domain) alloués pendant les callbacks en régime établi,
+d'abord avec des effets fixes, puis pendant une rampe de fade_lowpass (ParameterRamp).
+tracemalloc n'est démarré qu'après la mise en route : seuls les blocs alloués pendant la mesure
+sont tracés. L'état est relevé avant chaque instruction Python exécutée par le callback, si bien
+qu'un tableau temporaire (a * b dans une expression, np.zeros libéré en fin de fonction) est vu
+même s'il est libéré avant la fin du callback. Le code de sortie est non nul si un seul bloc
+numpy est vu.
+
+Seul le backend d'effets numpy est mesuré : pedalboard, que audio.effects.backend: auto choisit
+quand il est plus rapide, alloue ses tampons à chaque bloc.
+
+Utilisation : python -m benchmarks.audio_allocations [--callbacks N] [--storage int16]
+
+EwoFluffy - BrokeTeam - 2025
+"""
+
+import argparse
+import sys
+import tracemalloc
+
+import numpy as np
+
+from systems.audio import AudioEngine
+from systems.audio_cache import STORAGE_SCALES, to_storage
+
+WARMUP_CALLBACKS = 8
+
+
+def numpy_allocations(engine: AudioEngine, outdata: np.ndarray, callbacks: int) -> list[str]:
+    """
+    numpy_allocations - Blocs numpy vus pendant les callbacks
+    ---
+    Retourne un emplacement (fichier:ligne) par bloc numpy alloué pendant les callbacks, qu'il
+    soit encore vivant après le callback ou seulement entre deux instructions Python.
+    """
+
+    frames = outdata.shape[0]
+    numpy_domain = [tracemalloc.DomainFilter(True, np.lib.tracemalloc_domain)]
+    seen: dict[tuple, str] = {}
+
+    def collect() -> None:
+        for trace in tracemalloc.take_snapshot().filter_traces(numpy_domain).traces:
+            frame = trace.traceback[0]
+            seen.setdefault(tuple(trace.traceback), f"{frame.filename}:{frame.lineno}")
+
+    def tracer(frame, event, arg):
+        # Relevé avant chaque opcode : les temporaires encore sur la pile sont visibles
+        frame.f_trace_opcodes = True
+        if event == "opcode":
+            collect()
+        return tracer
+
+    tracemalloc.start()
+    sys.settrace(tracer)
+    try:
+        for _ in range(callbacks):
+            engine.audio_callback(outdata, frames, None, None)
+    finally:
+        sys.settrace(None)
+    collect()
+    tracemalloc.stop()
+
+    return sorted(set(seen.values()))
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--callbacks", type=int, default=10, help="Callbacks mesurés par phase")
+    parser.add_argument(
+        "--storage", choices=list(STORAGE_SCALES), default="float32", help="Format du son joué"
+    )
+    args = parser.parse_args()
+
+    # Seul le backend numpy garantit un callback sans allocation
+    engine = AudioEngine(backend="numpy")
+    noise = np.random.default_rng(0).uniform(-1.0, 1.0, (2, engine.sample_rate)).astype(np.float32)
+    engine.add_sound("noise", to_storage(noise, args.storage))
+    engine.play_sound("noise", loop=True, volume=0.5)
+
+    engine.set_distortion(6.0)
+    engine.set_chorus(0.5)
+    engine.set_reverb(0.5)
+    engine.set_lowpass(250.0)
+
+    outdata = np.zeros((engine.block_size, 2), dtype=np.float32)
+    for _ in range(WARMUP_CALLBACKS):
+        engine.audio_callback(outdata, engine.block_size, None, None)
+
+    failed = False
+    phases = {
+        "effets fixes": None,
+        # Rampe assez longue pour couvrir tous les callbacks mesurés
+        "rampe fade_lowpass": lambda: engine.fade_lowpass(8000.0, 10.0),
+    }
+    for name, setup in phases.items():
+        if setup is not None:
+            setup()
+            engine.audio_callback(outdata, engine.block_size, None, None)  # Commande ramp reçue
+            assert engine.ramps, "the lowpass ramp should still be running"
+
+        allocations = numpy_allocations(engine, outdata, args.callbacks)
+        failed |= bool(allocations)
+        print(
+            f"{name} : {args.callbacks} callbacks, {len(allocations)} allocations numpy"
+            + ("  ok" if not allocations else "  ÉCHEC")
+        )
+        for location in allocations:
+            print(f"  {location}")
+
+    sys.exit(1 if failed else 0)
+
+
+if __name__ == "__main__":
+    main()
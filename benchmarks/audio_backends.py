@@ -0,0 +1,132 @@
+"""
+benchmarks.audio_backends - Vérifier que chaque backend d'effets produit une sortie correcte
+
+Les mêmes contrôles hors ligne sont appliqués à tous les backends de systems.audio_effects :
+valeurs neutres sans effet, saturation bornée, atténuation du passe-bas, queue de réverbe,
+chorus audible, et rendu complet d'un scénario par AudioEngine.render sans valeur invalide.
+Le code de sortie est non nul si un contrôle échoue.
+
+Utilisation : python -m benchmarks.audio_backends [--backend numpy]
+
+EwoFluffy - BrokeTeam - 2025
+"""
+
+import argparse
+import sys
+
+import numpy as np
+
+from benchmarks.audio_engine import SCRIPT
+from systems.audio import AudioEffect, AudioEngine
+from systems.audio_effects import BACKENDS, EffectBackend
+
+SAMPLE_RATE = 44100
+BLOCK_SIZE = 512
+
+
+def sine(frequency: float, seconds: float = 0.5, level: float = 0.5) -> np.ndarray:
+    """
+    sine - Sinusoïde stéréo (2, frames) en float32
+    """
+
+    t = np.arange(int(seconds * SAMPLE_RATE)) / SAMPLE_RATE
+    wave = (level * np.sin(2 * np.pi * frequency * t)).astype(np.float32)
+    return np.stack([wave, wave])
+
+
+def run(backend: EffectBackend, signal: np.ndarray, **values) -> np.ndarray:
+    """
+    run - Faire passer un signal bloc par bloc dans un backend, avec les effets donnés
+    """
+
+    effects = AudioEffect(**values)
+    out = signal.copy()
+    for start in range(0, out.shape[1], BLOCK_SIZE):
+        backend.process(out[:, start:start + BLOCK_SIZE], effects)
+    return out
+
+
+def rms(signal: np.ndarray) -> float:
+    return float(np.sqrt(np.mean(np.square(signal, dtype=np.float64))))
+
+
+def check_neutral(backend_class) -> bool:
+    noise = np.random.default_rng(0).uniform(-0.5, 0.5, (2, 4 * BLOCK_SIZE)).astype(np.float32)
+    return np.array_equal(run(backend_class(SAMPLE_RATE), noise), noise)
+
+
+def check_distortion(backend_class) -> bool:
+    signal = sine(440.0, level=0.9)
+    out = run(backend_class(SAMPLE_RATE), signal, distortion=20.0)
+    return np.abs(out).max() <= 1.0 and rms(out) > rms(signal)
+
+
+def check_lowpass(backend_class) -> bool:
+    low = run(backend_class(SAMPLE_RATE), sine(60.0), lowpass=250.0)
+    high = run(backend_class(SAMPLE_RATE), sine(5000.0), lowpass=250.0)
+    half = SAMPLE_RATE // 4  # Régime établi
+    # Premier ordre : -3 dB à la coupure, environ -26 dB à 5 kHz
+    return (
+        rms(low[:, half:]) > 0.7 * rms(sine(60.0))
+        and rms(high[:, half:]) < 0.1 * rms(sine(5000.0))
+    )
+
+
+def check_reverb(backend_class) -> bool:
+    impulse = np.zeros((2, SAMPLE_RATE // 2), dtype=np.float32)
+    impulse[:, 0] = 1.0
+    out = run(backend_class(SAMPLE_RATE), impulse, reverb=0.5)
+    return rms(out[:, SAMPLE_RATE // 10:]) > 1e-4
+
+
+def check_chorus(backend_class) -> bool:
+    signal = sine(440.0)
+    out = run(backend_class(SAMPLE_RATE), signal, chorus=1.0)
+    return np.isfinite(out).all() and np.abs(out - signal).max() > 0.05
+
+
+def check_render(backend_name) -> bool:
+    engine = AudioEngine(backend=backend_name)
+    engine.load_sound("splash_sound", "sfx/splash.wav")
+    engine.load_stream("music", "sfx/splash.wav")
+    out = engine.render(10.0, SCRIPT)
+    return np.isfinite(out).all() and np.abs(out).max() <= 1.0 and rms(out) > 1e-3
+
+
+CHECKS = [
+    ("valeurs neutres", check_neutral),
+    ("distortion", check_distortion),
+    ("lowpass", check_lowpass),
+    ("reverb", check_reverb),
+    ("chorus", check_chorus),
+]
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--backend", choices=list(BACKENDS), default=None, help="Backend vérifié")
+    args = parser.parse_args()
+
+    failed = False
+    for name, backend_class in BACKENDS.items():
+        if args.backend not in (None, name):
+            continue
+
+        try:
+            backend_class(SAMPLE_RATE)
+        except Exception as e:
+            print(f"{name} : indisponible ({e})")
+            continue
+
+        results = [(check, function(backend_class)) for check, function in CHECKS]
+        results.append(("rendu complet", check_render(name)))
+
+        for check, passed in results:
+            print(f"{name:<11} {check:<16} {'ok' if passed else 'ÉCHEC'}")
+            failed |= not passed
+
+    sys.exit(1 if failed else 0)
+
+
+if __name__ == "__main__":
+    main()
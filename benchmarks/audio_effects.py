@@ -0,0 +1,174 @@
+"""
+benchmarks.audio_effects - Mesure du débit des effets audio numpy de systems.audio_effects
+
+Compare les versions vectorisées de Reverb, Chorus et Lowpass aux anciennes versions
+échantillon par échantillon (sortie et nombre de blocs traités par seconde).
+
+Utilisation : python -m benchmarks.audio_effects [--blocks N]
+
+EwoFluffy - BrokeTeam - 2025
+"""
+
+import argparse
+import time
+
+import numpy as np
+
+from systems.audio_effects import Chorus, Lowpass, Reverb
+
+SAMPLE_RATE = 44100
+BLOCK_SIZE = 512
+
+
+class ReferenceReverb(Reverb):
+    """
+    ReferenceReverb - Ancienne réverbe traitée échantillon par échantillon
+    """
+
+    def process(self, stereo: np.ndarray, amount: float):
+        if amount <= 0.0:
+            return stereo
+
+        mono = stereo.mean(axis=0)
+        out = np.zeros_like(stereo)
+
+        for i in range(mono.size):
+            delayed = self.buffer[self.index]
+            self.buffer[self.index] = mono[i] + delayed * 0.6
+            mix = mono[i] * (1 - amount) + delayed * amount
+            out[0, i] = mix
+            out[1, i] = mix
+            self.index = (self.index + 1) % self.delay
+
+        return out
+
+
+class ReferenceChorus(Chorus):
+    """
+    ReferenceChorus - Ancien chorus traité échantillon par échantillon
+    """
+
+    def __init__(self, sample_rate: int):
+        super().__init__(sample_rate)
+        self.buffer_l = np.zeros(self.max_delay, dtype=np.float32)
+        self.buffer_r = np.zeros(self.max_delay, dtype=np.float32)
+        self.index = 0
+
+    def process(self, stereo: np.ndarray, amount: float):
+        if amount <= 0.0:
+            return stereo
+
+        out = np.zeros_like(stereo)
+        rate = 0.3
+
+        for i in range(stereo.shape[1]):
+            self.buffer_l[self.index] = stereo[0, i]
+            self.buffer_r[self.index] = stereo[1, i]
+
+            mod = (np.sin(self.phase) + 1) * 0.5
+            delay = int(mod * self.max_delay)
+
+            read = (self.index - delay) % self.max_delay
+            out[0, i] = (stereo[0, i] + self.buffer_l[read] * amount) / 2
+            out[1, i] = (stereo[1, i] + self.buffer_r[read] * amount) / 2
+
+            self.index = (self.index + 1) % self.max_delay
+            self.phase += (2 * np.pi * rate) / self.sr
+
+        return out
+
+
+class ReferenceLowpass(Lowpass):
+    """
+    ReferenceLowpass - Ancien passe-bas traité échantillon par échantillon
+    """
+
+    def __init__(self, sample_rate: int):
+        super().__init__(sample_rate)
+        self.prev = np.zeros(2, dtype=np.float32)
+
+    def process(self, stereo: np.ndarray, cutoff: float):
+        if cutoff >= 20000.0:
+            return stereo
+
+        rc = 1.0 / (2 * np.pi * cutoff)
+        dt = 1.0 / self.sr
+        alpha = dt / (rc + dt)
+        out = np.zeros_like(stereo)
+
+        for i in range(stereo.shape[1]):
+            self.prev = self.prev + alpha * (stereo[:, i] - self.prev)
+            out[:, i] = self.prev
+
+        return out
+
+
+# (nom, effet vectorisé, effet de référence, valeur du paramètre)
+CASES = [
+    ("reverb", Reverb, ReferenceReverb, 0.5),
+    ("chorus", Chorus, ReferenceChorus, 0.5),
+    ("lowpass 250 Hz", Lowpass, ReferenceLowpass, 250.0),
+    ("lowpass 5 kHz", Lowpass, ReferenceLowpass, 5000.0),
+]
+
+
+def make_blocks(count: int, seed: int = 0) -> list[np.ndarray]:
+    """
+    make_blocks - Générer des blocs stéréo de bruit pour alimenter les effets
+    """
+
+    rng = np.random.default_rng(seed)
+    return [
+        rng.uniform(-0.5, 0.5, (2, BLOCK_SIZE)).astype(np.float32)
+        for _ in range(count)
+    ]
+
+
+def blocks_per_second(effect, blocks: list[np.ndarray], value: float) -> float:
+    """
+    blocks_per_second - Nombre de blocs traités par seconde par un effet
+    Les effets travaillent sur place, les blocs sont donc modifiés
+    """
+
+    start = time.perf_counter()
+    for block in blocks:
+        effect.process(block, value)
+    return len(blocks) / (time.perf_counter() - start)
+
+
+def max_error(effect, reference, blocks: list[np.ndarray], value: float) -> float:
+    """
+    max_error - Écart maximal entre la sortie d'un effet et celle de sa référence
+    """
+
+    error = 0.0
+    for block in blocks:
+        expected = reference.process(block.copy(), value)
+        output = effect.process(block.copy(), value)
+        error = max(error, float(np.abs(output - expected).max()))
+    return error
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--blocks", type=int, default=200, help="Blocs mesurés par effet")
+    args = parser.parse_args()
+
+    budget = SAMPLE_RATE / BLOCK_SIZE
+
+    print(f"Bloc de {BLOCK_SIZE} frames, temps réel = {budget:.1f} blocs/s")
+    for name, effect_class, reference_class, value in CASES:
+        blocks = make_blocks(args.blocks)
+        error = max_error(
+            effect_class(SAMPLE_RATE), reference_class(SAMPLE_RATE), blocks[:20], value
+        )
+        fast = blocks_per_second(effect_class(SAMPLE_RATE), blocks, value)
+        slow = blocks_per_second(reference_class(SAMPLE_RATE), blocks[:20], value)
+        print(
+            f"{name:<16} {fast:>10.0f} blocs/s (référence {slow:>7.0f} blocs/s, "
+            f"x{fast / slow:.0f}) écart max {error:.2e}"
+        )
+
+
+if __name__ == "__main__":
+    main()
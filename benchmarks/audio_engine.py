@@ -0,0 +1,94 @@
+"""
+benchmarks.audio_engine - Mesure du coût du moteur audio en rendu hors temps réel
+
+Rejoue un scénario de jeu (musique en boucle, effets sonores, changements d'effets) avec
+AudioEngine.render, sans carte son, et affiche le facteur temps réel, le coût par bloc (p50/p99)
+et le coût de chaque étage d'effet.
+
+Utilisation : python -m benchmarks.audio_engine [--duration S] [--output rendu.wav] [--backend numpy]
+
+EwoFluffy - BrokeTeam - 2025
+"""
+
+import argparse
+import time
+
+import numpy as np
+
+from systems.audio import AudioEngine
+
+# Scénario : (temps en secondes, méthode de AudioEngine, *arguments)
+SCRIPT = [
+    (0.0, "play_sound", "music", True, 0.5),
+    (1.0, "play_sound", "splash_sound"),
+    (2.0, "set_distortion", 6.0),
+    (4.0, "set_chorus", 0.5),
+    (5.0, "play_sound", "splash_sound"),
+    (6.0, "set_reverb", 0.4),
+    (8.0, "fade_lowpass", 250, 0.5),
+    (9.0, "play_sound", "splash_sound"),
+]
+
+STAGES = ["distortion", "chorus", "reverb", "lowpass"]
+
+
+def timed(function, samples: list[float]):
+    """
+    timed - Envelopper une fonction pour enregistrer la durée de chaque appel
+    """
+
+    def wrapper(*args, **kwargs):
+        start = time.perf_counter()
+        result = function(*args, **kwargs)
+        samples.append(time.perf_counter() - start)
+        return result
+
+    return wrapper
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--duration", type=float, default=10.0, help="Durée rendue en secondes")
+    parser.add_argument("--output", default=None, help="Fichier WAV où écrire le rendu")
+    parser.add_argument(
+        "--backend", default="auto", help="Backend d'effets (numpy, pedalboard ou auto)"
+    )
+    args = parser.parse_args()
+
+    engine = AudioEngine(backend=args.backend)
+    engine.load_sound("splash_sound", "sfx/splash.wav")
+    engine.load_stream("music", "sfx/splash.wav")
+
+    # Les instrumentations sont posées sur l'instance, render() appelle donc les versions mesurées
+    blocks: list[float] = []
+    engine.audio_callback = timed(engine.audio_callback, blocks)
+    stages: dict[str, list[float]] = {}
+    for name in STAGES:
+        effect = getattr(engine.backend, name)
+        stages[name] = []
+        effect.process = timed(effect.process, stages[name])
+
+    start = time.perf_counter()
+    engine.render(args.duration, SCRIPT, args.output)
+    elapsed = time.perf_counter() - start
+
+    budget = engine.block_size / engine.sample_rate
+    costs = np.array(blocks)
+    p50, p99 = np.percentile(costs, [50, 99])
+
+    print(
+        f"{len(blocks)} blocs de {engine.block_size} frames, budget {budget * 1000:.2f} ms/bloc, "
+        f"backend {engine.backend.name}"
+    )
+    print(f"Facteur temps réel : x{args.duration / elapsed:.1f}")
+    print(
+        f"Coût par bloc : p50 {p50 * 1000:.3f} ms ({p50 / budget:.1%}), "
+        f"p99 {p99 * 1000:.3f} ms ({p99 / budget:.1%})"
+    )
+    for name, samples in stages.items():
+        mean = sum(samples) / len(blocks)
+        print(f"  {name:<11} {mean * 1000:.3f} ms/bloc ({mean / budget:.1%})")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,92 @@
+"""
+benchmarks.fixed_timestep - Vérifier que la vitesse du jeu ne dépend plus de la fréquence d'affichage
+
+Le niveau est lancé sans affichage, balle en jeu dès le départ, et joué pendant quelques secondes
+simulées à plusieurs fréquences d'affichage (30, 60 et 144 images par seconde, avec ou sans
+irrégularités). Le nombre de ticks de simulation et la position finale de la balle doivent être
+identiques partout ; le coût moyen d'une image est affiché pour chaque fréquence.
+Le code de sortie est non nul si une fréquence donne un résultat différent.
+
+Utilisation : python -m benchmarks.fixed_timestep [--seconds 2]
+
+EwoFluffy - BrokeTeam - 2025
+"""
+
+import argparse
+import random
+import sys
+import time
+
+from core.engine import Game
+
+# Nom : (images par seconde, irrégularité relative de la durée d'une image)
+PRESENTATIONS = {
+    "30 Hz": (30, 0.0),
+    "60 Hz": (60, 0.0),
+    "144 Hz": (144, 0.0),
+    "144 Hz irrégulier": (144, 0.5),
+}
+
+
+def play(game: Game, fps: int, jitter: float, seconds: float) -> tuple[int, tuple, float]:
+    """
+    play - Jouer le niveau depuis le début, retourner les ticks, la position de la balle et le coût
+    moyen d'une image en ms
+    """
+
+    game.random.seed(0)  # Mêmes briques à chaque fréquence
+    game.scene_manager.set_active_scene("level", False)
+    game.timestep.accumulator = 0.0
+    start_ticks = game.timestep.ticks
+
+    # Durées d'image irrégulières mais de total exact : seule la répartition des ticks change
+    frames = round(seconds * fps)
+    durations = [1 / fps * (1 + random.uniform(-jitter, jitter)) for _ in range(frames)]
+    scale = seconds / sum(durations)
+
+    start = time.perf_counter()
+    for duration in durations:
+        game.step(duration * scale)
+    elapsed = (time.perf_counter() - start) / frames
+
+    # Le reste de l'accumulateur (moins d'un tick) est une erreur d'arrondi de la somme
+    if game.timestep.accumulator > game.timestep.dt / 2:
+        game.step(game.timestep.dt - game.timestep.accumulator)
+
+    ball = game.active_scene.ball
+    position = (round(ball.pos[0], 6), round(ball.pos[1], 6))
+    return game.timestep.ticks - start_ticks, position, elapsed * 1000
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument(
+        "--seconds", type=float, default=2.0, help="Durée de jeu simulée (balle encore en vol à 2 s)"
+    )
+    args = parser.parse_args()
+
+    game = Game(headless=True)
+    game.config.debug.game.autostart = True
+    game.setup()
+
+    random.seed(0)
+    results = {}
+    for name, (fps, jitter) in PRESENTATIONS.items():
+        results[name] = play(game, fps, jitter, args.seconds)
+
+    reference = results["60 Hz"][:2]
+    failed = False
+    print(f"{'affichage':<18} {'ticks':>6} {'balle':>22} {'ms/image':>9}")
+    for name, (ticks, position, cost) in results.items():
+        passed = (ticks, position) == reference
+        failed |= not passed
+        print(
+            f"{name:<18} {ticks:>6} {str(position):>22} {cost:>9.2f}  {'ok' if passed else 'ÉCHEC'}"
+        )
+
+    game.shutdown()
+    sys.exit(1 if failed else 0)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,78 @@
+"""
+benchmarks.gl_resources - Vérifier que les objets OpenGL ne s'accumulent pas en jeu
+
+Le jeu est lancé sans affichage et alterne le menu et le niveau en changeant de niveau de qualité
+à chaque passage (chaque niveau a sa résolution de rendu, donc ses propres cibles hors écran).
+Le nombre d'objets vivants et leur mémoire doivent être identiques à chaque passage par un même
+niveau : une scène inactive rend ses cibles et un changement de résolution libère les anciennes.
+Avec --gpu-timing, les requêtes de systems.gpu_timer doivent aussi apparaître dans le registre ;
+leur nombre n'est comparé qu'à partir du deuxième passage par chaque niveau.
+Le code de sortie est non nul si le registre grossit ou si un objet reste après l'arrêt.
+
+Utilisation : python -m benchmarks.gl_resources [--cycles 10] [--frames 30] [--gpu-timing]
+
+EwoFluffy - BrokeTeam - 2025
+"""
+
+import argparse
+import sys
+
+from core.engine import Game
+from systems.quality import QUALITY_LEVELS
+
+
+def run_scene(game: Game, scene_name: str, frames: int, use_cache: bool = True) -> None:
+    game.scene_manager.set_active_scene(scene_name, use_cache)
+    for _ in range(frames):
+        game.step()
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--cycles", type=int, default=10, help="Passages menu puis niveau")
+    parser.add_argument("--frames", type=int, default=30, help="Frames rendues par scène")
+    parser.add_argument("--gpu-timing", action="store_true", help="Activer debug.gpu_timing")
+    args = parser.parse_args()
+
+    game = Game(headless=True)
+    game.config.debug.gpu_timing = args.gpu_timing
+    game.setup()
+    resources = game.render_device.resources
+
+    print(f"{'cycle':>5} {'qualité':<8} {'objets':>7} {'Mio':>8}")
+    live: dict[str, list[tuple[int, int]]] = {}
+    for cycle in range(args.cycles):
+        level = QUALITY_LEVELS[cycle % len(QUALITY_LEVELS)].name
+        game.quality.set_level(level)
+
+        # Le menu est rechargé sans cache, comme en jeu après une partie
+        run_scene(game, "menu", args.frames, use_cache=False)
+        run_scene(game, "level", args.frames)
+
+        count, nbytes = len(resources.resources), resources.nbytes
+        # Les requêtes GPU sont créées à la demande, jusqu'au premier passage par chaque niveau
+        if not args.gpu_timing or cycle >= len(QUALITY_LEVELS):
+            live.setdefault(level, []).append((count, nbytes))
+        print(f"{cycle:>5} {level:<8} {count:>7} {nbytes / 2**20:>8.2f}")
+
+    print(resources.report())
+
+    failed = False
+    for level, values in live.items():
+        if len(set(values)) > 1:
+            print(f"Le registre change au niveau {level} : {values[0]} puis {values[-1]}  ÉCHEC")
+            failed = True
+    if args.gpu_timing and "Query" not in resources.counts("device"):
+        print("Requêtes GPU absentes du registre  ÉCHEC")
+        failed = True
+
+    game.shutdown()
+    if resources.resources:
+        print(f"{len(resources.resources)} objets encore vivants après l'arrêt  ÉCHEC")
+        failed = True
+
+    sys.exit(1 if failed else 0)
+
+
+if __name__ == "__main__":
+    main()
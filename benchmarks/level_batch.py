@@ -0,0 +1,69 @@
+"""
+benchmarks.level_batch - Jouer une série de parties du niveau en parallèle, une graine par partie
+
+Lance core.batch.run_batch : --games parties du pilote automatique, graines --seed, --seed + 1...,
+réparties sur --workers processus. Chaque partie terminée est affichée (score, ticks, niveaux,
+temps d'un tick) et ajoutée à --output en JSONL ; le bilan final donne le débit de la série en
+parties et en ticks par seconde, à comparer avec --workers 1 pour mesurer le passage à l'échelle.
+Une partie qui lève une exception est affichée avec sa trace et écrite dans --output comme bilan
+d'erreur ; la série continue et le code de sortie est non nul.
+
+Utilisation : python -m benchmarks.level_batch [--games 32] [--workers N] [--levels 10]
+                                               [--ticks N] [--seed 0] [--output batch.jsonl]
+
+EwoFluffy - BrokeTeam - 2025
+"""
+
+import argparse
+import os
+import sys
+import time
+
+from core.batch import run_batch
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--games", type=int, default=32, help="Nombre de parties")
+    parser.add_argument("--workers", type=int, default=os.cpu_count(), help="Nombre de processus")
+    parser.add_argument("--levels", type=int, default=10, help="Niveaux à terminer par partie")
+    parser.add_argument("--ticks", type=int, default=None, help="Ticks de simulation au maximum par partie")
+    parser.add_argument("--seed", type=int, default=0, help="Graine de la première partie")
+    parser.add_argument("--output", default="batch.jsonl", help="Fichier JSONL des bilans (complété)")
+    args = parser.parse_args()
+
+    seeds = list(range(args.seed, args.seed + args.games))
+    print(f"{args.games} parties sur {args.workers} processus, bilans ajoutés à {args.output}")
+
+    start = time.perf_counter()
+    ticks = 0
+    failed = []
+    for done, result in enumerate(
+        run_batch(seeds, args.workers, args.output, levels=args.levels, ticks=args.ticks), 1
+    ):
+        if "error" in result:
+            failed.append(result["seed"])
+            print(f"[{done}/{args.games}] graine {result['seed']} : {result['error']}  ÉCHEC")
+            print(result["traceback"])
+            continue
+
+        ticks += result["ticks"]
+        tick_ms = result["tick_ms"]
+        print(
+            f"[{done}/{args.games}] graine {result['seed']} : score {result['score']}, "
+            f"{result['ticks']} ticks, {result['levels_cleared']} niveaux, "
+            f"tick p50 {tick_ms.get('p50', 0):.3f} ms / p99 {tick_ms.get('p99', 0):.3f} ms"
+        )
+    elapsed = time.perf_counter() - start
+
+    print(
+        f"{args.games} parties en {elapsed:.1f} s : {args.games / elapsed:.2f} parties/s, "
+        f"{ticks / elapsed:.0f} ticks/s au total"
+    )
+    if failed:
+        print(f"{len(failed)} parties en échec (graines {', '.join(map(str, failed))})")
+    sys.exit(1 if failed else 0)
+
+
+if __name__ == "__main__":
+    main()
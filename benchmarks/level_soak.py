@@ -0,0 +1,48 @@
+"""
+benchmarks.level_soak - Faire jouer le niveau par le pilote automatique, sans affichage et sans attente
+
+Lance core.simulation.LevelSimulation jusqu'à la première limite atteinte (niveaux terminés,
+ticks ou secondes) et affiche le bilan : ticks par seconde, accélération par rapport au temps
+réel, niveaux terminés, vies et parties perdues. Sans --draw, rien n'est dessiné (ni contexte
+OpenGL ni surfaces), seule la logique avance. Une exception dans la logique du jeu fait échouer
+le script avec sa trace complète.
+
+Utilisation : python -m benchmarks.level_soak [--levels 100] [--ticks N] [--seconds S]
+                                              [--draw] [--seed 0]
+
+EwoFluffy - BrokeTeam - 2025
+"""
+
+import argparse
+
+from core.simulation import LevelSimulation
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--levels", type=int, default=100, help="Niveaux à terminer")
+    parser.add_argument("--ticks", type=int, default=None, help="Ticks de simulation au maximum")
+    parser.add_argument("--seconds", type=float, default=None, help="Temps réel au maximum")
+    parser.add_argument("--draw", action="store_true", help="Dessiner chaque tick (OpenGL autonome)")
+    parser.add_argument(
+        "--seed", type=int, default=0, help="Graine des flux aléatoires (systems.random_streams)"
+    )
+    args = parser.parse_args()
+
+    simulation = LevelSimulation(draw=args.draw, seed=args.seed)
+    report = simulation.run(ticks=args.ticks, levels=args.levels, seconds=args.seconds)
+    simulation.close()
+
+    played = report.ticks / simulation.game.timestep.tick_rate
+    print(
+        f"{report.ticks} ticks ({played / 60:.1f} min de jeu) en {report.seconds:.1f} s : "
+        f"{report.ticks_per_second:.0f} ticks/s, x{report.speedup:.0f} temps réel"
+    )
+    print(
+        f"{report.levels_cleared} niveaux terminés (niveau {report.level}), "
+        f"{report.lives_lost} vies perdues, {report.games_lost} parties perdues, score {report.score}"
+    )
+
+
+if __name__ == "__main__":
+    main()
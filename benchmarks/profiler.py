@@ -0,0 +1,131 @@
+"""
+benchmarks.profiler - Coût du profileur de frames et validité de la trace exportée
+
+Mesure le coût d'une zone vide, profileur désactivé puis activé, au delà d'un bloc with sans
+effet (le coût minimal d'un with en Python), et le temps d'une frame du niveau (sans affichage)
+dans les deux cas. La trace d'une partie est ensuite exportée et relue :
+chaque phase de la boucle doit y figurer et chaque zone doit tenir dans sa zone parente.
+Le code de sortie est non nul si une zone désactivée coûte plus de --max-disabled ns de plus
+qu'un with sans effet, ou si la trace est invalide.
+
+Utilisation : python -m benchmarks.profiler [--frames 300] [--max-disabled 150]
+
+EwoFluffy - BrokeTeam - 2025
+"""
+
+import argparse
+import json
+import os
+import sys
+import tempfile
+import time
+
+from core.engine import Game
+from systems.profiler import NULL_ZONE, Profiler
+
+# Phases que la boucle du jeu et le Renderer doivent toujours produire
+EXPECTED = {
+    "frame",
+    "handle_events",
+    "scene_manager.update",
+    "scene_manager.draw",
+    "render_frame",
+    "upload",
+    "upload:write",
+    "upload:texture",
+    "recorder.capture",
+}
+
+
+def zone_cost(profiler: Profiler, count: int = 200_000) -> float:
+    """
+    zone_cost - Coût moyen en ns d'une zone vide, au delà d'un bloc with sans effet
+    """
+
+    start = time.perf_counter_ns()
+    for _ in range(count):
+        with NULL_ZONE:
+            pass
+    baseline = time.perf_counter_ns() - start
+
+    start = time.perf_counter_ns()
+    for _ in range(count):
+        with profiler.zone("empty"):
+            pass
+    return (time.perf_counter_ns() - start - baseline) / count
+
+
+def frame_cost(game: Game, frames: int) -> float:
+    """
+    frame_cost - Temps moyen en ms d'une frame du niveau
+    """
+
+    start = time.perf_counter()
+    for _ in range(frames):
+        game.step()
+    return (time.perf_counter() - start) / frames * 1000
+
+
+def check_trace(path: str) -> list[str]:
+    """
+    check_trace - Erreurs de la trace : phases manquantes, zones qui dépassent de leur parente
+    """
+
+    with open(path, encoding="utf-8") as f:
+        events = [event for event in json.load(f)["traceEvents"] if event["ph"] == "X"]
+
+    errors = [f"phase {name} absente" for name in sorted(EXPECTED - {e["name"] for e in events})]
+
+    # Les évènements sont triés par début : une pile des zones ouvertes suffit
+    stack: list[dict] = []
+    for event in events:
+        while stack and event["ts"] >= stack[-1]["ts"] + stack[-1]["dur"]:
+            stack.pop()
+        if stack and event["ts"] + event["dur"] > stack[-1]["ts"] + stack[-1]["dur"] + 1:
+            errors.append(f"{event['name']} dépasse de {stack[-1]['name']}")
+        stack.append(event)
+
+    return errors
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--frames", type=int, default=300, help="Frames jouées par mesure")
+    parser.add_argument(
+        "--max-disabled", type=float, default=150, help="Surcoût maximal d'une zone désactivée (ns)"
+    )
+    args = parser.parse_args()
+
+    disabled = zone_cost(Profiler(enabled=False))
+    enabled = zone_cost(Profiler(enabled=True, capacity=4096))
+    print(f"zone vide : +{disabled:.0f} ns désactivé, +{enabled:.0f} ns activé")
+
+    game = Game(headless=True)
+    game.config.debug.game.autostart = True
+    game.setup()
+    game.scene_manager.set_active_scene("level")
+
+    game.profiler.enabled = False
+    off = frame_cost(game, args.frames)
+    game.profiler.enabled = True
+    on = frame_cost(game, args.frames)
+    print(f"frame du niveau : {off:.3f} ms sans profileur, {on:.3f} ms avec ({on - off:+.3f} ms)")
+
+    with tempfile.TemporaryDirectory() as directory:
+        path = game.profiler.export(os.path.join(directory, "trace.json"))
+        errors = check_trace(path)
+
+    game.profiler.enabled = False
+    game.shutdown()
+
+    for error in errors:
+        print(f"trace : {error}  ÉCHEC")
+    failed = bool(errors) or disabled > args.max_disabled
+    if disabled > args.max_disabled:
+        print(f"zone désactivée trop chère ({disabled:.0f} ns)  ÉCHEC")
+    print("ok" if not failed else "ÉCHEC")
+    sys.exit(1 if failed else 0)
+
+
+if __name__ == "__main__":
+    main()
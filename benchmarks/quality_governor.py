@@ -0,0 +1,78 @@
+"""
+benchmarks.quality_governor - Vérifier le comportement du gouverneur de qualité
+
+Simule des machines dont le temps de frame dépend du niveau de qualité choisi et rejoue
+dix minutes de jeu à 60 fps dans QualityGovernor, sans fenêtre ni rendu. Pour chaque machine,
+le niveau final et le nombre de changements doivent correspondre à l'attendu : une machine
+rapide reste en haute qualité, des pics isolés ne changent rien, et une machine à la limite
+entre deux niveaux ne doit pas osciller à chaque fenêtre de mesure.
+Le code de sortie est non nul si un contrôle échoue.
+
+Utilisation : python -m benchmarks.quality_governor [--minutes 10]
+
+EwoFluffy - BrokeTeam - 2025
+"""
+
+import argparse
+import random
+import sys
+
+from systems.quality import QualityGovernor
+
+FPS = 60
+
+# Nom : (temps de frame en ms pour chaque niveau, pic en ms toutes les 300 frames ou 0,
+#        niveau final attendu, nombre maximal de changements)
+MACHINES = {
+    "rapide": ((5.0, 4.0, 3.0), 0.0, "high", 0),
+    "pics de chargement": ((5.0, 4.0, 3.0), 500.0, "high", 0),
+    "lente": ((22.0, 13.0, 9.0), 0.0, "medium", 1),
+    "très lente": ((40.0, 25.0, 14.0), 0.0, "low", 2),
+    # Remonte régulièrement tenter la haute qualité, de plus en plus rarement (~240 changements
+    # sans délai croissant)
+    "à la limite": ((20.0, 7.0, 5.0), 0.0, "medium", 24),
+}
+
+
+def simulate(costs: tuple, spike: float, frames: int) -> QualityGovernor:
+    """
+    simulate - Rejouer frames frames d'une machine simulée dans un gouverneur neuf
+    """
+
+    noise = random.Random(0)
+    governor = QualityGovernor(fps=FPS)
+    governor.adaptive = True
+    governor.set_level(0)
+
+    for frame in range(frames):
+        cost = costs[governor.level] * noise.uniform(0.9, 1.1)
+        if spike and frame % 300 == 0:
+            cost = spike
+        governor.record(cost / 1000)
+
+    return governor
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--minutes", type=float, default=10.0, help="Durée de jeu simulée")
+    args = parser.parse_args()
+
+    frames = int(args.minutes * 60 * FPS)
+
+    failed = False
+    for name, (costs, spike, expected, max_changes) in MACHINES.items():
+        governor = simulate(costs, spike, frames)
+        passed = governor.settings.name == expected and len(governor.changes) <= max_changes
+
+        print(
+            f"{name:<19} niveau {governor.settings.name:<6} "
+            f"{len(governor.changes):>3} changements  {'ok' if passed else 'ÉCHEC'}"
+        )
+        failed |= not passed
+
+    sys.exit(1 if failed else 0)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,146 @@
+"""
+benchmarks.render_golden - Images de référence du post-traitement, rendues sans fenêtre
+
+Le jeu est lancé en mode sans affichage (SDL factice, contexte OpenGL autonome) et une mire fixe
+est passée dans la chaîne de post-traitement. Chaque image finale est relue et comparée à sa
+référence dans benchmarks/golden/ ; sans étape, l'image doit être exactement la mire.
+Le temps de rendu par frame est affiché pour chaque cas. Le code de sortie est non nul si une
+image s'écarte de sa référence.
+
+Utilisation : python -m benchmarks.render_golden [--update] [--frames N] [--tolerance 2]
+
+EwoFluffy - BrokeTeam - 2025
+"""
+
+import argparse
+import os
+import sys
+import time
+
+import numpy as np
+import pygame
+
+from core.engine import Game
+from systems import renderer
+
+GOLDEN_DIR = os.path.join(os.path.dirname(__file__), "golden")
+
+# Nom : étapes de post-traitement (les uniforms animés sont fixés par render_case)
+CASES = {
+    "passthrough": [],
+    "crt": [renderer.PostPass("crt")],
+    "crt_vignette": [
+        renderer.PostPass("crt"),
+        renderer.PostPass("vignette", uniforms={"strength": 0.6}),
+    ],
+}
+
+
+def draw_pattern(surface: pygame.Surface) -> None:
+    """
+    draw_pattern - Mire : barres de couleur, dégradé, damier et disques (bords nets et aplats)
+    """
+
+    width, height = surface.get_size()
+    bars = [
+        (255, 255, 255), (255, 255, 0), (0, 255, 255), (0, 255, 0), (255, 0, 255), (255, 0, 0), (0, 0, 255)
+    ]
+
+    bar_width = width // len(bars) + 1
+    for i, color in enumerate(bars):
+        pygame.draw.rect(surface, color, (i * width // len(bars), 0, bar_width, height // 2))
+
+    for x in range(width):
+        level = x * 255 // (width - 1)
+        color = (level, level // 2, 255 - level)
+        pygame.draw.line(surface, color, (x, height // 2), (x, height * 3 // 4))
+
+    cell = 10
+    for y in range(height * 3 // 4, height, cell):
+        for x in range(0, width, cell):
+            color = (246, 172, 201) if (x // cell + y // cell) % 2 else (48, 27, 35)
+            pygame.draw.rect(surface, color, (x, y, cell, cell))
+
+    for i in range(5):
+        pygame.draw.circle(surface, (20, 20, 20), (width * (i + 1) // 6, height // 4), 12 + 6 * i)
+
+
+def render_case(game: Game, passes: list, frames: int) -> tuple[np.ndarray, float]:
+    """
+    render_case - Rendre la mire à travers une chaîne, retourner l'image finale et le temps par frame
+    """
+
+    shaders = renderer.Renderer(passes=passes)
+    shaders.update_values = False
+    shaders.last_warp = 0.5  # Courbure finale du shader crt en jeu
+
+    shaders.render_frame()
+    start = time.perf_counter()
+    for _ in range(frames):
+        shaders.render_frame()
+    image = game.capture()  # Attend la fin du GPU : compté dans le temps par frame
+    elapsed = (time.perf_counter() - start) / frames
+    shaders.release()
+
+    return image, elapsed
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--update", action="store_true", help="Réécrire les images de référence")
+    parser.add_argument("--frames", type=int, default=60, help="Frames rendues par cas")
+    parser.add_argument(
+        "--tolerance", type=int, default=2, help="Écart toléré par composante (rendu logiciel ou GPU)"
+    )
+    args = parser.parse_args()
+
+    game = Game(headless=True)
+    game.config.debug.shaders = True  # Sinon la chaîne ne garde que le flou de pause
+    game.setup()
+    game.quality.set_level("high")
+
+    draw_pattern(game.window)
+    pattern = pygame.surfarray.array3d(game.window).swapaxes(0, 1)
+
+    print(f"Rendu sans fenêtre ({game.render_device.ctx.info['GL_RENDERER']})")
+
+    failed = False
+    for name, passes in CASES.items():
+        image, elapsed = render_case(game, passes, args.frames)
+        path = os.path.join(GOLDEN_DIR, f"{name}.png")
+
+        if args.update and passes:
+            os.makedirs(GOLDEN_DIR, exist_ok=True)
+            pygame.image.save(pygame.surfarray.make_surface(image.swapaxes(0, 1)), path)
+
+        if not passes:
+            reference = pattern  # Sans étape, l'envoi et l'affichage ne doivent rien changer
+        elif os.path.isfile(path):
+            reference = pygame.surfarray.array3d(pygame.image.load(path)).swapaxes(0, 1)
+        else:
+            print(f"{name:<13} {elapsed * 1000:7.2f} ms/frame  pas de référence (--update)")
+            failed = True
+            continue
+
+        if image.shape != reference.shape:
+            print(f"{name:<13} taille {image.shape} au lieu de {reference.shape}  ÉCHEC")
+            failed = True
+            continue
+
+        diff = np.abs(image.astype(np.int16) - reference.astype(np.int16))
+        # Un pilote différent peut arrondir autrement quelques pixels sur les bords de la courbure
+        outliers = np.count_nonzero(diff.max(axis=2) > args.tolerance) / diff[..., 0].size
+        passed = outliers <= (0.0 if not passes else 0.001)
+
+        print(
+            f"{name:<13} {elapsed * 1000:7.2f} ms/frame  écart max {diff.max():3d}, "
+            f"{outliers:.3%} hors tolérance  {'ok' if passed else 'ÉCHEC'}"
+        )
+        failed |= not passed
+
+    game.shutdown()
+    sys.exit(1 if failed else 0)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,80 @@
+"""
+benchmarks.render_upload - Mesure du coût d'envoi d'une frame au GPU
+
+Compare l'ancien envoi de la fenêtre (retournement, conversion RGB puis écriture de la texture)
+à RenderDevice.upload (mémoire de la surface 32 bits copiée telle quelle dans un pixel buffer).
+Fonctionne sans fenêtre avec un contexte OpenGL autonome.
+
+Utilisation : python -m benchmarks.render_upload [--frames N] [--width W] [--height H]
+
+EwoFluffy - BrokeTeam - 2025
+"""
+
+import argparse
+import time
+
+import moderngl
+import numpy as np
+import pygame
+
+from systems.renderer import RenderDevice, create_standalone_context
+
+
+def reference_upload(texture: moderngl.Texture, surface: pygame.Surface) -> None:
+    """
+    reference_upload - Ancien envoi de Renderer.render_frame, deux copies complètes côté CPU
+    """
+
+    flipped = pygame.transform.flip(surface, False, True)
+    texture.write(pygame.image.tobytes(flipped, "RGB"))
+
+
+def frame_times(upload, ctx: moderngl.Context, frames: int) -> tuple[float, float]:
+    """
+    frame_times - Temps CPU moyen d'un envoi, et temps total une fois le GPU synchronisé
+    """
+
+    upload()
+    ctx.finish()
+
+    cpu = 0.0
+    start = time.perf_counter()
+    for _ in range(frames):
+        frame_start = time.perf_counter()
+        upload()
+        cpu += time.perf_counter() - frame_start
+    ctx.finish()
+    return cpu / frames, (time.perf_counter() - start) / frames
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--frames", type=int, default=300, help="Frames mesurées")
+    parser.add_argument("--width", type=int, default=800)
+    parser.add_argument("--height", type=int, default=600)
+    args = parser.parse_args()
+
+    size = (args.width, args.height)
+    ctx = create_standalone_context()
+    device = RenderDevice(ctx)
+
+    surface = pygame.Surface(size)
+    pixels = np.random.default_rng(0).integers(0, 256, (*size, 3), dtype=np.uint8)
+    pygame.surfarray.blit_array(surface, pixels)
+
+    texture = ctx.texture(size, 3)
+    old_cpu, old_total = frame_times(
+        lambda: reference_upload(texture, surface), ctx, args.frames
+    )
+    new_cpu, new_total = frame_times(lambda: device.upload(surface), ctx, args.frames)
+
+    print(f"Frame {size[0]}x{size[1]}, {args.frames} envois ({ctx.info['GL_RENDERER']})")
+    print(f"Ancien envoi  : CPU {old_cpu * 1000:.3f} ms/frame, total {old_total * 1000:.3f} ms/frame")
+    print(f"Pixel buffers : CPU {new_cpu * 1000:.3f} ms/frame, total {new_total * 1000:.3f} ms/frame")
+    print(f"Gain CPU : x{old_cpu / new_cpu:.1f}")
+
+    device.release()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,139 @@
+"""
+benchmarks.replay - Rejouer une session enregistrée sans affichage, mesurer son coût et vérifier qu'elle est identique
+
+La session (systems.replay, enregistrée en jeu avec debug.replay.record ou générée avec
+--generate) est rejouée --runs fois, image par image avec les ticks enregistrés. Après chaque
+image, l'état de la partie (ticks, scène, score, niveau, vies, position exacte de la balle) est
+ajouté à une empreinte SHA-1 : deux relectures, ou deux versions du jeu, qui affichent la même
+empreinte ont joué exactement la même partie, et leurs temps par image sont comparables.
+Le code de sortie est non nul si les relectures d'une même exécution n'ont pas la même empreinte.
+
+--generate écrit une session synthétique du niveau à la place : souris qui balaie l'écran, clic
+pour lancer la balle, passages au niveau suivant et pauses, images de 0 à 2 ticks (affichage
+irrégulier).
+
+Utilisation : python -m benchmarks.replay FICHIER [--runs 2] [--draw]
+              python -m benchmarks.replay FICHIER --generate [--seconds 600] [--seed 0]
+
+EwoFluffy - BrokeTeam - 2025
+"""
+
+import argparse
+import hashlib
+import math
+import random
+import sys
+import time
+
+import numpy as np
+import pygame
+
+from core.engine import Game
+from systems.config import config
+from systems.replay import InputRecorder
+
+
+def generate(path: str, seconds: float, seed: int) -> None:
+    """
+    generate - Écrire une session synthétique de seconds secondes de jeu sur la scène "level"
+    """
+
+    noise = random.Random(seed)
+    tick_rate = config.engine.simulation.tick_rate
+    width = config.graphics.render.width
+    recorder = InputRecorder(seed, tick_rate, "level")
+
+    tick = 0
+    while tick < seconds * tick_rate:
+        ticks = noise.choice((0, 1, 1, 1, 2))
+        before, tick = tick, tick + ticks
+
+        def every(period: int, offset: int = 0) -> bool:
+            # Un multiple de period (décalé de offset) tombe dans les ticks de cette image
+            return (tick - offset) // period > (before - offset) // period
+
+        phase = tick / tick_rate
+        x = width / 2 + width * 0.4 * (0.7 * math.sin(phase * 1.3) + 0.3 * math.sin(phase * 4.1))
+        events = []
+        if every(120):
+            events.append(pygame.event.Event(pygame.MOUSEBUTTONDOWN, button=1, pos=(int(x), 500)))
+        if every(1800):
+            events.append(pygame.event.Event(pygame.KEYDOWN, key=pygame.K_SPACE, mod=0))
+        # Pause d'une seconde et demie toutes les 45 secondes
+        if every(2700, 2610) or every(2700):
+            events.append(pygame.event.Event(pygame.KEYDOWN, key=pygame.K_ESCAPE, mod=0))
+
+        recorder.record(ticks, (int(x), 500), events)
+
+    recorder.save(path)
+    print(f"{recorder.ticks} ticks en {len(recorder.frames)} entrées écrits dans {path}")
+
+
+def replay(path: str, draw: bool) -> tuple[int, float, np.ndarray, str]:
+    """
+    replay - Rejouer la session, retourner les ticks, le temps total, les temps par image (ms) et
+    l'empreinte de la partie
+    """
+
+    game = Game(headless=True, render=draw, replay_path=path)
+    game.config.engine.log_level = 1
+    game.setup()
+    game.start(game.replay.scene)
+
+    digest = hashlib.sha1()
+    durations = []
+    start = time.perf_counter()
+    while game.running:
+        frame_start = time.perf_counter()
+        game.step()
+        durations.append(time.perf_counter() - frame_start)
+
+        scene = game.scene_manager.active
+        ball = getattr(scene, "ball", None)
+        state = (
+            game.timestep.ticks,
+            type(scene).__name__,
+            getattr(scene, "score", None),
+            getattr(scene, "level", None),
+            getattr(scene, "lives", None),
+            tuple(ball.pos) if ball is not None else None,
+        )
+        digest.update(repr(state).encode())
+    elapsed = time.perf_counter() - start
+
+    ticks = game.timestep.ticks
+    game.shutdown()
+    return ticks, elapsed, np.array(durations) * 1000, digest.hexdigest()
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("path", help="Session enregistrée (.json.gz)")
+    parser.add_argument("--runs", type=int, default=2, help="Relectures de la session")
+    parser.add_argument("--draw", action="store_true", help="Dessiner chaque image (OpenGL autonome)")
+    parser.add_argument("--generate", action="store_true", help="Écrire une session synthétique")
+    parser.add_argument("--seconds", type=float, default=600, help="Durée de la session générée")
+    parser.add_argument("--seed", type=int, default=0, help="Graine de la session générée")
+    args = parser.parse_args()
+
+    if args.generate:
+        generate(args.path, args.seconds, args.seed)
+        return
+
+    digests = set()
+    for run in range(1, args.runs + 1):
+        ticks, elapsed, frame_ms, digest = replay(args.path, args.draw)
+        digests.add(digest)
+        p50, p95, p99 = np.percentile(frame_ms, (50, 95, 99))
+        print(
+            f"relecture {run} : {ticks} ticks en {elapsed:.2f} s ({ticks / elapsed:.0f} ticks/s), "
+            f"image p50 {p50:.3f} ms / p95 {p95:.3f} ms / p99 {p99:.3f} ms, empreinte {digest}"
+        )
+
+    failed = len(digests) > 1
+    print("ok" if not failed else "relectures différentes  ÉCHEC")
+    sys.exit(1 if failed else 0)
+
+
+if __name__ == "__main__":
+    main()
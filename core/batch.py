@@ -0,0 +1,120 @@
+"""
+core.batch - Parties simulées en parallèle sur un pool de processus, résultats écrits au fil de l'eau
+
+Contenu:
+
+Fonction play_game
+Fonction run_batch
+
+Chaque partie est une LevelSimulation avec sa propre graine, jouée dans un processus du pool (un
+Game par processus, un interpréteur par cœur). Les bilans remontent au processus parent dès qu'une
+partie se termine, dans l'ordre de fin et non de lancement, et sont ajoutés ligne par ligne à un
+fichier JSONL : une série interrompue garde toutes les parties déjà terminées. Une partie qui
+lève une exception donne un bilan d'erreur (graine, erreur et trace) et la série continue.
+
+EwoFluffy - BrokeTeam - 2025
+"""
+
+import json
+import os
+import traceback
+from collections.abc import Iterator
+from concurrent.futures import FIRST_COMPLETED, Future, ProcessPoolExecutor, wait
+from concurrent.futures.process import BrokenProcessPool
+
+from core.simulation import LevelSimulation
+
+
+def play_game(
+    seed: int,
+    levels: int | None = None,
+    ticks: int | None = None,
+    seconds: float | None = None,
+) -> dict:
+    """
+    play_game - Jouer une partie sans affichage et retourner son bilan (exécutée dans un processus du pool)
+    ---
+    params:
+        - seed: int = Graine de la partie
+        - levels, ticks, seconds = Limites passées à LevelSimulation.run
+    """
+
+    simulation = LevelSimulation(seed=seed, log_level=1)
+    try:
+        report = simulation.run(ticks=ticks, levels=levels, seconds=seconds)
+    finally:
+        simulation.close()
+    return report.as_dict()
+
+
+def run_batch(
+    seeds: list[int],
+    workers: int | None = None,
+    output: str | None = None,
+    levels: int | None = None,
+    ticks: int | None = None,
+    seconds: float | None = None,
+) -> Iterator[dict]:
+    """
+    run_batch - Jouer une partie par graine sur workers processus, chaque bilan est retourné dès sa fin
+    ---
+    params:
+        - seeds: list[int] = Graines des parties, une partie par graine
+        - workers: int | None = Nombre de processus, None pour un par cœur
+        - output: str | None = Fichier JSONL complété à chaque partie terminée, None pour ne rien écrire
+        - levels, ticks, seconds = Limites de chaque partie (voir LevelSimulation.run)
+    Le bilan d'une partie qui a échoué est {"seed", "error", "traceback"} ; si un processus meurt
+    (crash natif), les parties qu'il partageait avec lui dans le pool échouent aussi.
+    """
+
+    if levels is None and ticks is None and seconds is None:
+        raise ValueError("run_batch needs at least one of levels, ticks or seconds")
+
+    workers = min(workers or os.cpu_count() or 1, max(1, len(seeds)))
+    pending = iter(seeds)
+    running: dict[Future, tuple[int, ProcessPoolExecutor]] = {}  # Partie -> graine, pool
+    pool = ProcessPoolExecutor(max_workers=workers)
+
+    def submit(count: int) -> None:
+        # Quelques parties d'avance par processus, pas toute la série d'un coup
+        for seed in pending:
+            running[pool.submit(play_game, seed, levels, ticks, seconds)] = seed, pool
+            count -= 1
+            if count == 0:
+                break
+
+    # Mode "a" : relancer une série complète le fichier au lieu d'écraser les parties déjà jouées
+    results = open(output, "a", encoding="utf-8") if output else None
+    try:
+        submit(workers * 2)
+        while running:
+            done, _ = wait(running, return_when=FIRST_COMPLETED)
+            broken = False
+
+            for future in done:
+                seed, owner = running.pop(future)
+                try:
+                    result = future.result()
+                except Exception as error:
+                    # Une partie qui plante n'arrête pas la série : son erreur est écrite à sa place
+                    broken |= isinstance(error, BrokenProcessPool) and owner is pool
+                    result = {
+                        "seed": seed,
+                        "error": repr(error),
+                        "traceback": "".join(traceback.format_exception(error)),
+                    }
+                if results is not None:
+                    results.write(json.dumps(result) + "\n")
+                    results.flush()
+                yield result
+
+            if broken:
+                # Un processus mort (crash natif) casse tout le pool, et les parties qu'il jouait
+                # avec lui : la suite de la série repart sur un pool neuf
+                pool.shutdown(wait=True)
+                pool = ProcessPoolExecutor(max_workers=workers)
+            submit(len(done))
+    finally:
+        pool.shutdown(wait=True, cancel_futures=True)
+        if results is not None:
+            results.close()
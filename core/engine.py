@@ -2,10 +2,24 @@
 core.engine - Classe principale du moteur BrokeEngine
 """
 
+import os
+import time
+
+import numpy as np
 import pygame
 
 from core import context, error_handler, scene_manager, event_manager
-from systems import discord, logging
+from systems import (
+    discord,
+    logging,
+    profiler,
+    quality,
+    random_streams,
+    recorder,
+    renderer,
+    replay,
+    timestep,
+)
 from systems.config import config
 from systems.audio import AudioEngine
 
@@ -15,8 +29,22 @@ class Game:
     Game - Classe principale du moteur
     """
 
-    def __init__(self) -> None:
+    def __init__(
+        self, headless: bool = False, render: bool = True, replay_path: str | None = None
+    ) -> None:
+        """
+        params:
+            - headless: bool = Rendu sans fenêtre ni carte son, dans un framebuffer hors écran
+              (contexte OpenGL autonome, EGL sans serveur X), images relues avec capture
+            - render: bool = Sans affichage uniquement : False n'ouvre aucun contexte OpenGL et
+              ne dessine rien, seule la logique des scènes avance (core.simulation)
+            - replay_path: str | None = Rejouer les entrées enregistrées dans ce fichier
+              (systems.replay) au lieu de celles du joueur
+        """
+
         self.config = config
+        self.headless = headless
+        self.render = render or not headless
 
         self.logger = logging.Logger("core.engine")
 
@@ -33,17 +61,68 @@ class Game:
         self.scene_manager = scene_manager.SceneManager()
         self.event_manager = event_manager.EventManager()
         self.audio_engine = AudioEngine()
+        self.quality = quality.QualityGovernor()
+        self.profiler = profiler.Profiler(
+            self.config.debug.profiler.enabled,
+            self.config.debug.profiler.capacity,
+            self.config.debug.profiler.directory,
+        )
+        self.timestep = timestep.FixedTimestep(
+            self.config.engine.simulation.tick_rate, self.config.engine.simulation.max_ticks
+        )
+        if headless:
+            self.quality.adaptive = False  # Même qualité à chaque exécution : images reproductibles
+
+        # Tout l'aléatoire du jeu vient de ces flux, graine fixée par start
+        self.random = random_streams.RandomStreams(self.config.engine.simulation.seed)
+
+        self.replay = replay.InputReplay(replay_path) if replay_path is not None else None
+        if self.replay is not None and self.replay.tick_rate != self.timestep.tick_rate:
+            raise ValueError(
+                f"Replay recorded at {self.replay.tick_rate} ticks/s, "
+                f"engine.simulation.tick_rate is {self.timestep.tick_rate}"
+            )
+        self.input_recorder = None
 
-        self.discordrpc = discord.DiscordRPC()
+        # Souris relevée une fois par image (ou relue), la même pour tous les ticks de l'image
+        self.mouse: tuple[int, int] = (0, 0)
+        self.focused = False
+
+        self.discordrpc = discord.DiscordRPC(enabled=not headless)
+
+        self.render_device = None  # Créé dans setup, une fois la fenêtre OpenGL ouverte
+        self.recorder = None
 
         self.running = True
 
-    def handle_events(self) -> bool:
+    def handle_events(self) -> list[pygame.Event]:
         """
-        handle_event - Envoyer les évènements au gestionnaire d'évènements
+        handle_event - Relever la souris et envoyer les évènements au gestionnaire d'évènements
+        En relecture, souris et évènements viennent de l'enregistrement ; seule la fermeture de la
+        fenêtre est gardée parmi les évènements réels.
+        Retourne les évènements envoyés
         """
 
-        return self.event_manager.handle_events()
+        if self.replay is None:
+            self.focused = bool(pygame.mouse.get_focused())
+            position = pygame.mouse.get_pos()
+            if self.render_device is not None:
+                position = self.render_device.to_render(position)
+            self.mouse = position
+            return self.event_manager.handle_events()
+
+        if any(event.type == pygame.QUIT for event in pygame.event.get()):
+            self.Quit()
+
+        if not self.replay.next_frame():
+            self.logger.success(f"Replay of {self.replay.path} finished")
+            self.running = False
+            return []
+
+        self.focused = self.replay.mouse is not None
+        if self.focused:
+            self.mouse = self.replay.mouse
+        return self.event_manager.handle_events(self.replay.events)
 
     def update_window_title(self, text="") -> str:
         """
@@ -59,6 +138,32 @@ class Game:
         pygame.display.set_caption(new_title)
         return new_title
 
+    def mouse_pos(self) -> tuple[int, int]:
+        """
+        mouse_pos - Position de la souris dans l'image rendue (résolution de rendu), relevée au
+        début de l'image
+        """
+
+        return self.mouse
+
+    def mouse_focused(self) -> bool:
+        """
+        mouse_focused - La souris était dans la fenêtre au début de l'image
+        """
+
+        return self.focused
+
+    def KeyDown(self, event: pygame.Event) -> None:
+        """
+        KeyDown - Démarrer ou arrêter l'enregistrement vidéo avec graphics.recording.key,
+        exporter la trace du profileur avec debug.profiler.key
+        """
+
+        if event.key == pygame.key.key_code(self.config.graphics.recording.key):
+            self.recorder.toggle()
+        if self.profiler.enabled and event.key == pygame.key.key_code(self.config.debug.profiler.key):
+            self.profiler.export()
+
     def Quit(self) -> None:
         """
         Quit - fonction d'évènements permettant de fermer le jeu lors de l'évènement Quit de PyGame
@@ -80,44 +185,199 @@ class Game:
 
         self.scene_manager.draw()
 
-    def run(self) -> int:
+    def setup(self) -> None:
         """
-        run - Fonction d'exécution du moteur de jeu
+        setup - Ouvrir la fenêtre (ou le framebuffer hors écran) et le contexte OpenGL
         """
 
         self.event_manager.subscribe(self, "Quit")
 
+        window_size = (self.config.graphics.window.width, self.config.graphics.window.height)
+
+        if self.headless:
+            # Pilote SDL factice : aucun serveur graphique ni carte son nécessaire
+            os.environ["SDL_VIDEODRIVER"] = "dummy"
+            os.environ["SDL_AUDIODRIVER"] = "dummy"
+
         self.logger.log("Initialising Pygame window")
         pygame.init()
-        self.audio_engine.start()
 
-        self.window = pygame.display.set_mode(
-            (self.config.graphics.window.width, self.config.graphics.window.height),
-            pygame.OPENGL | pygame.DOUBLEBUF,
+        if self.headless:
+            self.display = pygame.display.set_mode(window_size)
+        else:
+            self.audio_engine.start()
+            self.display = pygame.display.set_mode(
+                window_size, pygame.OPENGL | pygame.DOUBLEBUF
+            )
+
+        # Les scènes dessinent hors écran à la résolution de rendu, le Renderer agrandit
+        # ensuite l'image à la taille de la fenêtre sur le GPU
+        self.window = pygame.Surface(
+            (self.config.graphics.render.width, self.config.graphics.render.height), 0, 32
         )
 
+        # Contexte OpenGL unique, partagé par les Renderer de toutes les scènes
+        device_options = {
+            "resolution": self.window.get_size(),
+            "upscale": self.config.graphics.upscale,
+            "gpu_timing": self.config.debug.gpu_timing,
+            "profiler": self.profiler,
+        }
+        if not self.render:
+            self.logger.log("Rendering disabled, scenes are updated but never drawn")
+        elif self.headless:
+            self.render_device = renderer.RenderDevice.create_headless(
+                window_size, **device_options
+            )
+        else:
+            self.render_device = renderer.RenderDevice(**device_options)
+
+        if self.render:
+            recording = self.config.graphics.recording
+            self.recorder = recorder.Recorder(
+                self.render_device,
+                self.config.graphics.fps or self.timestep.tick_rate,
+                directory=recording.directory,
+                codec=recording.codec,
+                queue_size=recording.queue,
+            )
+            self.event_manager.subscribe(self, "KeyDown")
+
         self.update_window_title()
 
         pygame.mouse.set_visible(False)
 
         self.clock = pygame.time.Clock()
+        self.last_frame = time.perf_counter()
 
-        if self.config.debug.startup.scene != "default":
-            self.active_scene = self.scene_manager.set_active_scene(
-                self.config.debug.startup.scene
-            )
+    def start(self, scene: str) -> scene_manager.Scene:
+        """
+        start - Fixer la graine des flux aléatoires puis lancer la scène de départ
+        En relecture, la graine et la scène sont celles de l'enregistrement ; sinon, les entrées
+        sont enregistrées à partir d'ici si debug.replay.record est activé.
+        ---
+        params:
+            - scene: str = Scène de départ
+        """
+
+        if self.replay is not None:
+            scene = self.replay.scene
+            self.random.seed(self.replay.seed)
         else:
-            self.active_scene = self.scene_manager.set_active_scene("splash")
+            seed = self.random.seed(self.config.engine.simulation.seed)
+            if self.config.debug.replay.record:
+                self.input_recorder = replay.InputRecorder(
+                    seed, self.timestep.tick_rate, scene, self.config.debug.replay.directory
+                )
 
-        self.logger.success("Changed current active scene")
+        self.active_scene = self.scene_manager.set_active_scene(scene)
+        return self.active_scene
 
-        while self.running:
-            self.handle_events()
-            self.update()
-            self.draw()
-            pygame.display.flip()
+    def step(self, elapsed: float | None = None) -> None:
+        """
+        step - Exécuter une frame : évènements, ticks de simulation, rendu puis attente du limiteur
+        ---
+        params:
+            - elapsed: float | None = Temps écoulé imposé en secondes (simulation d'une fréquence
+              d'affichage), le temps réel par défaut
+
+        La logique avance par ticks fixes de engine.simulation.tick_rate, autant que le temps écoulé
+        depuis la frame précédente en contient ; graphics.fps ne limite que l'affichage.
+        Sans affichage, chaque frame exécute exactement un tick, sans attente.
+        """
+
+        start = time.perf_counter()
+        profiler = self.profiler
+
+        with profiler.zone("frame"):
+            with profiler.zone("handle_events"):
+                events = self.handle_events()
+
+            if self.replay is not None:
+                ticks = self.timestep.step(self.replay.ticks)
+            elif elapsed is not None:
+                ticks = self.timestep.advance(elapsed)
+            elif self.headless:
+                ticks = self.timestep.step()
+            else:
+                ticks = self.timestep.advance(start - self.last_frame)
+            self.last_frame = start
+
+            if self.input_recorder is not None:
+                self.input_recorder.record(ticks, self.mouse if self.focused else None, events)
+
+            for _ in range(ticks):
+                with profiler.zone("scene_manager.update"):
+                    self.update()
+
+            if self.render:
+                with profiler.zone("scene_manager.draw"):
+                    self.draw()
+                with profiler.zone("recorder.capture"):
+                    self.recorder.capture()  # Avant flip : le back buffer contient encore l'image
+
+            # Temps de travail de la frame, relevé avant flip : avec la synchronisation verticale,
+            # flip attend le prochain rafraîchissement de l'écran (jusqu'à 16,7 ms à 60 Hz)
+            work = time.perf_counter() - start
+
+            if not self.headless:
+                with profiler.zone("pygame.display.flip"):
+                    pygame.display.flip()
+
+        if self.headless:
+            self.audio_engine.discard_commands()
+            self.clock.tick()
+            return
+
+        # Sans l'attente de l'écran ni celle du limiteur de fps
+        self.quality.record(work)
+        with profiler.zone("clock.tick"):
             self.clock.tick(self.config.graphics.fps)
 
+    def capture(self) -> np.ndarray:
+        """
+        capture - Relire la dernière image affichée, après post-traitement
+        Retourne un tableau (hauteur, largeur, 3) en uint8, ligne du haut en premier
+        """
+
+        return self.render_device.read_frame()
+
+    def shutdown(self) -> None:
+        """
+        shutdown - Libérer le son, le contexte OpenGL et pygame
+        """
+
         self.audio_engine.stop()
+        if self.profiler.enabled:
+            self.profiler.export()
+        if self.input_recorder is not None:
+            self.input_recorder.save()
+
+        if self.render:
+            self.recorder.stop()
+            if self.render_device.timer is not None:
+                self.logger.log("GPU timing\n" + self.render_device.timer.report())
+            self.scene_manager.active.release()
+            self.scene_manager.clear_cache()
+            self.render_device.release()
         pygame.quit()
+
+    def run(self) -> int:
+        """
+        run - Fonction d'exécution du moteur de jeu
+        """
+
+        self.setup()
+
+        if self.config.debug.startup.scene != "default":
+            self.start(self.config.debug.startup.scene)
+        else:
+            self.start("splash")
+
+        self.logger.success("Changed current active scene")
+
+        while self.running:
+            self.step()
+
+        self.shutdown()
         return 0
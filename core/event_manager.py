@@ -62,19 +62,25 @@ class EventManager:
             getattr(entity, event)()
             self.logger.log(f"Sent event {event} to object {entity}")
 
-    def handle_events(self) -> bool:
+    def handle_events(self, events: list[pygame.Event] | None = None) -> list[pygame.Event]:
         """
         handle_events - Connecteur pour le gestionnaire d'évènements de PyGame
+        Retourne les évènements envoyés à au moins un abonné (les seuls à enregistrer pour une relecture)
+        ---
+        params:
+            - events: list[pygame.Event] | None = Évènements à envoyer, ceux de PyGame par défaut
         """
 
-        for event in pygame.event.get():
+        dispatched = []
+        for event in pygame.event.get() if events is None else events:
             event_name = pygame.event.event_name(event.type)
             self.logger.log(event_name, "event_name")
             if event_name in self.listeners.keys():
+                dispatched.append(event)
                 for i in self.listeners[event_name]:
                     self.logger.log(f"Sent event {event} to object {i}")
                     getattr(i, event_name)(event)
-        return True
+        return dispatched
 
     def reset(self) -> None:
         """
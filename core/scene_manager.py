@@ -46,6 +46,18 @@ class Scene(context.Context):
         if pygame.mixer.get_init() and pygame.mixer.music.get_busy():
             pygame.mixer.music.stop()
         self.runtime_timer = 0
+        self.release()
+
+    def release(self) -> None:
+        """
+        release - Rendre les ressources OpenGL de la scène (cibles hors écran de son Renderer)
+        La scène reste dans le cache, ses ressources sont recréées quand elle redevient active
+        (SceneManager.evict la retire du cache).
+        """
+
+        shaders = getattr(self, "shaders", None)
+        if shaders is not None:
+            shaders.release()
 
     def _get_ticks(self) -> float:
         """
@@ -74,12 +86,43 @@ class SceneManager(context.Context):
     SceneManager - Orchestrer l'affichage et l'exécution des objets Scene
     """
 
-    def __init__(self) -> None:
+    def __init__(self, cache_size: int = 4) -> None:
+        """
+        params:
+            - cache_size: int = Scènes gardées dans le cache, les moins récemment actives sont évincées
+        """
+
         super().__init__()
 
         self.logger = logging.Logger("core.scene_manager")
         self.active = Scene()  # Empty placeholder scene
-        self.scene_cache = {}  # Cache optionnel pour recharger plus vite
+        self.scene_cache: dict[str, Scene] = {}  # Cache optionnel, du moins au plus récemment actif
+        self.cache_size = max(1, cache_size)
+
+    def evict(self, scene_name: str) -> None:
+        """
+        evict - Retirer une scène du cache et rendre ses ressources OpenGL
+        La scène active n'est jamais évincée.
+        ---
+        params:
+            - scene_name: str = Nom de la scène dans le cache
+        """
+
+        scene = self.scene_cache.get(scene_name)
+        if scene is None or scene is self.active:
+            return
+
+        del self.scene_cache[scene_name]
+        scene.release()
+        self.logger.log(f"Evicted '{scene_name}' from cache")
+
+    def clear_cache(self) -> None:
+        """
+        clear_cache - Évincer toutes les scènes du cache sauf la scène active
+        """
+
+        for scene_name in list(self.scene_cache):
+            self.evict(scene_name)
 
     def set_active_scene(self, scene_name: str, use_cache: bool = True) -> Scene:
         """
@@ -100,7 +143,9 @@ class SceneManager(context.Context):
                 del sys.modules[module_name]
 
         if use_cache and scene_name in self.scene_cache:
-            self.active = self.scene_cache[scene_name]
+            # Replacée en fin de cache : la plus récemment active
+            self.active = self.scene_cache.pop(scene_name)
+            self.scene_cache[scene_name] = self.active
             self.logger.log(f"Loaded '{scene_name}' from cache")
         else:
             module_name = f"scenes.{scene_name}"
@@ -125,10 +170,15 @@ class SceneManager(context.Context):
                 )
 
             scene = scene_class()
+            self.scene_cache.pop(scene_name, None)  # L'ancienne instance, déjà inactive
             self.scene_cache[scene_name] = scene
             self.active = scene
             self.logger.success(f"Loaded new scene '{scene_name}'")
 
+        # Au-delà de cache_size, les scènes les moins récemment actives sont évincées
+        for cached_name in list(self.scene_cache)[: -self.cache_size]:
+            self.evict(cached_name)
+
         self.game.event_manager.reset()
 
         self.game.active_scene = self.active
@@ -0,0 +1,147 @@
+"""
+core.simulation - Parties de LevelScene jouées sans affichage, aussi vite que le CPU le permet
+
+Contenu:
+
+Classe SimulationReport
+Classe LevelSimulation
+
+Le jeu est créé sans fenêtre, sans carte son ni Discord, avec le pilote automatique de la raquette.
+Chaque step exécute un tick de simulation sans attendre le limiteur de fps ; le dessin peut être
+gardé (contexte OpenGL autonome) ou entièrement sauté. Une heure de jeu se joue en quelques
+secondes, ce qui permet d'enchaîner des milliers de niveaux pour chercher les blocages et crashs.
+
+EwoFluffy - BrokeTeam - 2025
+"""
+
+import time
+from array import array
+from dataclasses import asdict, dataclass, field
+
+import numpy as np
+
+from core.engine import Game
+from systems.config import config
+
+
+@dataclass
+class SimulationReport:
+    """
+    SimulationReport - Résultat d'une simulation
+    """
+    ticks: int
+    seconds: float  # Temps réel passé à simuler
+    levels_cleared: int
+    lives_lost: int
+    games_lost: int
+    level: int  # Niveau atteint à la fin
+    score: int
+    seed: int | None = None
+    bricks_per_level: list[int] = field(default_factory=list)  # Briques cassées, niveau par niveau
+    tick_ms: dict[str, float] = field(default_factory=dict)  # p50, p95, p99 et max d'un tick
+
+    @property
+    def ticks_per_second(self) -> float:
+        return self.ticks / self.seconds if self.seconds > 0 else 0.0
+
+    @property
+    def speedup(self) -> float:
+        """
+        speedup - Durée de jeu simulée par seconde réelle (60 ticks = une seconde de jeu à 60 Hz)
+        """
+
+        return self.ticks_per_second / config.engine.simulation.tick_rate
+
+    def as_dict(self) -> dict:
+        return {**asdict(self), "ticks_per_second": self.ticks_per_second}
+
+
+class LevelSimulation:
+    """
+    LevelSimulation - Game sans affichage sur la scène "level", raquette en pilote automatique
+    Un seul Game peut exister par processus : une simulation à la fois.
+    """
+
+    def __init__(self, draw: bool = False, seed: int | None = None, log_level: int = 2) -> None:
+        """
+        params:
+            - draw: bool = Dessiner chaque tick dans un framebuffer hors écran (contexte OpenGL
+              autonome) au lieu de sauter draw
+            - seed: int | None = Graine des flux aléatoires (vies des briques, rebonds du pilote
+              automatique), None pour une partie différente à chaque fois
+            - log_level: int = engine.log_level pendant la simulation, 2 n'affiche que les erreurs
+        """
+
+        self.game = Game(headless=True, render=draw)
+        self.game.config.engine.log_level = log_level
+        self.game.config.engine.simulation.seed = seed
+        self.game.config.debug.game.autoplay = True
+        self.game.config.debug.game.autostart = True
+        self.game.setup()
+
+        self.scene = self.game.start("level")
+        self.seed = self.game.random.value  # Graine tirée au hasard si seed est None : rejouable
+
+    def run(
+        self,
+        ticks: int | None = None,
+        levels: int | None = None,
+        seconds: float | None = None,
+    ) -> SimulationReport:
+        """
+        run - Jouer jusqu'à la première limite atteinte et retourner le bilan de cet appel
+        ---
+        params:
+            - ticks: int | None = Nombre de ticks de simulation
+            - levels: int | None = Nombre de niveaux terminés
+            - seconds: float | None = Temps réel passé à simuler
+        """
+
+        if ticks is None and levels is None and seconds is None:
+            raise ValueError("LevelSimulation.run needs at least one of ticks, levels or seconds")
+
+        scene = self.scene
+        cleared, lost, games_lost = scene.levels_cleared, scene.lives_lost, scene.games_lost
+        first_level = len(scene.bricks_broken) - 1
+
+        durations = array("d")  # Compact : 8 octets par tick, même pour des heures de jeu
+        start = tick_start = time.perf_counter()
+        deadline = start + seconds if seconds is not None else None
+        played = 0
+
+        while self.game.running:
+            if ticks is not None and played >= ticks:
+                break
+            if levels is not None and scene.levels_cleared - cleared >= levels:
+                break
+            if deadline is not None and tick_start >= deadline:
+                break
+
+            self.game.step()
+            played += 1
+
+            tick_end = time.perf_counter()
+            durations.append(tick_end - tick_start)
+            tick_start = tick_end
+
+        tick_ms = {}
+        if played:
+            values = np.frombuffer(durations, dtype=np.float64) * 1000
+            p50, p95, p99 = np.percentile(values, (50, 95, 99))
+            tick_ms = {"p50": float(p50), "p95": float(p95), "p99": float(p99), "max": float(values.max())}
+
+        return SimulationReport(
+            ticks=played,
+            seconds=time.perf_counter() - start,
+            levels_cleared=scene.levels_cleared - cleared,
+            lives_lost=scene.lives_lost - lost,
+            games_lost=scene.games_lost - games_lost,
+            level=scene.level,
+            score=scene.score,
+            seed=self.seed,
+            bricks_per_level=scene.bricks_broken[first_level:],
+            tick_ms=tick_ms,
+        )
+
+    def close(self) -> None:
+        self.game.shutdown()
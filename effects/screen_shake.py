@@ -1,5 +1,3 @@
-import random
-
 from core.context import Context
 from systems.logging import Logger
 from systems.config import config
@@ -17,6 +15,8 @@ class ScreenShake(Context):
 
         super().__init__()
 
+        self.random = self.game.random.stream("shake")
+
     def start(
         self,
         duration: int = config.graphics.shake.duration,
@@ -24,18 +24,21 @@ class ScreenShake(Context):
     ) -> None:
         """Start a screen shake effect"""
         self.logger.log(
-            f"Screen shake triggered with {duration=} frames and {magnitude=}"
+            f"Screen shake triggered with {duration=} ticks and {magnitude=}"
         )
         self.duration = duration
         self.magnitude = magnitude
 
-    def get_offset(self) -> tuple:
-        """Get current shake offset and update duration"""
+    def update(self) -> None:
+        """Pick a new offset and count down the duration, once per simulation tick"""
         if self.duration > 0:
-            self.offset[0] = random.randint(-self.magnitude, self.magnitude)
-            self.offset[1] = random.randint(-self.magnitude, self.magnitude)
+            self.offset[0] = self.random.randint(-self.magnitude, self.magnitude)
+            self.offset[1] = self.random.randint(-self.magnitude, self.magnitude)
             self.duration -= 1
         else:
             self.offset[0] = 0
             self.offset[1] = 0
+
+    def get_offset(self) -> tuple:
+        """Get current shake offset"""
         return tuple(self.offset)
@@ -4,6 +4,8 @@ main - Entry point of the engine
 EwoFluffy - BrokeTeam - 2025
 """
 
+import sys
+
 from core.engine import Game
 from systems.logging import Logger
 
@@ -13,7 +15,8 @@ logger: Logger = Logger("main")
 def main() -> None:
     logger.highlight("Welcome to BrokeOut")
     try:
-        Game().run()
+        replay = sys.argv[sys.argv.index("--replay") + 1] if "--replay" in sys.argv else None
+        Game(headless="--headless" in sys.argv, replay_path=replay).run()
     except KeyboardInterrupt:
         pass
     logger.highlight("Have a nive day :D")
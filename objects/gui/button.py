@@ -26,7 +26,7 @@ class Button(prototype.Entity):
             (self.pos[0] - (self.size[0] // 2), self.pos[1] - (self.size[1] // 2)),
             self.size,
         )
-        return button.collidepoint(pygame.mouse.get_pos())
+        return button.collidepoint(self.game.mouse_pos())
 
     def MouseButtonDown(self, event: pygame.Event) -> None:
         if self.get_collided() and event.button == 1:
@@ -45,7 +45,7 @@ class Button(prototype.Entity):
         bg_color: tuple | list = (173, 95, 125),
         fg_color: tuple | list = (246, 172, 201),
     ) -> None:
-        mouse = pygame.mouse.get_pos()
+        mouse = self.game.mouse_pos()
         button = pygame.Rect(self.pos, self.size)
         self.text_rect = self.font.get_rect(self.text, size=21)
         button.center = self.text_rect.center = self.pos
@@ -4,12 +4,17 @@ from objects.prototype import Entity
 class HintElement(Entity):
     def __init__(self) -> None:
         self.timer: int = 120
+        self.previous_timer: int = self.timer
         self.hint_text: str = "Click to start game"
         self.size: int = 24
 
         super().__init__()
 
+    def snapshot(self) -> None:
+        self.previous_timer = self.timer
+
     def update(self) -> None:
+        self.snapshot()
         self.timer -= 1
 
     def draw(self) -> None:
@@ -28,13 +33,13 @@ class HintElement(Entity):
                     self.scene.color[0],
                     self.scene.color[1],
                     self.scene.color[2],
-                    self.timer,
+                    max(0, int(self.game.timestep.lerp(self.previous_timer, self.timer))),
                 ),
                 size=self.size,
             )
 
     def show_hint(self, text: str, duration: int = 120, size: int = 24) -> None:
         """Display a hint message (Subtitle-like)"""
-        self.timer = duration
+        self.timer = self.previous_timer = duration
         self.hint_text = text
         self.size = size
@@ -12,19 +12,20 @@ class Mouse(prototype.Entity):
         self.i = 1
         super().__init__()
 
-    def draw(self) -> None:
-        if pygame.mouse.get_focused():
-            mousex, mousey = pygame.mouse.get_pos()
+    def draw(self, surface: pygame.Surface | None = None) -> None:
+        surface = surface if surface is not None else self.game.window
+        if self.game.mouse_focused():
+            mousex, mousey = self.game.mouse_pos()
             if self.game.config.debug.precise_mouse:
                 pygame.draw.rect(
-                    self.game.window,
+                    surface,
                     [255, 0, 0],
                     (mousex, 0, 1, self.game.config.graphics.render.height),
                 )
                 pygame.draw.rect(
-                    self.game.window,
+                    surface,
                     [255, 0, 0],
                     (0, mousey, self.game.config.graphics.render.width, 1),
                 )
 
-            self.game.window.blit(self.cursor, (mousex + 8, mousey + 8 * self.i))
+            surface.blit(self.cursor, (mousex + 8, mousey + 8 * self.i))
@@ -1,8 +1,6 @@
-import random
 import math
 
 import numpy as np
-import pygame
 
 from objects.prototype import Entity
 
@@ -14,9 +12,11 @@ class Ball(Entity):
         super().__init__()
 
         self.pos: list = [500, 500]
+        self.previous_pos: list = list(self.pos)  # Last tick, drawn frames are interpolated
         self.velocity: list = [0, 0]
 
         self.speed: int = self.game.config.game.ball.speed
+        self.random = self.game.random.stream("ball")  # Autoplay bounce angles
 
         self.on_player: bool = True
 
@@ -33,20 +33,22 @@ class Ball(Entity):
 
     def draw(self) -> None:
         """Draw ball and trail"""
+        # Between the last two simulation ticks when frames are drawn faster than ticks
         current_pos = (
-            self.pos[0] - self.game.config.game.ball.radius,
-            self.pos[1] - self.game.config.game.ball.radius,
+            self.game.timestep.lerp(self.previous_pos[0], self.pos[0])
+            - self.game.config.game.ball.radius,
+            self.game.timestep.lerp(self.previous_pos[1], self.pos[1])
+            - self.game.config.game.ball.radius,
         )
-        self.trail.insert(0, current_pos)
 
-        if len(self.trail) > self.game.config.graphics.ball.trail_length:
-            self.trail.pop()
+        trail_length = self.game.quality.trail_length
 
         # Draw trail with gradient effect generated from numpy (What did I do that ? -Ewo)
-        gradient = np.arange(0, 255, self.game.config.graphics.ball.trail_length)
+        gradient = np.arange(0, 255, max(1, 255 // (trail_length + 2)))
         if self.scene.game_started:
-            for i, pos in enumerate(reversed(self.trail)):
-                pygame.draw.circle(
+            # The trail is only shortened by update: skip what a downgrade left over since the last tick
+            for i, pos in enumerate(reversed(self.trail[:trail_length])):
+                self.scene.shaders.draw_circle(
                     self.scene.surface,
                     (
                         self.scene.color[0],
@@ -56,16 +58,14 @@ class Ball(Entity):
                     ),
                     pos,
                     self.game.config.game.ball.radius,
-                    0,
                 )
 
         # Draw actual ball
-        pygame.draw.circle(
+        self.scene.shaders.draw_circle(
             self.scene.surface,
             self.scene.color,
             current_pos,
             self.game.config.game.ball.radius,
-            0,
         )
 
     def bounce_off_player(self) -> None:
@@ -75,8 +75,24 @@ class Ball(Entity):
         angle: int = 90 + 80 * diff / total_length
         self.set_velocity_by_angle(angle)
 
+    def snapshot(self) -> None:
+        self.previous_pos = list(self.pos)
+
     def update(self) -> None:  # type: ignore
         """Update ball position and handle collisions"""
+        self.snapshot()
+
+        # One trail point per tick: same trail duration at any frame rate
+        self.trail.insert(
+            0,
+            (
+                self.pos[0] - self.game.config.game.ball.radius,
+                self.pos[1] - self.game.config.game.ball.radius,
+            ),
+        )
+        # Shorter when the quality governor lowers the quality level
+        del self.trail[self.game.quality.trail_length:]
+
         if self.on_player:
             self.pos = [
                 self.scene.player.pos[0] + self.game.config.game.ball.radius,
@@ -91,7 +107,7 @@ class Ball(Entity):
                     self.bounce_off_player()
                 else:
                     self.velocity = [
-                        self.speed * math.cos(math.radians(random.randint(0, 180))),
+                        self.speed * math.cos(math.radians(self.random.randint(0, 180))),
                         -self.velocity[1],
                     ]
 
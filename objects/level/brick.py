@@ -1,4 +1,3 @@
-import random
 import math
 
 import pygame
@@ -18,11 +17,17 @@ class Brick(Entity):
         self.pos: list = pos
         self.size: list = [50, 30]
 
-        self.life: int = random.randint(1, 3)
+        # Farthest ball center distance (per axis) that can still touch the brick
+        radius = self.game.config.game.ball.radius
+        self.reach: tuple = (self.size[0] / 2 + radius, self.size[1] / 2 + radius)
+
+        bricks = self.game.random.stream("bricks")
+
+        self.life: int = bricks.randint(1, 3)
         self.text: str = ""
 
         # Random color variation
-        divisor: int = random.randint(2, 5)
+        divisor: int = bricks.randint(2, 5)
         self.color: list = [c // (divisor // 2) for c in self.scene.color]
 
     def is_alive(self) -> bool:
@@ -55,11 +60,11 @@ class Brick(Entity):
 
     def draw(self) -> None:
         """Draw the brick"""
-        pygame.draw.rect(self.scene.surface, self.color, self.get_rect(), 0)
+        self.scene.shaders.draw_rect(self.scene.surface, self.color, self.get_rect())
         self.draw_text()
 
     def draw_skeleton(self) -> None:
-        pygame.draw.rect(self.scene.surface, self.color + [25], self.get_rect(True), 0)
+        self.scene.shaders.draw_rect(self.scene.surface, self.color + [25], self.get_rect(True))
 
     def handle_hit(self) -> None:
         self.life -= 1
@@ -72,6 +77,13 @@ class Brick(Entity):
         """Check and handle collision with ball"""
         ball = self.scene.ball
 
+        # Cheap rejection first: most bricks are far from the ball on every tick
+        if (
+            abs(ball.pos[0] - self.pos[0]) >= self.reach[0]
+            or abs(ball.pos[1] - self.pos[1]) >= self.reach[1]
+        ):
+            return False
+
         rect = pygame.Rect(
             self.pos[0] - self.size[0] / 2,
             self.pos[1] - self.size[1] / 2,
@@ -101,6 +113,8 @@ class Brick(Entity):
                 )  # overlap_y value but dy sign
 
             self.handle_hit()
+            if not self.is_alive():
+                self.scene.bricks_broken[-1] += 1
 
             self.scene.screen_shake.start(duration=3, magnitude=3)
             self.scene.shaders.set_curvature(0.41)
@@ -18,11 +18,13 @@ class Player(Entity, GameContext):
             * self.game.config.game.ball.radius
         )
         self.width: int = self.base_width
+        self.previous_width: float = self.width
 
         self.pos: list[int] = [
             (self.scene.bounds["x_min"] - self.scene.bounds["x_max"]) / 2,
             self.scene.bounds["y_max"] - self.game.config.game.ball.radius - 5,
         ]
+        self.previous_pos: list[int] = list(self.pos)  # Last tick, drawn frames are interpolated
 
         self.autoplay: bool = self.game.config.debug.game.autoplay
 
@@ -37,8 +39,14 @@ class Player(Entity, GameContext):
         )
         return vertical and horizontal
 
+    def snapshot(self) -> None:
+        self.previous_pos = list(self.pos)
+        self.previous_width = self.width
+
     def update(self) -> None:
-        x = pygame.mouse.get_pos()[0] if not self.autoplay else self.scene.ball.pos[0]
+        self.snapshot()
+
+        x = self.game.mouse_pos()[0] if not self.autoplay else self.scene.ball.pos[0]
         if x - self.width / 2 < self.scene.bounds["x_min"]:
             self.pos[0] = self.scene.bounds["x_min"] + self.width / 2
         elif x + self.width / 2 > self.scene.bounds["x_max"]:
@@ -50,10 +58,12 @@ class Player(Entity, GameContext):
             self.width = self.width - 0.1
 
     def draw(self) -> None:
+        x = self.game.timestep.lerp(self.previous_pos[0], self.pos[0])
+        width = self.game.timestep.lerp(self.previous_width, self.width)
         rect = pygame.Rect(
-            int(self.pos[0] - self.width / 2 + self.scene.offset[0]),
+            int(x - width / 2 + self.scene.offset[0]),
             int(self.pos[1] - self.game.config.game.ball.radius + self.scene.offset[1]),
-            self.width,
+            width,
             2 * self.game.config.game.ball.radius,
         )
-        pygame.draw.rect(self.scene.surface, self.scene.color, rect, 0)
+        self.scene.shaders.draw_rect(self.scene.surface, self.scene.color, rect)
@@ -25,16 +25,21 @@ class StatsElement(prototype.Entity):
 
     def draw(self):
         score_text = f"SCORE: {self.displayed_score} | LIFES: {self.scene.lives}"
-        self.font.render_to(self.game.window, (31, 13), score_text, self.scene.color)
+        self.font.render_to(self.scene.hud, (31, 13), score_text, self.scene.color)
 
 
 class ProgressBar(prototype.Entity):
     def __init__(self) -> None:
         self.progress = 0
+        self.previous_progress = 0
 
         super().__init__()
 
+    def snapshot(self) -> None:
+        self.previous_progress = self.progress
+
     def update(self):
+        self.snapshot()
         target = int(
             (1 - (len(self.scene.brick_group.bricks) / self.scene.level_size))
             * self.game.config.graphics.render.width
@@ -44,5 +49,6 @@ class ProgressBar(prototype.Entity):
         self.progress += (target - self.progress) * speed
 
     def draw(self):
-        progress_bar = pygame.Rect(0, 0, self.progress, 3)
-        pygame.draw.rect(self.game.window, self.scene.color, progress_bar, 0)
+        progress = self.game.timestep.lerp(self.previous_progress, self.progress)
+        progress_bar = pygame.Rect(0, 0, progress, 3)
+        pygame.draw.rect(self.scene.hud, self.scene.color, progress_bar, 0)
@@ -6,6 +6,10 @@ class Entity(GameContext):
         self.game = GameContext.get_game()
         self.scene = self.game.active_scene
 
+    def snapshot(self) -> None:
+        """Keep the state drawn frames interpolate from, at the start of each tick"""
+        return
+
     def update(self, **args) -> None:
         return
 
@@ -1,5 +1,3 @@
-import random
-
 import numpy as np
 import pygame
 import pygame.freetype
@@ -10,7 +8,6 @@ from objects.gui import hint, mouse, button
 from objects.level import player, ball, brick
 from objects.level.stats import StatsElement, ProgressBar
 from effects import screen_shake
-from effects.gaussian_blur import gaussian_blur
 from assets.levels.levels import levels
 
 
@@ -27,6 +24,12 @@ class LevelScene(Scene):
         self.level: int = 1
         self.score: int = 0
 
+        # Compteurs de la session, lus par core.simulation
+        self.levels_cleared: int = 0
+        self.lives_lost: int = 0
+        self.games_lost: int = 0
+        self.bricks_broken: list[int] = [0]  # Une entrée par niveau joué, la dernière est en cours
+
         self.levels: list[list] = levels
         self.level_size = np.count_nonzero(
             self.levels[(self.level - 1) % len(self.levels)]
@@ -50,7 +53,7 @@ class LevelScene(Scene):
 
         self.pause: bool = False
 
-        self.game.audio_engine.load_sound("level_theme_0", "music/audio0.wav")
+        self.game.audio_engine.load_stream("level_theme_0", "music/audio0.wav")
 
     def run(self) -> None:
         self.game.update_window_title("Classic Game")
@@ -67,7 +70,18 @@ class LevelScene(Scene):
 
         self.stats = [StatsElement(), ProgressBar(), hint.HintElement()]
 
-        self.shaders = renderer.Renderer("crt")
+        self.shaders = renderer.Renderer(
+            passes=[
+                *renderer.blur_passes(self.game.config.graphics.post.blur_scale),
+                renderer.PostPass("crt"),
+                renderer.PostPass(
+                    "vignette",
+                    enabled=self.game.config.graphics.post.vignette > 0,
+                    uniforms={"strength": self.game.config.graphics.post.vignette},
+                ),
+            ],
+            owner="scene:level",
+        )
 
         pygame.mouse.set_visible(False)
 
@@ -150,8 +164,11 @@ class LevelScene(Scene):
 
     def trigger_next_level(self) -> None:
         self.level += 1
+        self.levels_cleared += 1
+        self.bricks_broken.append(0)
 
-        self.color = [random.randint(150, 255) for _ in range(3)]
+        colors = self.game.random.stream("level")
+        self.color = [colors.randint(150, 255) for _ in range(3)]
         self.skeleton = brick.BricksSkeleton()
         self.brick_group.generate_bricks()
 
@@ -169,14 +186,17 @@ class LevelScene(Scene):
         )
 
     def trigger_lose(self) -> None:
+        self.lives_lost += 1
         if self.lives != 1:
-            self.stats[2].show_hint(random.choice(self.LoseMessages), size=24)
+            self.stats[2].show_hint(self.game.random.stream("messages").choice(self.LoseMessages), size=24)
             self.lives -= 1
             self.logger.log(
                 f"Player lose this round, now having {self.lives} more lives"
             )
         else:
             self.logger.log("Player lose the game, resetting all states")
+            self.games_lost += 1
+            self.bricks_broken.append(0)
             self.reset_game()
         self.ball.on_player = True
 
@@ -189,14 +209,17 @@ class LevelScene(Scene):
         self.shaders.update_values = not self.shaders.update_values
         self.shaders.set_curvature(0)
 
+    def launch_ball(self) -> None:
+        self.ball.on_player = False
+        self.ball.set_velocity_by_angle(60)
+
+        if not self.game_started:
+            self.level = 1
+            self.game_started = True
+
     def MouseButtonDown(self, event: pygame.Event) -> None:
         if event.button == 1 and self.ball.on_player and not self.pause:
-            self.ball.on_player = False
-            self.ball.set_velocity_by_angle(60)
-
-            if not self.game_started:
-                self.level = 1
-                self.game_started = True
+            self.launch_ball()
 
     def KeyDown(self, event: pygame.Event) -> None:
         if event.key == pygame.K_ESCAPE:
@@ -207,45 +230,65 @@ class LevelScene(Scene):
     def update(self) -> None:
         # self.color = [random.randint(150,255) for i in range(3)]
 
+        self.screen_shake.update()
+
         if self.blur_radius < 10 and self.pause:
             self.blur_radius += (10 - self.blur_radius) * 0.3
 
         if not self.pause:
+            # Le pilote automatique relance aussi la balle après une vie perdue
+            if self.player.autoplay and self.ball.on_player:
+                self.launch_ball()
+
             [i.update() for i in self.stats]
-            self.brick_group.update()
+            with self.game.profiler.zone("bricks.update"):
+                self.brick_group.update()
             self.player.update()
-            self.ball.update()
+            with self.game.profiler.zone("ball.update"):
+                self.ball.update()
         else:
+            # Rien n'avance en pause : les images restent sur le dernier tick au lieu d'osciller
+            for entity in [*self.stats, self.player, self.ball]:
+                entity.snapshot()
             for i in self.pause_buttons:
                 self.pause_buttons[i].update()
 
     def draw(self) -> None:
         self.offset = self.screen_shake.get_offset()
 
-        self.game.window.fill([c // 3 for c in self.color])
+        # Les briques, la raquette et la balle peuvent être dessinées sur le GPU :
+        # tout le reste va alors dans une surface transparente posée par dessus
+        batching = self.shaders.begin_frame(self.background_color(), self.offset)
+
+        if batching:
+            self.hud = pygame.Surface(self.game.window.get_size(), pygame.SRCALPHA)
+        else:
+            self.hud = self.game.window
+            self.game.window.fill([c // 3 for c in self.color])
 
         self.surface = pygame.Surface(self.game.window.get_size(), pygame.SRCALPHA)
 
-        self.skeleton.draw()
-        self.brick_group.draw()
-        self.player.draw()
-        self.ball.draw()
+        with self.game.profiler.zone("entities.draw"):
+            self.skeleton.draw()
+            self.brick_group.draw()
+            self.player.draw()
+            self.ball.draw()
 
-        [element.draw() for element in self.stats]
+        with self.game.profiler.zone("hud.draw"):
+            [element.draw() for element in self.stats]
 
-        self.game.window.blit(self.surface, self.offset)
+        self.hud.blit(self.surface, self.offset)
 
+        # Le menu pause est posé après le flou (étapes under_ui de la chaîne), il reste net
+        pause_surface = None
         if self.pause:
             pause_surface = pygame.Surface(self.game.window.get_size(), pygame.SRCALPHA)
 
-            self.game.window = gaussian_blur(self.game.window, self.blur_radius)
-
             # Menu pause code
             for i in self.pause_buttons:
                 self.pause_buttons[i].draw(pause_surface)
 
-            self.game.window.blit(pause_surface)
-
-            mouse.Mouse().draw()
+            mouse.Mouse().draw(pause_surface)
 
-        self.shaders.render_frame()
+        self.shaders.set_pass("blur", self.pause, radius=self.blur_radius)
+        self.shaders.render_frame(self.hud if batching else None, pause_surface)
@@ -1,6 +1,5 @@
 # type: ignore
 
-import random
 import webbrowser
 
 import pygame
@@ -29,14 +28,24 @@ class MenuScene(Scene):
 
         self.credits: bool = False
 
-        self.game.audio_engine.load_sound("menu_theme", "music/audio_menu.wav")
+        self.game.audio_engine.load_stream("menu_theme", "music/audio_menu.wav")
 
     def run(self) -> None:
         self.game.update_window_title("Main Menu")
 
         self.game.event_manager.subscribe(self, "KeyDown")
 
-        self.shaders = renderer.Renderer("crt")
+        self.shaders = renderer.Renderer(
+            passes=[
+                renderer.PostPass("crt"),
+                renderer.PostPass(
+                    "vignette",
+                    enabled=self.game.config.graphics.post.vignette > 0,
+                    uniforms={"strength": self.game.config.graphics.post.vignette},
+                ),
+            ],
+            owner="scene:menu",
+        )
 
         self.mouse = mouse.Mouse()
 
@@ -129,7 +138,7 @@ class MenuScene(Scene):
 
     def CreditsButtonClick(self) -> None:
         self.scroll = 0
-        self.egg = random.randint(0, 10) == 5 or self.game.config.debug.misc.easter_egg
+        self.egg = self.game.random.stream("menu").randint(0, 10) == 5 or self.game.config.debug.misc.easter_egg
         self.logger.log(f"Switching to credits with easter egg = {self.egg}")
         self.credits = True
 
@@ -145,14 +154,16 @@ class MenuScene(Scene):
             self.game.scene_manager.set_active_scene("menu", False)
 
     def compute_surface_offset(self) -> None:
-        if pygame.mouse.get_focused():
-            self.mousex, self.mousey = pygame.mouse.get_pos()
+        if self.game.mouse_focused():
+            self.mousex, self.mousey = self.game.mouse_pos()
         else:
             center_x, center_y = self.game.window.get_rect().center
             self.mousex += (center_x - self.mousex) * 0.1
             self.mousey += (center_y - self.mousey) * 0.1
 
     def update(self) -> None:
+        self.shake.update()
+
         if self._get_ticks() % 26 == 0 and self.game.config.debug.shaders:
             self.shaders.set_curvature(0.4)
 
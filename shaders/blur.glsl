@@ -0,0 +1,27 @@
+#version 330 core
+
+// Flou gaussien séparable à 9 échantillons, appliqué une fois horizontalement puis verticalement.
+// Les échantillons sont espacés selon le rayon : le coût est le même quel que soit le flou.
+
+uniform sampler2D iChannel0;
+uniform vec2 iResolution; // Résolution de rendu, le rayon est exprimé dans ces pixels
+
+uniform vec2 direction; // (1, 0) pour la passe horizontale, (0, 1) pour la verticale
+uniform float radius;
+
+in vec2 v_texcoord;
+out vec4 fragColor;
+
+const float weights[5] = float[](0.2270270, 0.1945946, 0.1216216, 0.0540541, 0.0162162);
+
+void main() {
+    vec2 step = direction * (radius / 4.0) / iResolution;
+
+    vec4 color = texture(iChannel0, v_texcoord) * weights[0];
+    for (int i = 1; i < 5; i++) {
+        color += texture(iChannel0, v_texcoord + step * float(i)) * weights[i];
+        color += texture(iChannel0, v_texcoord - step * float(i)) * weights[i];
+    }
+
+    fragColor = vec4(color.rgb, 1.0);
+}
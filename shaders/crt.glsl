@@ -33,8 +33,11 @@ void mainImage(out vec4 fragColor, in vec2 fragCoord)
     }
 }
 
+varying vec2 v_texcoord;
+
 void main() {
     vec4 color;
-    mainImage(color, gl_FragCoord.xy);
+    // Coordonnées issues du vertex shader (axe vertical déjà inversé) plutôt que gl_FragCoord
+    mainImage(color, v_texcoord * iResolution.xy);
     gl_FragColor = color;
 }
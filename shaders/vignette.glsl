@@ -0,0 +1,18 @@
+#version 330 core
+
+// Assombrissement progressif des bords de l'écran
+
+uniform sampler2D iChannel0;
+
+uniform float strength; // 0.0 : aucun effet, 1.0 : coins noirs
+
+in vec2 v_texcoord;
+out vec4 fragColor;
+
+void main() {
+    vec2 centered = v_texcoord - 0.5;
+    float falloff = dot(centered, centered) * 2.0; // 0 au centre, 1 dans les coins
+
+    vec3 color = texture(iChannel0, v_texcoord).rgb;
+    fragColor = vec4(color * (1.0 - strength * falloff), 1.0);
+}
@@ -4,243 +4,629 @@ audio - Moteur audio de BrokeEngine
 EwoFluffy - Team Broke - 2025
 """
 
-from queue import Queue
-import threading
+import time
 
 from dataclasses import dataclass
 from typing import Dict
 
-import sounddevice as sd
 import numpy as np
 import wave
 
+from systems.audio_cache import STORAGE_SCALES, SoundCache, to_storage
+from systems.audio_effects import create_backend
+from systems.audio_stream import StreamSource, resolve_path
 from systems.logging import Logger
 from systems.config import config
 
 
-class Reverb:
-    """
-    Reverb - Réverbe basée sur un modèle Schroeder
-    Volontairement simplifié, mais suffisant pour donner de l'immersion.
+class CommandRing:
     """
+    CommandRing - File de commandes bornée entre un producteur (le jeu) et un consommateur (le callback)
 
-    def __init__(self, sample_rate: int):
-        self.sample_rate = sample_rate
-        self.delay = int(0.03 * sample_rate)
-        self.buffer = np.zeros(self.delay, dtype=np.float32)
-        self.index = 0
+    Aucun verrou : seul le producteur avance tail et seul le consommateur avance head. Sous le GIL,
+    l'écriture d'un élément de liste ou d'un attribut est atomique, une commande est donc toujours
+    complètement écrite avant d'être publiée par tail.
+    """
 
-    def process(self, stereo: np.ndarray, amount: float):
-        if amount <= 0.0:
-            return stereo
+    def __init__(self, capacity: int = 256) -> None:
+        self.capacity = capacity
+        self.slots: list[tuple | None] = [None] * capacity
+        self.head = 0  # Prochaine commande à lire
+        self.tail = 0  # Prochain emplacement à écrire
+        self.dropped = 0
 
-        mono = stereo.mean(axis=0)
-        out = np.zeros_like(stereo)
+    def __len__(self) -> int:
+        return self.tail - self.head
 
-        for i in range(mono.size):
-            delayed = self.buffer[self.index]
-            self.buffer[self.index] = mono[i] + delayed * 0.6
-            mix = mono[i] * (1 - amount) + delayed * amount
-            out[0, i] = mix
-            out[1, i] = mix
-            self.index = (self.index + 1) % self.delay
+    def push(self, command: tuple) -> bool:
+        """
+        push - Publier une commande (producteur uniquement), False si la file est pleine
+        """
 
-        return out
+        if self.tail - self.head >= self.capacity:
+            self.dropped += 1
+            return False
 
+        self.slots[self.tail % self.capacity] = command
+        self.tail += 1
+        return True
 
-class Distortion:
-    """
-    Distortion - Simule vaguement (À retravailler) une saturation douce
-    en utilisant une fonction tanh.
-    """
+    def pop(self) -> tuple | None:
+        """
+        pop - Retirer la plus ancienne commande (consommateur uniquement), None si la file est vide
+        """
 
-    def process(self, stereo: np.ndarray, drive_db: float):
-        if drive_db <= 0.0:
-            return stereo
+        if self.head == self.tail:
+            return None
 
-        gain = 10 ** (drive_db / 20)
-        boosted = stereo * gain
-        return np.tanh(boosted)
+        index = self.head % self.capacity
+        command = self.slots[index]
+        self.slots[index] = None
+        self.head += 1
+        return command
 
 
-class Chorus:
+class VoiceTable:
     """
-    Chorus - Chorus simple utilisant un délai modulé.
-    Inspiré d'un modèle de chorus analogiques de base : LFO (Oscillateur basses fréquences) → délai → mix.
+    VoiceTable - Table compacte des voix en cours de lecture
+    Chaque voix référence en lecture seule un son du cache (ou un flux StreamSource), le gain et la
+    conversion depuis le format de stockage sont appliqués au bloc mixé pendant le callback :
+    démarrer un son ne copie jamais la piste.
+    La table appartient au callback audio, le jeu la modifie uniquement par des commandes.
     """
 
-    def __init__(self, sample_rate: int):
-        self.sr = sample_rate
-        self.max_delay = int(0.02 * sample_rate)
-        self.buffer_l = np.zeros(self.max_delay, dtype=np.float32)
-        self.buffer_r = np.zeros(self.max_delay, dtype=np.float32)
-        self.index = 0
-        self.phase = 0.0
-
-    def process(self, stereo: np.ndarray, amount: float):
-        if amount <= 0.0:
-            return stereo
-
-        out = np.zeros_like(stereo)
-        rate = 0.3
-
-        for i in range(stereo.shape[1]):
-            self.buffer_l[self.index] = stereo[0, i]
-            self.buffer_r[self.index] = stereo[1, i]
-
-            mod = (np.sin(self.phase) + 1) * 0.5
-            delay = int(mod * self.max_delay)
+    def __init__(self, size: int, block_size: int):
+        self.size = size
+        self.data: list[np.ndarray | StreamSource | None] = [None] * size
+        self.handle = np.zeros(size, dtype=np.int64)  # Identifiant donné au jeu par play_sound
+        self.position = np.zeros(size, dtype=np.int64)
+        self.gain = np.zeros(size, dtype=np.float32)
+        self.scale = np.ones(size, dtype=np.float32)  # Ramène les échantillons int16 entre -1 et 1
+        self.loop = np.zeros(size, dtype=bool)
+        self.active = np.zeros(size, dtype=bool)
+
+        self.scratch = np.zeros(block_size, dtype=np.float32)
+
+        self.stream_underruns = 0  # Blocs de flux incomplets (décodage en retard)
+
+    def allocate(
+        self, handle: int, data: np.ndarray | StreamSource, gain: float, loop: bool
+    ) -> int | None:
+        """
+        allocate - Occuper un emplacement libre avec une nouvelle voix
+        ---
+        params:
+            - handle: int = Identifiant de la voix côté jeu
+            - data: np.ndarray | StreamSource = Son partagé (2, frames) ou flux à lire
+            - gain: float = Volume de la voix
+            - loop: bool = Reprendre au début à la fin du son
+        Retourne l'emplacement de la voix, ou None si la table est pleine
+        """
+
+        for slot in range(self.size):
+            if not self.active[slot]:
+                self.handle[slot] = handle
+                self.data[slot] = data
+                self.position[slot] = 0
+                self.gain[slot] = gain
+                self.scale[slot] = (
+                    1.0 if isinstance(data, StreamSource) else STORAGE_SCALES[data.dtype.name]
+                )
+                self.loop[slot] = loop
+                self.active[slot] = True
+                return slot
+        return None
+
+    def find(self, handle: int) -> int | None:
+        """
+        find - Retrouver l'emplacement d'une voix active à partir de son identifiant
+        """
+
+        for slot in range(self.size):
+            if self.active[slot] and self.handle[slot] == handle:
+                return slot
+        return None
+
+    def release(self, slot: int) -> None:
+        """
+        release - Libérer l'emplacement d'une voix
+        """
+
+        if isinstance(self.data[slot], StreamSource):
+            self.data[slot].close()
+
+        self.active[slot] = False
+        self.data[slot] = None
+
+    def clear(self) -> None:
+        """
+        clear - Libérer toutes les voix
+        """
+
+        for slot in range(self.size):
+            self.release(slot)
+
+    def mix(self, mixed: np.ndarray) -> int:
+        """
+        mix - Ajouter toutes les voix actives au bus de mixage
+        ---
+        params:
+            - mixed: np.ndarray = Bus de mixage (2, frames)
+        Retourne le nombre de voix qui ont été mixées dans ce bloc
+        """
+
+        frames = mixed.shape[1]
+        if self.scratch.size < frames:
+            self.scratch = np.zeros(frames, dtype=np.float32)
+
+        mixed_voices = 0
+
+        for slot in range(self.size):
+            if not self.active[slot]:
+                continue
+
+            data = self.data[slot]
+            gain = float(self.gain[slot])
+
+            # Les flux gèrent eux-mêmes leur position et leur boucle
+            if isinstance(data, StreamSource):
+                underruns = data.underruns
+                mixed_voices += data.mix(mixed, gain, self.scratch) > 0
+                self.stream_underruns += data.underruns - underruns
+                if data.drained:
+                    self.release(slot)
+                continue
+
+            gain *= float(self.scale[slot])
+            length = data.shape[1]
+            position = int(self.position[slot])
+            loop = bool(self.loop[slot])
+            written = 0
+
+            while written < frames and length > 0:
+                if position >= length:
+                    if not loop:
+                        break
+                    position = 0
+
+                count = min(frames - written, length - position)
+                scratch = self.scratch[:count]
+                for channel in range(2):
+                    # Copie avec conversion vers float32 (sans tampon temporaire), puis gain sur place
+                    scratch[...] = data[channel, position:position + count]
+                    scratch *= gain
+                    mixed[channel, written:written + count] += scratch
+
+                position += count
+                written += count
+
+            mixed_voices += written > 0
+
+            if position >= length and not loop:
+                self.release(slot)
+            else:
+                self.position[slot] = position
+
+        return mixed_voices
 
-            read = (self.index - delay) % self.max_delay
-            out[0, i] = (stereo[0, i] + self.buffer_l[read] * amount) / 2
-            out[1, i] = (stereo[1, i] + self.buffer_r[read] * amount) / 2
 
-            self.index = (self.index + 1) % self.max_delay
-            self.phase += (2 * np.pi * rate) / self.sr
-
-        return out
-
-
-class Lowpass:
+@dataclass
+class AudioEffect:
     """
-    Lowpass - Filtre passe-bas très simple.
-    Pour enlever les aigus ou simuler un effet de distance.
+    AudioEffect - Classe qui stocke les valeurs des effets audios
     """
+    reverb: float = 0.0
+    distortion: float = 0.0
+    chorus: float = 0.0
+    lowpass: float = 20000
 
-    def __init__(self, sample_rate: int):
-        self.sr = sample_rate
-        self.prev = np.zeros(2, dtype=np.float32)
 
-    def process(self, stereo: np.ndarray, cutoff: float):
-        if cutoff >= 20000.0: # 20 KHz, inutile d'appliquer l'effet
-            return stereo
+@dataclass
+class ParameterRamp:
+    """
+    ParameterRamp - Interpolation linéaire d'un champ de AudioEffect, avancée par le callback audio
+    La progression est comptée en échantillons, la valeur est mise à jour à chaque bloc.
+    """
+    start: float
+    target: float
+    length: int  # Durée de la rampe en échantillons
+    elapsed: int = 0
 
-        rc = 1.0 / (2 * np.pi * cutoff)
-        dt = 1.0 / self.sr
-        alpha = dt / (rc + dt)
-        out = np.zeros_like(stereo)
+    @property
+    def done(self) -> bool:
+        return self.elapsed >= self.length
 
-        for i in range(stereo.shape[1]):
-            self.prev = self.prev + alpha * (stereo[:, i] - self.prev)
-            out[:, i] = self.prev # Toutes les lignes, colone i
+    def advance(self, frames: int) -> float:
+        """
+        advance - Avancer la rampe d'un bloc et retourner la valeur atteinte à la fin de ce bloc
+        """
 
-        return out
+        self.elapsed += frames
+        if self.done:
+            return self.target
+        return self.start + (self.target - self.start) * (self.elapsed / self.length)
 
 
 @dataclass
-class AudioEffect:
+class AudioStatsSnapshot:
     """
-    AudioEffect - Classe qui stocke les valeurs des effets audios
+    AudioStatsSnapshot - Copie des statistiques du moteur audio à un instant donné
+    Les charges sont exprimées en fraction du budget d'un bloc (1.0 = bloc calculé juste à temps).
     """
-    reverb: float = 0.0
-    distortion: float = 0.0
-    chorus: float = 0.0
-    lowpass: float = 20000
+    callbacks: int
+    load: float
+    load_peak: float  # Depuis le précédent instantané
+    load_mean: float
+    load_histogram: np.ndarray
+    underflows: int
+    overflows: int
+    active_voices: int
+    rejected_voices: int  # play_sound arrivés alors que la table des voix était pleine
+    dropped_commands: int  # Commandes perdues car la file était pleine
+    stream_underruns: int  # Blocs où un flux n'avait pas encore assez d'échantillons décodés
+
+
+class AudioStats:
+    """
+    AudioStats - Compteurs et histogrammes de santé du moteur audio
+    Écrits uniquement par le callback audio, lus par le jeu au travers de snapshot().
+    """
+
+    LOAD_BINS = 40  # Tranches de 5 % du budget, la dernière regroupe tout ce qui dépasse 195 %
+
+    def __init__(self) -> None:
+        self.callbacks = 0
+
+        self.load = 0.0
+        self.load_peak = 0.0
+        self.load_total = 0.0
+        self.load_histogram = np.zeros(self.LOAD_BINS, dtype=np.int64)
+
+        self.underflows = 0
+        self.overflows = 0
+        self.active_voices = 0
+        self.rejected_voices = 0
+
+    def record_status(self, status) -> None:
+        """
+        record_status - Compter les incidents signalés par sounddevice (sd.CallbackFlags)
+        """
+
+        self.underflows += bool(status.output_underflow)
+        self.overflows += bool(status.output_overflow)
+
+    def record_callback(self, duration: float, budget: float, active_voices: int) -> None:
+        """
+        record_callback - Enregistrer la durée d'un callback par rapport au budget du bloc
+        """
+
+        self.load = duration / budget
+        self.load_peak = max(self.load_peak, self.load)
+        self.load_total += self.load
+        self.load_histogram[min(int(self.load * 20), self.LOAD_BINS - 1)] += 1
+        self.active_voices = active_voices
+        self.callbacks += 1
+
+    def snapshot(
+        self, dropped_commands: int, stream_underruns: int, reset_peaks: bool = True
+    ) -> AudioStatsSnapshot:
+        """
+        snapshot - Copier les statistiques, assez léger pour être appelé à chaque frame
+        ---
+        params:
+            - dropped_commands: int = Compteur tenu par la file de commandes, côté jeu
+            - stream_underruns: int = Compteur tenu par la table des voix (VoiceTable)
+            - reset_peaks: bool = Repartir de zéro pour les pics (pic par frame du jeu)
+        """
+
+        callbacks = max(1, self.callbacks)
+        snapshot = AudioStatsSnapshot(
+            callbacks=self.callbacks,
+            load=self.load,
+            load_peak=self.load_peak,
+            load_mean=self.load_total / callbacks,
+            load_histogram=self.load_histogram.copy(),
+            underflows=self.underflows,
+            overflows=self.overflows,
+            active_voices=self.active_voices,
+            rejected_voices=self.rejected_voices,
+            dropped_commands=dropped_commands,
+            stream_underruns=stream_underruns,
+        )
+
+        if reset_peaks:
+            self.load_peak = 0.0
+        return snapshot
 
 
 class AudioEngine:
     """
-    AudioEngine - Moteur audio de BrokeEngine (version sans Pedalboard)
+    AudioEngine - Moteur audio de BrokeEngine
+    La chaîne d'effets est calculée par un backend de systems.audio_effects (numpy ou pedalboard).
     """
 
-    def __init__(self, sample_rate=44100, block_size=512):
+    def __init__(
+        self,
+        sample_rate=44100,
+        block_size=512,
+        max_voices=32,
+        backend: str = config.audio.effects.backend,
+    ):
         self.logger = Logger("systems.audio")
 
         self.sample_rate = sample_rate
         self.block_size = block_size
-        self.sounds: Dict[str, np.ndarray] = {}
-        self.playing_sounds = []
+        self.sounds: Dict[str, tuple] = {}  # Nom → clé du son dans self.cache
+        self.sound_paths: Dict[str, str] = {}  # Nom → fichier, pour recharger un son libéré
+        self.streams: Dict[str, str] = {}  # Nom → chemin des sons lus en continu
+        self.voices = VoiceTable(max_voices, block_size)
         self.stream = None
 
+        self.mix = np.zeros((2, block_size), dtype=np.float32)
+
         self.effects = AudioEffect()
 
-        self.reverb = Reverb(sample_rate)
-        self.distortion = Distortion()
-        self.chorus = Chorus(sample_rate)
-        self.lowpass = Lowpass(sample_rate)
+        self.backend = create_backend(backend, sample_rate, block_size)
+
+        self.stats = AudioStats()
+
+        self.cache = SoundCache(
+            sample_rate,
+            int(config.audio.cache.budget_mb * 2**20),
+            config.audio.cache.storage,
+            in_use=self.is_playing,
+        )
 
-        self.lock = threading.Lock()
-        self.command_queue = Queue()
+        # Seul canal entre le jeu et le callback, vidé au début de chaque callback
+        self.command_queue = CommandRing()
+        self.next_handle = 1
+        self.ramps: Dict[str, ParameterRamp] = {}
 
         self.audio_thread = None
         self.running = False
+        self.realtime = True  # False pendant un rendu hors temps réel (flux décodés sans thread)
 
     def load_sound(self, name: str, filepath: str):
-        try:
-            with wave.open("assets/sounds/"+filepath, 'rb') as wf:
-                frames = wf.readframes(wf.getnframes())
-                audio = np.frombuffer(frames, dtype=np.int16).astype(np.float32)
-                audio /= 32768.0 # Normalisation de l'audio
+        """
+        load_sound - Charger un son en mémoire, sans le décoder à nouveau s'il est déjà en cache
+        """
 
-                if wf.getnchannels() == 1:
-                    audio = np.stack([audio, audio])
-                else:
-                    audio = audio.reshape(-1, 2).T
+        path = resolve_path("assets/sounds/" + filepath)
+        if path is None:
+            self.logger.error(f"Error loading {name}: no readable file for {filepath}")
+            return False
 
-                with self.lock:
-                    self.sounds[name] = audio
+        try:
+            self.cache.load(path)
+        except Exception as e:
+            self.logger.error(f"Error loading {name}: {e}")
+            return False
 
-                self.logger.log(f"Loaded sound: {name}")
-                return True
+        self.sounds[name] = self.cache.key(path)
+        self.sound_paths[name] = path
+        self.logger.log(f"Loaded sound: {name}")
+        return True
+
+    def add_sound(self, name: str, audio: np.ndarray):
+        """
+        add_sound - Déclarer un son généré en mémoire (2, frames), jamais libéré par le cache
+        Un son déjà en float32, float16 ou int16 est gardé tel quel ; un son en virgule flottante
+        d'un autre type (float64...) est converti au format de stockage du cache.
+        """
+
+        if audio.dtype.name not in STORAGE_SCALES:
+            # Vérifié ici, sur le thread du jeu : le callback audio ne sait mixer que ces formats
+            if not np.issubdtype(audio.dtype, np.floating):
+                raise TypeError(
+                    f"Sound {name} has unsupported dtype {audio.dtype}, "
+                    f"expected floats or one of {list(STORAGE_SCALES)}"
+                )
+            audio = to_storage(audio.astype(np.float32), self.cache.storage)
+
+        key = ("<memory>", name)
+        self.cache.insert(key, audio, pinned=True)
+        self.sounds[name] = key
+
+    def get_sound(self, name: str) -> np.ndarray | None:
+        """
+        get_sound - Données d'un son chargé, rechargé depuis le disque s'il a été libéré du cache
+        """
+
+        audio = self.cache.get(self.sounds[name])
+        if audio is not None:
+            return audio
 
+        try:
+            audio = self.cache.load(self.sound_paths[name])
         except Exception as e:
-            self.logger.error(f"Error loading {name}: {e}")
+            self.logger.error(f"Error reloading {name}: {e}")
+            return None
+
+        self.sounds[name] = self.cache.key(self.sound_paths[name])
+        return audio
+
+    def is_playing(self, audio: np.ndarray) -> bool:
+        """
+        is_playing - Le son est joué par une voix ou attend dans une commande play
+        Lu depuis le thread du jeu : le résultat peut avoir un bloc de retard, ce qui est sans
+        danger puisqu'une voix garde sa propre référence au son même s'il quitte le cache.
+        """
+
+        if any(data is audio for data in self.voices.data):
+            return True
+        return any(
+            command is not None and command[0] == "play" and command[2] is audio
+            for command in self.command_queue.slots
+        )
+
+    def load_stream(self, name: str, filepath: str):
+        """
+        load_stream - Déclarer un son lu en continu depuis le disque (musiques)
+        Rien n'est décodé ici, la lecture commence au premier play_sound.
+        """
+
+        path = resolve_path("assets/sounds/" + filepath)
+        if path is None:
+            self.logger.error(f"Error loading {name}: no readable file for {filepath}")
             return False
 
+        self.streams[name] = path
+        self.logger.log(f"Registered stream: {name} ({path})")
+        return True
+
     def play_sound(self, name: str, loop=False, volume=config.audio.volume.master):
-        if name not in self.sounds:
+        if name in self.streams:
+            data = StreamSource(
+                self.streams[name],
+                self.sample_rate,
+                self.block_size,
+                loop,
+                threaded=self.realtime,
+            )
+        elif name in self.sounds:
+            data = self.get_sound(name)
+            if data is None:
+                return None
+        else:
             self.logger.error(f"Sound doesn't exists: {name}")
             return
 
-        with self.lock:
-            self.playing_sounds.append({
-                'data': self.sounds[name] * volume,
-                'position': 0,
-                'loop': loop
-            })
+        handle = self.next_handle
+        self.next_handle += 1
+
+        if not self.send_command(("play", handle, data, volume, loop)):
+            if isinstance(data, StreamSource):
+                data.close()
+            return None
+        return handle
+
+    def stop_sound(self, handle: int):
+        """
+        stop_sound - Arrêter une voix à partir de l'identifiant retourné par play_sound
+        """
+
+        self.send_command(("stop", handle))
+
+    def set_volume(self, handle: int, volume: float):
+        """
+        set_volume - Changer le volume d'une voix en cours de lecture
+        """
+
+        self.send_command(("gain", handle, volume))
 
     def stop_all(self):
-        with self.lock:
-            self.playing_sounds.clear()
+        self.send_command(("stop_all",))
+
+    def send_command(self, command: tuple) -> bool:
+        """
+        send_command - Publier une commande pour le callback audio (thread du jeu uniquement)
+        """
+
+        if not self.command_queue.push(command):
+            self.logger.warn(f"Audio command queue full, dropped {command[0]}")
+            return False
+        return True
+
+    def discard_commands(self) -> None:
+        """
+        discard_commands - Vider la file de commandes sans les jouer (mode sans carte son)
+        Les flux déjà ouverts par play_sound sont fermés.
+        """
+
+        while (command := self.command_queue.pop()) is not None:
+            if command[0] == "play" and isinstance(command[2], StreamSource):
+                command[2].close()
+
+    def process_commands(self, frames: int) -> None:
+        """
+        process_commands - Appliquer les commandes en attente puis avancer les rampes d'un bloc
+        Appelée depuis le callback audio, seul endroit où les voix et self.effects changent.
+        """
+
+        while (command := self.command_queue.pop()) is not None:
+            kind = command[0]
+
+            if kind == "play":
+                _, handle, data, gain, loop = command
+                if self.voices.allocate(handle, data, gain, loop) is None:
+                    self.stats.rejected_voices += 1
+                    if isinstance(data, StreamSource):
+                        data.close()
+            elif kind == "stop":
+                slot = self.voices.find(command[1])
+                if slot is not None:
+                    self.voices.release(slot)
+            elif kind == "gain":
+                slot = self.voices.find(command[1])
+                if slot is not None:
+                    self.voices.gain[slot] = command[2]
+            elif kind == "stop_all":
+                self.voices.clear()
+            elif kind == "set":
+                _, field, value = command
+                self.ramps.pop(field, None)
+                setattr(self.effects, field, value)
+            elif kind == "ramp":
+                _, field, target, length = command
+                self.ramps[field] = ParameterRamp(getattr(self.effects, field), target, length)
+
+        for field, ramp in tuple(self.ramps.items()):
+            setattr(self.effects, field, ramp.advance(frames))
+            if ramp.done:
+                del self.ramps[field]
 
     def audio_callback(self, outdata, frames, time_info, status):
+        started = time.perf_counter()
+
         if status:
+            self.stats.record_status(status)
             self.logger.warn(f"Audio status: {status}")
 
-        mixed = np.zeros((2, frames), dtype=np.float32)
+        active = self.render_block(outdata, frames)
+
+        self.stats.record_callback(
+            time.perf_counter() - started, frames / self.sample_rate, active
+        )
+
+    def render_block(self, outdata, frames: int) -> int:
+        """
+        render_block - Mixer les voix et appliquer les effets dans outdata (frames, 2)
+        Retourne le nombre de voix mixées
+        """
 
-        with self.lock:
-            for sound in self.playing_sounds[:]:
-                data = sound['data']
-                pos = sound['position']
-                remain = data.shape[1] - pos
+        # Les rampes avancent aussi pendant les blocs silencieux
+        self.process_commands(frames)
 
-                if remain <= 0:
-                    if sound['loop']:
-                        sound['position'] = 0
-                        continue
-                    else:
-                        self.playing_sounds.remove(sound)
-                        continue
+        # Bus de mixage préalloué, réalloué uniquement si le périphérique demande un bloc plus grand
+        if self.mix.shape[1] < frames:
+            self.mix = np.zeros((2, frames), dtype=np.float32)
 
-                to_copy = min(frames, remain)
-                mixed[:, :to_copy] += data[:, pos:pos + to_copy]
-                sound['position'] += to_copy
+        mixed = self.mix[:, :frames]
+        mixed.fill(0.0)
 
-        x = mixed
-        x = self.distortion.process(x, self.effects.distortion)
-        x = self.chorus.process(x, self.effects.chorus)
-        x = self.reverb.process(x, self.effects.reverb)
-        x = self.lowpass.process(x, self.effects.lowpass)
+        active = self.voices.mix(mixed)
 
-        x = np.clip(x, -1.0, 1.0)
-        outdata[:] = x.T
+        # Aucune voix : inutile de faire passer du silence dans la chaîne d'effets
+        if not active:
+            outdata.fill(0.0)
+            return 0
+
+        # Chaque effet travaille sur place dans le bus de mixage
+        self.backend.process(mixed, self.effects)
+
+        # Écrêtage écrit directement dans outdata (frames, 2) : une seule passe, sans copie
+        # transposée séparée. Le bus reste en (2, frames) : les effets travaillent sur des canaux
+        # contigus, ce qui coûte bien moins qu'un bus entrelacé (~30 µs de plus par bloc de 512)
+        np.clip(mixed, -1.0, 1.0, out=outdata.T)
+        return active
 
     def start(self):
         if self.running:
             self.logger.warn("Audio engine already running")
             return
 
+        import sounddevice as sd  # Chargé ici : le rendu hors ligne doit fonctionner sans PortAudio
+
         self.running = True
         self.stream = sd.OutputStream(
             samplerate=self.sample_rate,
@@ -260,40 +646,101 @@ class AudioEngine:
 
         self.logger.log("Audio engine stopped")
 
+    def stats_snapshot(self, reset_peaks: bool = True) -> AudioStatsSnapshot:
+        """
+        stats_snapshot - Statistiques de santé du moteur (charge DSP, xruns, voix, commandes perdues,
+        flux en retard)
+        Prévu pour être appelé à chaque frame par la boucle du jeu.
+        """
+
+        return self.stats.snapshot(
+            self.command_queue.dropped, self.voices.stream_underruns, reset_peaks
+        )
+
+    def render(self, duration: float, script=(), path: str | None = None) -> np.ndarray:
+        """
+        render - Rendu hors temps réel : appeler audio_callback aussi vite que possible
+        ---
+        params:
+            - duration: float = Durée à rendre en secondes
+            - script: iterable = Suite de (temps en secondes, nom de méthode, *arguments),
+              par exemple (0.5, "fade_lowpass", 250, 0.5), appliquée au début du bloc concerné
+            - path: str | None = Fichier WAV 16 bits où écrire le rendu
+        Retourne le rendu (frames, 2) en float32
+        """
+
+        if self.running:
+            self.logger.warn("Offline render while the audio stream is running")
+
+        total = int(duration * self.sample_rate)
+        output = np.zeros((total, 2), dtype=np.float32)
+        events = sorted(script, key=lambda event: event[0])
+        next_event = 0
+
+        self.realtime = False
+        try:
+            for start in range(0, total, self.block_size):
+                frames = min(self.block_size, total - start)
+
+                while (
+                    next_event < len(events)
+                    and events[next_event][0] * self.sample_rate < start + frames
+                ):
+                    _, method, *args = events[next_event]
+                    getattr(self, method)(*args)
+                    next_event += 1
+
+                self.audio_callback(output[start:start + frames], frames, None, None)
+        finally:
+            self.realtime = True
+
+        if path is not None:
+            with wave.open(path, "wb") as wf:
+                wf.setnchannels(2)
+                wf.setsampwidth(2)
+                wf.setframerate(self.sample_rate)
+                wf.writeframes((output * 32767.0).astype("<i2").tobytes())
+            self.logger.log(f"Offline render written to {path}")
+
+        return output
+
+    def set_effect(self, field: str, value: float) -> None:
+        """
+        set_effect - Changer immédiatement un champ de AudioEffect (annule une rampe en cours)
+        """
+
+        self.send_command(("set", field, value))
+
+    def ramp_effect(self, field: str, target: float, duration: float) -> None:
+        """
+        ramp_effect - Amener progressivement un champ de AudioEffect vers une valeur
+        ---
+        params:
+            - field: str = Nom du champ de AudioEffect (reverb, distortion, chorus, lowpass)
+            - target: float = Valeur atteinte à la fin de la rampe
+            - duration: float = Durée de la rampe en secondes
+        """
+
+        self.send_command(("ramp", field, target, int(duration * self.sample_rate)))
+
     def set_reverb(self, amount: float):
-        self.effects.reverb = max(0.0, min(1.0, amount))
+        self.set_effect("reverb", max(0.0, min(1.0, amount)))
         self.logger.log(f"Reverb effect set to {amount}")
 
     def set_distortion(self, amount: float):
-        self.effects.distortion = max(0.0, min(40.0, amount))
+        self.set_effect("distortion", max(0.0, min(40.0, amount)))
         self.logger.log(f"Distrortion effect set to {amount}")
 
     def set_chorus(self, amount: float):
-        self.effects.chorus = max(0.0, min(1.0, amount))
+        self.set_effect("chorus", max(0.0, min(1.0, amount)))
         self.logger.log(f"Chorus effect set to {amount}")
 
     def set_lowpass(self, frequency: float):
-        self.effects.lowpass = max(20.0, min(20000.0, frequency))
+        self.set_effect("lowpass", max(20.0, min(20000.0, frequency)))
         self.logger.log(f"Lowpass effect set to {frequency}")
 
     def fade_reverb(self, target: float, duration: float):
-        def _fade():
-            start = self.effects.reverb
-            steps = int(duration * 60)
-            for i in range(steps):
-                t = i / steps
-                self.effects.reverb = start + (target - start) * t
-                threading.Event().wait(duration / steps)
-
-        threading.Thread(target=_fade, daemon=True).start()
+        self.ramp_effect("reverb", target, duration)
 
     def fade_lowpass(self, target: float, duration: float):
-        def _fade():
-            start = self.effects.lowpass
-            steps = int(duration * 60) # 60 étapes par secondes (Aucun rapport avec les FPS graphiques)
-            for i in range(steps):
-                t = i / steps
-                self.effects.lowpass = start + (target - start) * t
-                threading.Event().wait(duration / steps)
-
-        threading.Thread(target=_fade, daemon=True).start()
\ No newline at end of file
+        self.ramp_effect("lowpass", target, duration)
@@ -0,0 +1,185 @@
+"""
+systems.audio_cache - Cache des sons décodés du moteur audio
+
+Un son n'est décodé qu'une fois tant que son fichier ne change pas (clé : chemin et date de
+modification). Les sons peuvent être stockés en float16 ou int16 pour réduire la mémoire, la
+conversion en float32 se fait bloc par bloc au moment du mixage. Au-delà du budget mémoire,
+les sons les moins récemment utilisés qui ne sont pas en cours de lecture sont libérés.
+
+EwoFluffy - BrokeTeam - 2025
+"""
+
+import os
+from collections import OrderedDict
+from typing import Callable
+
+import numpy as np
+
+from systems.audio_stream import open_decoder
+from systems.logging import Logger
+
+# Facteur à appliquer aux échantillons stockés pour retrouver des valeurs entre -1 et 1
+STORAGE_SCALES: dict[str, float] = {
+    "float32": 1.0,
+    "float16": 1.0,
+    "int16": 1.0 / 32767.0,
+}
+
+
+def decode_file(path: str, sample_rate: int) -> np.ndarray:
+    """
+    decode_file - Décoder entièrement un fichier audio en float32 stéréo (2, frames)
+    """
+
+    decoder = open_decoder(path, sample_rate)
+    chunks = []
+    chunk = np.zeros((2, 65536), dtype=np.float32)
+
+    try:
+        while count := decoder.read(chunk):
+            chunks.append(chunk[:, :count].copy())
+    finally:
+        decoder.close()
+
+    if not chunks:
+        return np.zeros((2, 0), dtype=np.float32)
+    return np.concatenate(chunks, axis=1)
+
+
+def to_storage(audio: np.ndarray, storage: str) -> np.ndarray:
+    """
+    to_storage - Convertir un son float32 vers le format de stockage du cache
+    """
+
+    if storage == "int16":
+        return np.round(np.clip(audio, -1.0, 1.0) * 32767.0).astype(np.int16)
+    return np.ascontiguousarray(audio, dtype=storage)
+
+
+class SoundCache:
+    """
+    SoundCache - Sons décodés indexés par (chemin, date de modification), avec éviction LRU
+    """
+
+    def __init__(
+        self,
+        sample_rate: int,
+        budget: int,
+        storage: str = "float32",
+        in_use: Callable[[np.ndarray], bool] = lambda audio: False,
+    ) -> None:
+        """
+        params:
+            - sample_rate: int = Fréquence des sons décodés
+            - budget: int = Mémoire maximale des sons en cache, en octets
+            - storage: str = float32, float16 ou int16
+            - in_use: Callable = Indique si un son est en cours de lecture (jamais libéré dans ce cas)
+        """
+
+        if storage not in STORAGE_SCALES:
+            raise ValueError(f"Unknown sound storage {storage}, expected one of {list(STORAGE_SCALES)}")
+
+        self.logger = Logger("systems.audio_cache")
+
+        self.sample_rate = sample_rate
+        self.budget = budget
+        self.storage = storage
+        self.in_use = in_use
+
+        self.entries: OrderedDict[tuple, np.ndarray] = OrderedDict()
+        self.pinned: set[tuple] = set()  # Sons sans fichier, impossibles à recharger
+        self.size = 0
+
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def key(self, path: str) -> tuple:
+        """
+        key - Clé de cache d'un fichier, change dès que le fichier est modifié
+        """
+
+        return (os.path.abspath(path), os.stat(path).st_mtime_ns)
+
+    def get(self, key: tuple) -> np.ndarray | None:
+        """
+        get - Retourner un son déjà en cache et le marquer comme récemment utilisé
+        """
+
+        audio = self.entries.get(key)
+        if audio is not None:
+            self.entries.move_to_end(key)
+            self.hits += 1
+        return audio
+
+    def load(self, path: str) -> np.ndarray:
+        """
+        load - Retourner le son de path, décodé uniquement s'il n'est pas déjà en cache
+        Lève une exception si le fichier ne peut pas être lu
+        """
+
+        key = self.key(path)
+
+        audio = self.get(key)
+        if audio is not None:
+            return audio
+
+        self.misses += 1
+
+        # Une ancienne version du même fichier ne sera plus jamais demandée
+        for stale in [k for k in self.entries if k[0] == key[0]]:
+            self._remove(stale)
+
+        audio = to_storage(decode_file(path, self.sample_rate), self.storage)
+        self.insert(key, audio)
+        self.logger.log(f"Decoded {path} ({audio.nbytes / 2**20:.1f} MiB as {self.storage})")
+        return audio
+
+    def insert(self, key: tuple, audio: np.ndarray, pinned: bool = False) -> None:
+        """
+        insert - Ajouter un son déjà décodé, puis libérer de la place si le budget est dépassé
+        """
+
+        if key in self.entries:
+            self._remove(key)
+
+        # Partagé par toutes les voix qui le jouent, personne ne doit le modifier ; une vue est
+        # figée pour ne pas rendre le tableau de l'appelant (add_sound) lui aussi non modifiable
+        audio = audio.view()
+        audio.setflags(write=False)
+
+        self.entries[key] = audio
+        self.size += audio.nbytes
+        if pinned:
+            self.pinned.add(key)
+
+        self.evict()
+
+    def evict(self) -> None:
+        """
+        evict - Libérer les sons les moins récemment utilisés jusqu'à revenir sous le budget
+        Le dernier son ajouté ou demandé est gardé : il va être joué.
+        """
+
+        for key in list(self.entries)[:-1]:
+            if self.size <= self.budget:
+                return
+            if key in self.pinned or self.in_use(self.entries[key]):
+                continue
+
+            self._remove(key)
+            self.evictions += 1
+            self.logger.log(f"Evicted {key[0]} from sound cache")
+
+        if self.size > self.budget:
+            self.logger.warn(
+                f"Sound cache over budget ({self.size / 2**20:.1f} MiB), remaining sounds are in use"
+            )
+
+    def _remove(self, key: tuple) -> None:
+        """
+        _remove - Retirer une entrée du cache
+        """
+
+        self.size -= self.entries.pop(key).nbytes
+        self.pinned.discard(key)
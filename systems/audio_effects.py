@@ -0,0 +1,447 @@
+"""
+systems.audio_effects - Effets audio et backends de traitement du moteur audio
+
+Contenu:
+
+Classes Reverb, Distortion, Chorus, Lowpass (effets numpy sur place)
+Classe EffectBackend (et ses implémentations NumpyBackend, PedalboardBackend)
+
+Un backend regroupe les quatre étages de la chaîne d'effets (distortion → chorus → reverb → lowpass).
+Il est choisi par audio.effects.backend, ou en mode auto par un court test de vitesse au démarrage.
+Seul le backend numpy garantit un callback audio sans allocation (benchmarks.audio_allocations) :
+pedalboard alloue ses tampons de sortie à chaque bloc. En mode auto, numpy est donc gardé sauf si
+pedalboard est au moins AUTO_SPEEDUP fois plus rapide.
+
+EwoFluffy - BrokeTeam - 2025
+"""
+
+import time
+from typing import Callable
+
+import numpy as np
+
+from systems.audio_stream import ring_spans
+from systems.logging import Logger
+
+logger: Logger = Logger("systems.audio_effects")
+
+
+class Reverb:
+    """
+    Reverb - Réverbe basée sur un modèle Schroeder
+    Volontairement simplifié, mais suffisant pour donner de l'immersion.
+    Le bloc stéréo est modifié sur place.
+    """
+
+    def __init__(self, sample_rate: int):
+        self.sample_rate = sample_rate
+        self.delay = int(0.03 * sample_rate)
+        self.buffer = np.zeros(self.delay, dtype=np.float32)
+        self.index = 0
+
+        # Tampons de travail, un segment ne dépasse jamais la longueur du délai
+        self.mono = np.zeros(self.delay, dtype=np.float32)
+        self.wet = np.zeros(self.delay, dtype=np.float32)
+
+    def process(self, stereo: np.ndarray, amount: float):
+        if amount <= 0.0:
+            return stereo
+
+        frames = stereo.shape[1]
+
+        # Un segment plus court que la ligne de délai ne relit jamais ce qu'il vient d'écrire,
+        # on peut donc traiter tout le segment d'un coup
+        for start in range(0, frames, self.delay):
+            count = min(self.delay, frames - start)
+            left = stereo[0, start:start + count]
+            mono = self.mono[:count]
+            np.add(left, stereo[1, start:start + count], out=mono)
+            mono *= 0.5
+
+            for ring, part in ring_spans(self.index, count, self.delay):
+                delayed = self.buffer[ring]
+                wet = self.wet[part]
+
+                np.multiply(delayed, amount, out=wet)
+                np.multiply(mono[part], 1 - amount, out=left[part])
+                left[part] += wet
+
+                delayed *= 0.6
+                delayed += mono[part]
+
+            stereo[1, start:start + count] = left
+            self.index = (self.index + count) % self.delay
+
+        return stereo
+
+
+class Distortion:
+    """
+    Distortion - Simule vaguement (À retravailler) une saturation douce
+    en utilisant une fonction tanh.
+    Le bloc stéréo est modifié sur place.
+    """
+
+    def process(self, stereo: np.ndarray, drive_db: float):
+        if drive_db <= 0.0:
+            return stereo
+
+        gain = 10 ** (drive_db / 20)
+        stereo *= gain
+        return np.tanh(stereo, out=stereo)
+
+
+class Chorus:
+    """
+    Chorus - Chorus simple utilisant un délai modulé.
+    Inspiré d'un modèle de chorus analogiques de base : LFO (Oscillateur basses fréquences) → délai → mix.
+    Le bloc stéréo est modifié sur place.
+    """
+
+    def __init__(self, sample_rate: int):
+        self.sr = sample_rate
+        self.max_delay = int(0.02 * sample_rate)
+        self.phase = 0.0
+
+        # Deux lignes de délai utilisées à tour de rôle : les max_delay derniers échantillons
+        # dans l'ordre chronologique, suivis du segment en cours de traitement
+        self.lines = np.zeros((2, 2, 2 * self.max_delay), dtype=np.float32)
+        self.line = 0
+
+        # Tampons de travail, un segment ne dépasse jamais max_delay échantillons
+        self.offsets = np.arange(self.max_delay)
+        self.ramp = np.arange(self.max_delay, dtype=np.float64)
+        self.mod = np.zeros(self.max_delay)
+        self.positions = np.zeros(self.max_delay, dtype=np.intp)
+        self.delayed = np.zeros(2 * self.max_delay, dtype=np.float32)
+
+    def process(self, stereo: np.ndarray, amount: float):
+        if amount <= 0.0:
+            return stereo
+
+        rate = 0.3
+        step = (2 * np.pi * rate) / self.sr
+        size = self.max_delay
+        frames = stereo.shape[1]
+
+        for start in range(0, frames, size):
+            count = min(size, frames - start)
+            segment = stereo[:, start:start + count]
+            offsets = self.offsets[:count]
+
+            line = self.lines[self.line]
+            line[:, size:size + count] = segment
+
+            mod = self.mod[:count]
+            np.multiply(self.ramp[:count], step, out=mod)
+            mod += self.phase
+            np.sin(mod, out=mod)
+            mod += 1
+            mod *= 0.5
+            mod *= size
+
+            # Un délai égal à max_delay retombe sur l'échantillon courant, comme dans un tampon circulaire
+            positions = self.positions[:count]
+            np.copyto(positions, mod, casting="unsafe")
+            np.remainder(positions, size, out=positions)
+            np.subtract(offsets, positions, out=positions)
+            positions += size
+
+            delayed = self.delayed[:2 * count].reshape(2, count)
+            np.take(line, positions, axis=1, out=delayed, mode="clip")
+            delayed *= amount
+            segment += delayed
+            segment /= 2
+
+            self.lines[1 - self.line][:, :size] = line[:, count:count + size]
+            self.line = 1 - self.line
+            self.phase += step * count
+
+        return stereo
+
+
+class Lowpass:
+    """
+    Lowpass - Filtre passe-bas très simple.
+    Pour enlever les aigus ou simuler un effet de distance.
+    Le bloc stéréo est modifié sur place.
+    """
+
+    def __init__(self, sample_rate: int):
+        self.sr = sample_rate
+        self.prev = np.zeros(2)
+
+        # Coefficients recalculés uniquement quand la fréquence de coupure ou la taille de bloc change
+        self.cutoff = None
+        self.frames = 0
+        self.alpha = 0.0
+        self.span = 1
+        self.exponents = np.zeros(0)
+        self.powers = np.zeros(0)
+        self.scaled = np.zeros(0)
+
+    def prepare(self, cutoff: float, frames: int) -> None:
+        """
+        prepare - Calculer les coefficients du filtre pour une fréquence de coupure donnée
+        ---
+        params:
+            - cutoff: float = Fréquence de coupure en Hz
+            - frames: int = Taille des blocs à traiter
+        """
+
+        rc = 1.0 / (2 * np.pi * cutoff)
+        dt = 1.0 / self.sr
+        self.alpha = dt / (rc + dt)
+        decay = 1.0 - self.alpha
+
+        # y[i] = decay^(i+1) * (prev + alpha * somme(x[k] / decay^(k+1))), découpé en segments
+        # assez courts pour que decay^-n reste représentable sans perte de précision
+        self.span = max(1, min(frames, int(27.0 / -np.log(decay))))
+
+        if self.powers.size < self.span:
+            self.exponents = np.arange(1, self.span + 1, dtype=np.float64)
+            self.powers = np.zeros(self.span)
+            self.scaled = np.zeros(self.span)
+
+        np.power(decay, self.exponents[:self.span], out=self.powers[:self.span])
+        self.cutoff = cutoff
+        self.frames = frames
+
+    def process(self, stereo: np.ndarray, cutoff: float):
+        if cutoff >= 20000.0: # 20 KHz, inutile d'appliquer l'effet
+            return stereo
+
+        frames = stereo.shape[1]
+        if cutoff != self.cutoff or frames != self.frames:
+            self.prepare(cutoff, frames)
+
+        # Canal par canal : les opérations 1D évitent les tampons internes de numpy
+        for channel in range(2):
+            for start in range(0, frames, self.span):
+                segment = stereo[channel, start:start + self.span]
+                count = segment.size
+                powers = self.powers[:count]
+                scaled = self.scaled[:count]
+
+                scaled[...] = segment
+                scaled /= powers
+                np.cumsum(scaled, out=scaled)
+                scaled *= self.alpha
+                scaled += self.prev[channel]
+                scaled *= powers
+
+                segment[...] = scaled
+                self.prev[channel] = scaled[-1]
+
+        return stereo
+
+
+class EffectBackend:
+    """
+    EffectBackend - Interface d'une implémentation de la chaîne d'effets
+
+    Chaque étage (distortion, chorus, reverb, lowpass) expose process(stereo, valeur) et modifie le
+    bloc sur place. Une valeur neutre (0, ou 20 kHz pour le passe-bas) laisse le bloc intact.
+    Le constructeur lève une exception si le backend n'est pas utilisable.
+    """
+
+    name: str = ""
+
+    def __init__(self, sample_rate: int) -> None:
+        self.sample_rate = sample_rate
+
+    def process(self, stereo: np.ndarray, effects) -> np.ndarray:
+        """
+        process - Appliquer la chaîne d'effets sur place
+        ---
+        params:
+            - stereo: np.ndarray = Bloc (2, frames) float32
+            - effects: AudioEffect = Valeurs des effets pour ce bloc
+        """
+
+        self.distortion.process(stereo, effects.distortion)
+        self.chorus.process(stereo, effects.chorus)
+        self.reverb.process(stereo, effects.reverb)
+        self.lowpass.process(stereo, effects.lowpass)
+        return stereo
+
+
+class NumpyBackend(EffectBackend):
+    """
+    NumpyBackend - Effets vectorisés avec numpy, sans allocation dans le callback
+    """
+
+    name = "numpy"
+
+    def __init__(self, sample_rate: int) -> None:
+        super().__init__(sample_rate)
+
+        self.reverb = Reverb(sample_rate)
+        self.distortion = Distortion()
+        self.chorus = Chorus(sample_rate)
+        self.lowpass = Lowpass(sample_rate)
+
+
+class PluginStage:
+    """
+    PluginStage - Étage de la chaîne d'effets appliqué par un plugin pedalboard
+    Le plugin garde son état d'un bloc à l'autre (reset=False), comme les effets numpy.
+    """
+
+    def __init__(
+        self,
+        plugin,
+        sample_rate: int,
+        neutral: Callable[[float], bool],
+        configure: Callable[[object, float], None],
+    ) -> None:
+        """
+        params:
+            - plugin: pedalboard.Plugin = Plugin à appliquer
+            - sample_rate: int = Fréquence des blocs
+            - neutral: Callable = Indique si une valeur désactive l'étage
+            - configure: Callable = Reporte une valeur sur les paramètres du plugin
+        """
+
+        self.plugin = plugin
+        self.sample_rate = sample_rate
+        self.neutral = neutral
+        self.configure = configure
+        self.value = None
+
+    def process(self, stereo: np.ndarray, value: float):
+        if self.neutral(value):
+            return stereo
+
+        if value != self.value:
+            self.configure(self.plugin, value)
+            self.value = value
+
+        stereo[...] = self.plugin.process(
+            stereo, self.sample_rate, buffer_size=stereo.shape[1], reset=False
+        )
+        return stereo
+
+
+class PedalboardBackend(EffectBackend):
+    """
+    PedalboardBackend - Effets JUCE de pedalboard, calculés hors du GIL
+    Les paramètres reproduisent au plus près les effets numpy, mais le rendu n'est pas identique.
+    Chaque bloc traité alloue un nouveau tableau en sortie du plugin.
+    """
+
+    name = "pedalboard"
+
+    def __init__(self, sample_rate: int) -> None:
+        super().__init__(sample_rate)
+
+        import pedalboard  # Dépendance lourde, chargée seulement si ce backend est utilisé
+
+        def set_distortion(plugin, drive_db: float) -> None:
+            plugin.drive_db = drive_db
+
+        def set_chorus(plugin, amount: float) -> None:
+            # Le chorus numpy mélange (sec + amount * retardé) / 2
+            plugin.mix = amount / (1.0 + amount)
+
+        def set_reverb(plugin, amount: float) -> None:
+            plugin.wet_level = amount
+            plugin.dry_level = 1.0 - amount
+
+        def set_lowpass(plugin, cutoff: float) -> None:
+            plugin.cutoff_frequency_hz = cutoff
+
+        # Même LFO que le chorus numpy : 0.3 Hz, délai balayé entre 0 et 20 ms
+        chorus = pedalboard.Chorus(rate_hz=0.3, depth=1.0, centre_delay_ms=10.0, feedback=0.0)
+
+        self.distortion = PluginStage(
+            pedalboard.Distortion(), sample_rate, lambda v: v <= 0.0, set_distortion
+        )
+        self.chorus = PluginStage(chorus, sample_rate, lambda v: v <= 0.0, set_chorus)
+        self.reverb = PluginStage(
+            pedalboard.Reverb(width=0.0), sample_rate, lambda v: v <= 0.0, set_reverb
+        )
+        self.lowpass = PluginStage(
+            pedalboard.LowpassFilter(), sample_rate, lambda v: v >= 20000.0, set_lowpass
+        )
+
+
+# Backends disponibles, essayés dans cet ordre en mode auto
+BACKENDS: dict[str, type[EffectBackend]] = {
+    "numpy": NumpyBackend,
+    "pedalboard": PedalboardBackend,
+}
+
+# En mode auto, un backend qui alloue dans le callback n'est gardé que s'il est nettement plus rapide
+ALLOCATION_FREE: set[str] = {"numpy"}
+AUTO_SPEEDUP: float = 2.0
+
+
+def benchmark_backend(backend: EffectBackend, block_size: int, blocks: int = 32) -> float:
+    """
+    benchmark_backend - Durée moyenne d'un bloc de bruit traité avec tous les effets actifs
+    """
+
+    class Effects:
+        distortion = 6.0
+        chorus = 0.5
+        reverb = 0.5
+        lowpass = 1000.0
+
+    block = np.random.default_rng(0).uniform(-0.5, 0.5, (2, block_size)).astype(np.float32)
+    noise = block.copy()
+
+    backend.process(block, Effects)  # Premier bloc exclu : initialisations paresseuses
+    start = time.perf_counter()
+    for _ in range(blocks):
+        block[...] = noise
+        backend.process(block, Effects)
+    return (time.perf_counter() - start) / blocks
+
+
+def create_backend(name: str, sample_rate: int, block_size: int) -> EffectBackend:
+    """
+    create_backend - Créer le backend d'effets demandé
+    ---
+    params:
+        - name: str = Nom d'un backend de BACKENDS, ou "auto" pour garder un backend sans
+          allocation (ALLOCATION_FREE) sauf si un autre est AUTO_SPEEDUP fois plus rapide
+        - sample_rate: int = Fréquence du moteur
+        - block_size: int = Taille de bloc utilisée pour le test de vitesse
+    Un backend inutilisable est remplacé par le backend numpy.
+    """
+
+    if name != "auto":
+        if name not in BACKENDS:
+            logger.error(f"Unknown audio effect backend {name}, using numpy")
+            return NumpyBackend(sample_rate)
+        try:
+            return BACKENDS[name](sample_rate)
+        except Exception as e:
+            logger.error(f"Audio effect backend {name} unavailable ({e}), using numpy")
+            return NumpyBackend(sample_rate)
+
+    timings = {}
+    for backend_name, backend_class in BACKENDS.items():
+        try:
+            timings[backend_name] = benchmark_backend(backend_class(sample_rate), block_size)
+        except Exception as e:
+            logger.warn(f"Audio effect backend {backend_name} unavailable: {e}")
+
+    if not timings:
+        raise RuntimeError(f"No audio effect backend is usable (tried {', '.join(BACKENDS)})")
+
+    chosen = min(timings, key=timings.get)
+    allocation_free = [key for key in timings if key in ALLOCATION_FREE]
+    if allocation_free and chosen not in ALLOCATION_FREE:
+        preferred = min(allocation_free, key=timings.get)
+        if timings[preferred] < timings[chosen] * AUTO_SPEEDUP:
+            chosen = preferred
+
+    logger.log(
+        f"Audio effect backend: {chosen} ("
+        + ", ".join(f"{key} {value * 1000:.3f} ms/block" for key, value in timings.items())
+        + ")"
+    )
+    # Le backend mesuré a traité du bruit, on repart d'un état propre
+    return BACKENDS[chosen](sample_rate)
@@ -0,0 +1,412 @@
+"""
+systems.audio_stream - Lecture en continu des musiques pour le moteur audio
+
+Contenu:
+
+Classe Decoder (et ses implémentations WavDecoder, PedalboardDecoder)
+Classe StreamSource
+
+Une musique n'est jamais décodée entièrement : un thread lit le fichier quelques blocs en avance
+dans un tampon circulaire que le callback audio consomme.
+
+EwoFluffy - BrokeTeam - 2025
+"""
+
+import os
+import struct
+import threading
+
+import numpy as np
+
+from systems.logging import Logger
+
+logger: Logger = Logger("systems.audio_stream")
+
+
+def ring_spans(index: int, count: int, size: int) -> tuple:
+    """
+    ring_spans - Découper count éléments à partir de index dans un tampon circulaire de taille size
+    Retourne deux couples (tranche du tampon, tranche du segment), le second est vide sans bouclage
+    """
+
+    head = min(count, size - index)
+    return (
+        (slice(index, index + head), slice(0, head)),
+        (slice(0, count - head), slice(head, count)),
+    )
+
+
+class Decoder:
+    """
+    Decoder - Interface d'un décodeur de fichier audio
+
+    Un décodeur produit des blocs stéréo float32 à la fréquence d'échantillonnage du moteur.
+    Le constructeur lève une exception si le fichier ne peut pas être lu par ce décodeur.
+    """
+
+    def __init__(self, path: str, sample_rate: int) -> None:
+        self.path = path
+        self.sample_rate = sample_rate
+
+    def read(self, out: np.ndarray) -> int:
+        """
+        read - Décoder jusqu'à out.shape[1] frames dans out (2, frames)
+        Retourne le nombre de frames écrites, 0 à la fin du fichier
+        """
+
+        raise NotImplementedError
+
+    def seek(self, frame: int) -> None:
+        """
+        seek - Reprendre la lecture à la frame donnée
+        """
+
+        raise NotImplementedError
+
+    def close(self) -> None:
+        """
+        close - Libérer le fichier
+        """
+
+        return
+
+
+class WavDecoder(Decoder):
+    """
+    WavDecoder - Lecture d'un WAV PCM 16 bits ou flottant 32 bits par projection en mémoire
+    Seules les pages réellement lues sont chargées par le système.
+    """
+
+    def __init__(self, path: str, sample_rate: int) -> None:
+        super().__init__(path, sample_rate)
+
+        format_tag, channels, file_rate, bits, offset, size = self._read_layout(path)
+
+        if file_rate != sample_rate:
+            raise ValueError(f"sample rate {file_rate} Hz, expected {sample_rate} Hz")
+
+        if format_tag == 1 and bits == 16:
+            dtype, self.scale = np.dtype("<i2"), 1.0 / 32768.0
+        elif format_tag == 3 and bits == 32:
+            dtype, self.scale = np.dtype("<f4"), 1.0
+        else:
+            raise ValueError(f"unsupported WAV format {format_tag} ({bits} bits)")
+
+        # La taille annoncée peut être fausse sur les fichiers mal fermés
+        size = min(size, os.path.getsize(path) - offset)
+        frames = size // (dtype.itemsize * channels)
+
+        self.channels = channels
+        self.frames = frames
+        self.position = 0
+        self.samples = np.memmap(
+            path, dtype=dtype, mode="r", offset=offset, shape=(frames, channels)
+        )
+
+    @staticmethod
+    def _read_layout(path: str) -> tuple[int, int, int, int, int, int]:
+        """
+        _read_layout - Lire les chunks RIFF pour trouver le format et la position des données
+        """
+
+        with open(path, "rb") as f:
+            riff, _, wave_id = struct.unpack("<4sI4s", f.read(12))
+            if riff != b"RIFF" or wave_id != b"WAVE":
+                raise ValueError("not a RIFF/WAVE file")
+
+            layout = None
+            while True:
+                header = f.read(8)
+                if len(header) < 8:
+                    raise ValueError("no data chunk")
+
+                chunk_id, chunk_size = struct.unpack("<4sI", header)
+
+                if chunk_id == b"fmt ":
+                    body = f.read(chunk_size + (chunk_size & 1))
+                    format_tag, channels, file_rate, _, _, bits = struct.unpack(
+                        "<HHIIHH", body[:16]
+                    )
+                    if format_tag == 0xFFFE:  # WAVE_FORMAT_EXTENSIBLE, le vrai format est dans le GUID
+                        format_tag = struct.unpack("<H", body[24:26])[0]
+                    layout = (format_tag, channels, file_rate, bits)
+                elif chunk_id == b"data":
+                    if layout is None:
+                        raise ValueError("data chunk before fmt chunk")
+                    return (*layout, f.tell(), chunk_size)
+                else:
+                    f.seek(chunk_size + (chunk_size & 1), os.SEEK_CUR)
+
+    def read(self, out: np.ndarray) -> int:
+        count = min(out.shape[1], self.frames - self.position)
+        block = self.samples[self.position:self.position + count]
+
+        np.multiply(block[:, 0], self.scale, out=out[0, :count], casting="same_kind")
+        np.multiply(
+            block[:, min(1, self.channels - 1)],
+            self.scale,
+            out=out[1, :count],
+            casting="same_kind",
+        )
+
+        self.position += count
+        return count
+
+    def seek(self, frame: int) -> None:
+        self.position = max(0, min(frame, self.frames))
+
+    def close(self) -> None:
+        self.samples = None  # La projection est libérée avec le dernier tableau qui la référence
+
+
+class PedalboardDecoder(Decoder):
+    """
+    PedalboardDecoder - Lecture des formats compressés (mp3, flac, ogg...) avec pedalboard
+    Le fichier est rééchantillonné à la volée si sa fréquence diffère de celle du moteur.
+    """
+
+    def __init__(self, path: str, sample_rate: int) -> None:
+        super().__init__(path, sample_rate)
+
+        from pedalboard.io import AudioFile  # Dépendance lourde, chargée seulement si nécessaire
+
+        self.file = AudioFile(path).resampled_to(sample_rate)
+        self.channels = self.file.num_channels
+
+    def read(self, out: np.ndarray) -> int:
+        data = self.file.read(out.shape[1])
+        count = data.shape[1]
+
+        out[0, :count] = data[0]
+        out[1, :count] = data[min(1, self.channels - 1)]
+        return count
+
+    def seek(self, frame: int) -> None:
+        self.file.seek(frame)
+
+    def close(self) -> None:
+        self.file.close()
+
+
+# Décodeurs essayés dans l'ordre pour chaque extension
+DECODERS: dict[str, list[type[Decoder]]] = {
+    ".wav": [WavDecoder, PedalboardDecoder],
+    ".aiff": [PedalboardDecoder],
+    ".flac": [PedalboardDecoder],
+    ".mp3": [PedalboardDecoder],
+    ".ogg": [PedalboardDecoder],
+}
+
+
+def register_decoder(extension: str, decoder_class: type[Decoder]) -> None:
+    """
+    register_decoder - Ajouter un décodeur prioritaire pour une extension de fichier
+    ---
+    params:
+        - extension: str = Extension gérée, par exemple ".opus"
+        - decoder_class: type[Decoder] = Classe du décodeur
+    """
+
+    DECODERS.setdefault(extension.lower(), []).insert(0, decoder_class)
+
+
+def resolve_path(filepath: str) -> str | None:
+    """
+    resolve_path - Trouver un fichier lisible pour filepath
+    Si le fichier n'existe pas, un fichier du même nom avec une autre extension décodable est utilisé.
+    """
+
+    if os.path.isfile(filepath):
+        return filepath
+
+    stem = os.path.splitext(filepath)[0]
+    for extension in DECODERS:
+        if os.path.isfile(stem + extension):
+            logger.warn(f"{filepath} not found, using {stem + extension}")
+            return stem + extension
+
+    directory, name = os.path.split(stem)
+    if os.path.isdir(directory or "."):
+        for candidate in sorted(os.listdir(directory or ".")):
+            if os.path.splitext(candidate)[0] == name:
+                logger.error(
+                    f"{filepath} not found and no decoder registered for {candidate}"
+                )
+    return None
+
+
+def open_decoder(path: str, sample_rate: int) -> Decoder:
+    """
+    open_decoder - Ouvrir path avec le premier décodeur compatible
+    """
+
+    errors = []
+    for decoder_class in DECODERS.get(os.path.splitext(path)[1].lower(), []):
+        try:
+            return decoder_class(path, sample_rate)
+        except Exception as e:
+            errors.append(f"{decoder_class.__name__}: {e}")
+
+    raise ValueError(f"No decoder could open {path} ({'; '.join(errors) or 'unknown format'})")
+
+
+class StreamSource:
+    """
+    StreamSource - Source audio lue en continu par un thread dans un tampon circulaire
+
+    Le thread de lecture est le seul à écrire dans le tampon et à avancer written,
+    le callback audio est le seul à le lire et à avancer consumed.
+    Sans thread (rendu hors temps réel), le décodage se fait à la demande dans mix.
+    """
+
+    def __init__(
+        self,
+        path: str,
+        sample_rate: int,
+        block_size: int,
+        loop: bool = False,
+        blocks_ahead: int = 16,
+        threaded: bool = True,
+    ) -> None:
+        self.path = path
+        self.sample_rate = sample_rate
+        self.block_size = block_size
+        self.loop = loop
+        self.threaded = threaded
+
+        self.capacity = block_size * blocks_ahead
+        self.ring = np.zeros((2, self.capacity), dtype=np.float32)
+        self.chunk = np.zeros((2, block_size), dtype=np.float32)
+        self.written = 0
+        self.consumed = 0
+        self.underruns = 0
+
+        self.decoder: Decoder | None = None
+        self.rewound = False
+        self.finished = False  # Le décodeur n'écrira plus rien
+        self.running = True
+        self.wakeup = threading.Event()
+
+        if threaded:
+            self.thread = threading.Thread(
+                target=self._fill, name=f"audio-stream {path}", daemon=True
+            )
+            self.thread.start()
+
+    @property
+    def drained(self) -> bool:
+        """
+        drained - Le flux est terminé et tout ce qui a été décodé a été joué
+        """
+
+        return self.finished and self.consumed == self.written
+
+    def _open(self) -> bool:
+        """
+        _open - Ouvrir le décodeur, le flux est terminé en cas d'échec
+        """
+
+        try:
+            self.decoder = open_decoder(self.path, self.sample_rate)
+            return True
+        except Exception as e:
+            logger.error(f"Error streaming {self.path}: {e}")
+            self.finished = True
+            return False
+
+    def _fill_once(self) -> None:
+        """
+        _fill_once - Décoder un bloc à la suite du tampon circulaire
+        """
+
+        count = self.decoder.read(self.chunk)
+        if count == 0:
+            # Un fichier vide ne doit pas boucler indéfiniment
+            if self.loop and not self.rewound:
+                self.decoder.seek(0)
+                self.rewound = True
+            else:
+                self.finished = True
+            return
+        self.rewound = False
+
+        for ring, part in ring_spans(self.written % self.capacity, count, self.capacity):
+            self.ring[:, ring] = self.chunk[:, part]
+        self.written += count
+
+    def _fill(self) -> None:
+        """
+        _fill - Boucle du thread de lecture, garde le tampon circulaire rempli
+        """
+
+        if not self._open():
+            return
+
+        poll = self.block_size / self.sample_rate
+
+        try:
+            while self.running and not self.finished:
+                if self.capacity - (self.written - self.consumed) < self.block_size:
+                    self.wakeup.wait(poll)
+                    continue
+                self._fill_once()
+        except Exception as e:
+            logger.error(f"Error streaming {self.path}: {e}")
+        finally:
+            self.finished = True
+            self.decoder.close()
+
+    def _fill_now(self, frames: int) -> None:
+        """
+        _fill_now - Décoder immédiatement de quoi fournir frames échantillons (mode sans thread)
+        """
+
+        if self.decoder is None and not self.finished:
+            self._open()
+
+        try:
+            while not self.finished and self.written - self.consumed < frames:
+                self._fill_once()
+        except Exception as e:
+            logger.error(f"Error streaming {self.path}: {e}")
+            self.finished = True
+
+    def mix(self, mixed: np.ndarray, gain: float, scratch: np.ndarray) -> int:
+        """
+        mix - Ajouter le prochain bloc décodé au bus de mixage
+        ---
+        params:
+            - mixed: np.ndarray = Bus de mixage (2, frames)
+            - gain: float = Volume de la voix
+            - scratch: np.ndarray = Tampon de travail d'au moins frames éléments
+        Retourne le nombre de frames mixées
+        """
+
+        frames = mixed.shape[1]
+        if not self.threaded:
+            self._fill_now(frames)
+
+        count = min(frames, self.written - self.consumed)
+
+        for ring, part in ring_spans(self.consumed % self.capacity, count, self.capacity):
+            length = part.stop - part.start
+            for channel in range(2):
+                np.multiply(self.ring[channel, ring], gain, out=scratch[:length])
+                mixed[channel, part] += scratch[:length]
+
+        self.consumed += count
+        if count < frames and not self.finished:
+            self.underruns += 1
+        return count
+
+    def close(self) -> None:
+        """
+        close - Arrêter le thread de lecture
+        """
+
+        self.running = False
+        self.wakeup.set()
+
+        if not self.threaded and self.decoder is not None:
+            self.decoder.close()
+            self.decoder = None
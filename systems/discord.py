@@ -7,6 +7,8 @@ EwoFluffy - BrokeTeam - 2025
 import discordrpc
 from discordrpc.utils import timestamp
 
+from systems.logging import Logger
+
 DISCORD_APPLICATION_ID = 1425483708424650772
 START_TIMESTAMP = timestamp
 
@@ -16,8 +18,22 @@ class DiscordRPC:
     DiscordRPC - Classe gérante de l'intégration du status Discord depuis le jeu
     """
 
-    def __init__(self) -> None:
-        self.rpc = discordrpc.RPC(app_id=DISCORD_APPLICATION_ID)
+    def __init__(self, enabled: bool = True) -> None:
+        """
+        params:
+            - enabled: bool = Se connecter à Discord (désactivé en mode sans affichage)
+        """
+
+        self.logger = Logger("systems.discord")
+        self.rpc = None
+
+        if not enabled:
+            return
+
+        try:
+            self.rpc = discordrpc.RPC(app_id=DISCORD_APPLICATION_ID)
+        except Exception as e:
+            self.logger.warn(f"Discord rich presence disabled: {e}")
 
     def set_rich_presence(self, title: str, text: str) -> None:
         """
@@ -28,4 +44,5 @@ class DiscordRPC:
             - text: str = Text du status
         """
 
-        self.rpc.set_activity(state=text, details=title, ts_start=START_TIMESTAMP)
+        if self.rpc is not None:
+            self.rpc.set_activity(state=text, details=title, ts_start=START_TIMESTAMP)
@@ -0,0 +1,165 @@
+"""
+systems.gl_resources - Registre des objets OpenGL du RenderDevice
+
+Contenu:
+
+Classe GLResource
+Classe GLRegistry
+
+Chaque objet créé par le moteur de rendu (programme, buffer, texture, framebuffer...) est
+enregistré avec un ou plusieurs propriétaires. Un objet partagé n'est libéré que lorsque son
+dernier propriétaire le rend : une scène qui devient inactive rend ses cibles de rendu sans
+toucher à celles encore utilisées ailleurs. Le registre compte les objets vivants et leur
+mémoire, par type et par propriétaire.
+
+EwoFluffy - BrokeTeam - 2025
+"""
+
+from dataclasses import dataclass, field
+from typing import Callable
+
+import moderngl
+
+from systems.logging import Logger
+
+# Taille d'une composante selon le dtype moderngl des textures et renderbuffers
+COMPONENT_BYTES: dict[str, int] = {"f1": 1, "u1": 1, "i1": 1, "f2": 2, "u2": 2, "i2": 2, "f4": 4, "u4": 4, "i4": 4}
+
+
+def resource_bytes(obj) -> int:
+    """
+    resource_bytes - Mémoire occupée par un objet OpenGL, 0 si elle n'est pas connue
+    (programmes, vertex arrays et framebuffers, dont les attachements sont comptés à part)
+    """
+
+    if isinstance(obj, moderngl.Buffer):
+        return obj.size
+    if isinstance(obj, (moderngl.Texture, moderngl.Renderbuffer)):
+        return obj.width * obj.height * obj.components * COMPONENT_BYTES.get(obj.dtype, 4)
+    return 0
+
+
+@dataclass
+class GLResource:
+    """
+    GLResource - Objet OpenGL enregistré et les propriétaires qui le gardent en vie
+    """
+    obj: object
+    kind: str
+    nbytes: int
+    owners: set[str] = field(default_factory=set)
+    on_release: Callable[[], None] | None = None  # Retirer l'objet d'un cache par exemple
+
+
+class GLRegistry:
+    """
+    GLRegistry - Objets OpenGL vivants, libérés explicitement par propriétaire
+    """
+
+    def __init__(self) -> None:
+        self.logger = Logger("systems.gl_resources")
+
+        # Indexé par id(obj) : les objets moderngl ne sont pas tous hashables
+        self.resources: dict[int, GLResource] = {}
+
+        self.created = 0
+        self.released = 0
+
+    def track(self, obj, owner: str, on_release: Callable[[], None] | None = None):
+        """
+        track - Enregistrer un objet (ou ajouter un propriétaire à un objet déjà enregistré)
+        Retourne l'objet, pour écrire self.resources.track(ctx.buffer(...), "owner")
+        ---
+        params:
+            - obj = Objet moderngl (Program, Buffer, Texture, Framebuffer, VertexArray, Query...)
+            - owner: str = Propriétaire qui garde l'objet en vie ("device", "scene:level"...)
+            - on_release: Callable | None = Appelé quand l'objet est libéré (enregistrement seulement)
+        """
+
+        resource = self.resources.get(id(obj))
+        if resource is None:
+            resource = GLResource(obj, type(obj).__name__, resource_bytes(obj), on_release=on_release)
+            self.resources[id(obj)] = resource
+            self.created += 1
+
+        resource.owners.add(owner)
+        return obj
+
+    def release(self, obj) -> None:
+        """
+        release - Libérer un objet immédiatement, quels que soient ses propriétaires
+        """
+
+        resource = self.resources.pop(id(obj), None)
+        if resource is None:
+            return
+
+        # Les requêtes (moderngl.Query) n'ont pas de release, le contexte les libère avec lui
+        release = getattr(resource.obj, "release", None)
+        if release is not None:
+            release()
+        self.released += 1
+        if resource.on_release is not None:
+            resource.on_release()
+
+    def release_owner(self, owner: str) -> int:
+        """
+        release_owner - Retirer un propriétaire et libérer les objets qu'il était le dernier à garder
+        Les objets sont libérés du plus récent au plus ancien (vertex arrays avant leurs buffers).
+        Retourne le nombre d'objets libérés
+        """
+
+        released = 0
+        for resource in reversed(list(self.resources.values())):
+            if owner not in resource.owners:
+                continue
+
+            resource.owners.discard(owner)
+            if not resource.owners:
+                self.release(resource.obj)
+                released += 1
+
+        if released:
+            self.logger.log(f"Released {released} GL objects owned by {owner}")
+        return released
+
+    def release_all(self) -> None:
+        for resource in reversed(list(self.resources.values())):
+            self.release(resource.obj)
+
+    def owners(self) -> set[str]:
+        return set().union(*(resource.owners for resource in self.resources.values()))
+
+    def counts(self, owner: str | None = None) -> dict[str, tuple[int, int]]:
+        """
+        counts - Nombre d'objets vivants et octets par type, pour un propriétaire ou pour tous
+        """
+
+        counts: dict[str, tuple[int, int]] = {}
+        for resource in self.resources.values():
+            if owner is not None and owner not in resource.owners:
+                continue
+            count, nbytes = counts.get(resource.kind, (0, 0))
+            counts[resource.kind] = (count + 1, nbytes + resource.nbytes)
+        return counts
+
+    @property
+    def nbytes(self) -> int:
+        return sum(resource.nbytes for resource in self.resources.values())
+
+    def report(self) -> str:
+        """
+        report - Tableau des objets vivants par type puis par propriétaire
+        """
+
+        lines = [
+            f"{len(self.resources)} GL objects alive, {self.nbytes / 2**20:.2f} MiB "
+            f"({self.created} created, {self.released} released)"
+        ]
+        for kind, (count, nbytes) in sorted(self.counts().items()):
+            lines.append(f"  {kind:<14} {count:>5} {nbytes / 2**20:>9.2f} MiB")
+        for owner in sorted(self.owners()):
+            count = sum(count for count, _ in self.counts(owner).values())
+            nbytes = sum(nbytes for _, nbytes in self.counts(owner).values())
+            lines.append(f"  [{owner}] {count} objects, {nbytes / 2**20:.2f} MiB")
+        return "\n".join(lines)
@@ -0,0 +1,181 @@
+"""
+systems.gpu_timer - Mesure du temps GPU des étapes du rendu
+
+Contenu:
+
+Classe SectionStats
+Classe GpuTimer
+
+Chaque section (envoi de la surface, étape de post-traitement, affichage final) est entourée d'une
+requête OpenGL GL_TIME_ELAPSED. Lire une requête de la frame en cours bloquerait le CPU jusqu'à
+ce que le GPU ait fini : les résultats sont lus avec latency frames de retard, quand le GPU
+les a déjà produits. Le temps CPU passé à soumettre chaque section est mesuré en même temps,
+ce qui permet de distinguer une frame limitée par le CPU d'une frame limitée par le GPU.
+
+EwoFluffy - BrokeTeam - 2025
+"""
+
+import time
+from collections import deque
+from contextlib import contextmanager
+
+import moderngl
+import numpy as np
+
+from systems.gl_resources import GLRegistry
+from systems.logging import Logger
+
+# Valeur renvoyée par certains pilotes (llvmpipe) pour une requête jamais aboutie
+INVALID_ELAPSED = 0xFFFFFFFF
+
+
+class SectionStats:
+    """
+    SectionStats - Dernières mesures d'une section, en millisecondes
+    """
+
+    def __init__(self, window: int) -> None:
+        self.gpu: deque[float] = deque(maxlen=window)
+        self.cpu: deque[float] = deque(maxlen=window)
+
+    def summary(self) -> dict[str, float]:
+        """
+        summary - Moyenne et 95e centile des temps GPU et CPU de la fenêtre
+        """
+
+        gpu, cpu = np.array(self.gpu or [0.0]), np.array(self.cpu or [0.0])
+        return {
+            "gpu_mean": float(gpu.mean()),
+            "gpu_p95": float(np.percentile(gpu, 95)),
+            "cpu_mean": float(cpu.mean()),
+            "cpu_p95": float(np.percentile(cpu, 95)),
+        }
+
+
+class GpuTimer:
+    """
+    GpuTimer - Requêtes de temps GPU par section, lues sans attendre le GPU
+
+    Les requêtes sont réutilisées : chaque frame a son propre jeu, recyclé latency frames plus tard.
+    Une section nommée plusieurs fois dans une frame (flou horizontal puis vertical) est additionnée.
+    """
+
+    def __init__(
+        self,
+        ctx: moderngl.Context,
+        latency: int = 3,
+        window: int = 120,
+        resources: GLRegistry | None = None,
+    ) -> None:
+        """
+        params:
+            - ctx: moderngl.Context = Contexte OpenGL du jeu
+            - latency: int = Nombre de frames entre une mesure et sa lecture
+            - window: int = Nombre de frames gardées dans les statistiques de chaque section
+            - resources: GLRegistry | None = Registre du device, les requêtes y sont gardées par "device"
+        """
+
+        self.logger = Logger("systems.gpu_timer")
+
+        self.ctx = ctx
+        self.resources = resources
+        self.latency = max(1, latency)
+        self.window = window
+
+        # Un jeu de requêtes par frame en vol, et le (nom, temps CPU en ms) de chaque section mesurée
+        self.queries: list[list[moderngl.Query]] = [[] for _ in range(self.latency + 1)]
+        self.sections: list[list[tuple[str, float]]] = [[] for _ in range(self.latency + 1)]
+        self.frame = 0
+
+        self.stats: dict[str, SectionStats] = {}
+
+        self.logger.log(f"GPU timing enabled, results read {self.latency} frames late")
+
+    @property
+    def slot(self) -> int:
+        return self.frame % len(self.queries)
+
+    def begin_frame(self) -> None:
+        """
+        begin_frame - Passer à la frame suivante et lire les requêtes de la plus ancienne frame en vol
+        """
+
+        self.frame += 1
+        slot = self.slot
+
+        # Ce jeu a été rempli il y a latency + 1 frames, le GPU a eu le temps de le terminer
+        totals: dict[str, list[float]] = {}
+        for query, (name, cpu) in zip(self.queries[slot], self.sections[slot]):
+            elapsed = query.elapsed
+            if elapsed >= INVALID_ELAPSED:
+                continue
+            total = totals.setdefault(name, [0.0, 0.0])
+            total[0] += elapsed / 1e6
+            total[1] += cpu
+
+        if totals:
+            totals["frame"] = [
+                sum(gpu for gpu, _ in totals.values()),
+                sum(cpu for _, cpu in totals.values()),
+            ]
+        for name, (gpu, cpu) in totals.items():
+            stats = self.stats.setdefault(name, SectionStats(self.window))
+            stats.gpu.append(gpu)
+            stats.cpu.append(cpu)
+
+        self.sections[slot].clear()
+
+    @contextmanager
+    def section(self, name: str):
+        """
+        section - Mesurer les commandes GL soumises dans le bloc with
+        Les sections ne doivent pas être imbriquées (une seule requête de temps active à la fois).
+        """
+
+        slot = self.slot
+        index = len(self.sections[slot])
+        if index == len(self.queries[slot]):
+            query = self.ctx.query(time=True)
+            if self.resources is not None:
+                self.resources.track(query, "device")
+            self.queries[slot].append(query)
+        query = self.queries[slot][index]
+
+        start = time.perf_counter()
+        with query:
+            yield
+        self.sections[slot].append((name, (time.perf_counter() - start) * 1000))
+
+    def summary(self) -> dict[str, dict[str, float]]:
+        """
+        summary - Statistiques de chaque section, "frame" étant la somme de toutes les sections
+        """
+
+        names = sorted(self.stats, key=lambda name: name == "frame")  # La somme en dernier
+        return {name: self.stats[name].summary() for name in names}
+
+    def report(self) -> str:
+        """
+        report - Tableau lisible des statistiques, une ligne par section
+        """
+
+        lines = [f"{'section':<12} {'GPU ms':>8} {'p95':>8} {'CPU ms':>8} {'p95':>8}"]
+        for name, values in self.summary().items():
+            lines.append(
+                f"{name:<12} {values['gpu_mean']:>8.3f} {values['gpu_p95']:>8.3f} "
+                f"{values['cpu_mean']:>8.3f} {values['cpu_p95']:>8.3f}"
+            )
+        return "\n".join(lines)
+
+    def release(self) -> None:
+        """
+        release - Retirer les requêtes du registre et les oublier, moderngl les libère avec le contexte
+        """
+
+        for queries in self.queries:
+            if self.resources is not None:
+                for query in queries:
+                    self.resources.release(query)
+            queries.clear()
+        for sections in self.sections:
+            sections.clear()
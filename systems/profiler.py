@@ -0,0 +1,199 @@
+"""
+systems.profiler - Profileur des phases de chaque frame, exporté en trace Chrome / Perfetto
+
+Contenu:
+
+Classe NullZone
+Classe Zone
+Classe Profiler
+
+Chaque phase (évènements, ticks de simulation, dessin, envoi au GPU, affichage...) est une zone
+nommée, ouverte avec un bloc with ; les zones peuvent être imbriquées depuis les scènes et les
+entités. Les mesures sont écrites dans un buffer circulaire alloué au démarrage (aucune allocation
+par frame) et exportées à la demande au format JSON des traces Chrome, lisible dans
+chrome://tracing ou ui.perfetto.dev. Désactivé, zone retourne un objet vide partagé.
+
+EwoFluffy - BrokeTeam - 2025
+"""
+
+import json
+import os
+import threading
+import time
+
+from systems.logging import Logger
+
+
+class NullZone:
+    """
+    NullZone - Zone sans effet, retournée quand le profileur est désactivé
+    """
+
+    __slots__ = ()
+
+    def __enter__(self) -> None:
+        return None
+
+    def __exit__(self, *exc) -> None:
+        return None
+
+
+NULL_ZONE = NullZone()
+
+
+class Zone:
+    """
+    Zone - Zone nommée réutilisable : une instance par nom, la pile d'imbrication est au Profiler
+    """
+
+    __slots__ = ("profiler", "name_id")
+
+    def __init__(self, profiler: "Profiler", name_id: int) -> None:
+        self.profiler = profiler
+        self.name_id = name_id
+
+    def __enter__(self) -> None:
+        self.profiler.stack.append(time.perf_counter_ns())
+
+    def __exit__(self, *exc) -> None:
+        profiler = self.profiler
+        end = time.perf_counter_ns()
+        start = profiler.stack.pop()
+
+        slot = profiler.count % profiler.capacity
+        profiler.names[slot] = self.name_id
+        profiler.starts[slot] = start
+        profiler.ends[slot] = end
+        profiler.depths[slot] = len(profiler.stack)
+        profiler.count += 1
+
+
+class Profiler:
+    """
+    Profiler - Zones mesurées dans un buffer circulaire, les plus anciennes sont écrasées
+    Les zones ne sont mesurées que sur le thread qui a créé le profileur (boucle du jeu).
+    """
+
+    def __init__(
+        self, enabled: bool = False, capacity: int = 65536, directory: str = "profiles"
+    ) -> None:
+        """
+        params:
+            - enabled: bool = Mesurer les zones (sinon zone ne coûte qu'un appel de méthode)
+            - capacity: int = Nombre de zones gardées
+            - directory: str = Dossier des traces exportées
+        """
+
+        self.logger = Logger("systems.profiler")
+
+        self.enabled = enabled
+        self.capacity = max(1, capacity)
+        self.directory = directory
+        self.thread = threading.get_ident()
+        self.origin = time.perf_counter_ns()
+
+        # Buffer circulaire en colonnes, alloué une seule fois
+        self.names: list[int] = [0] * self.capacity
+        self.starts: list[int] = [0] * self.capacity
+        self.ends: list[int] = [0] * self.capacity
+        self.depths: list[int] = [0] * self.capacity
+        self.count = 0
+
+        self.stack: list[int] = []
+        self.zones: dict[str, Zone] = {}
+        self.zone_names: list[str] = []
+
+        if enabled:
+            self.logger.log(f"Profiler enabled, keeping the last {self.capacity} zones")
+
+    def zone(self, name: str) -> Zone | NullZone:
+        """
+        zone - Bloc with mesuré sous le nom name
+        ---
+        params:
+            - name: str = Nom de la zone, une chaîne constante de préférence ("update", "ball"...)
+        """
+
+        if not self.enabled or threading.get_ident() != self.thread:
+            return NULL_ZONE
+
+        zone = self.zones.get(name)
+        if zone is None:
+            zone = self.zones[name] = Zone(self, len(self.zone_names))
+            self.zone_names.append(name)
+        return zone
+
+    def records(self) -> list[tuple[str, int, int, int]]:
+        """
+        records - Zones gardées de la plus ancienne à la plus récente (par fin de zone)
+        Chaque zone est un tuple (nom, début en ns, fin en ns, profondeur d'imbrication)
+        """
+
+        kept = min(self.count, self.capacity)
+        first = self.count - kept
+        records = []
+        for index in range(first, self.count):
+            slot = index % self.capacity
+            name = self.zone_names[self.names[slot]]
+            records.append((name, self.starts[slot], self.ends[slot], self.depths[slot]))
+        return records
+
+    def trace(self) -> dict:
+        """
+        trace - Trace au format Chrome (évènements complets "X", temps en microsecondes)
+        """
+
+        pid = os.getpid()
+        events: list[dict] = [
+            {"name": "thread_name", "ph": "M", "pid": pid, "tid": 1, "args": {"name": "game loop"}}
+        ]
+        # Une zone est écrite à sa fin : les parents arrivent après leurs enfants
+        records = sorted(self.records(), key=lambda record: (record[1], record[3]))
+        for name, start, end, depth in records:
+            events.append(
+                {
+                    "name": name,
+                    "ph": "X",
+                    "ts": (start - self.origin) / 1000,
+                    "dur": (end - start) / 1000,
+                    "pid": pid,
+                    "tid": 1,
+                }
+            )
+        return {"traceEvents": events, "displayTimeUnit": "ms"}
+
+    def export(self, path: str | None = None) -> str:
+        """
+        export - Écrire la trace dans un fichier JSON et retourner son chemin
+        """
+
+        if path is None:
+            os.makedirs(self.directory, exist_ok=True)
+            path = os.path.join(self.directory, time.strftime("brokeout-%Y%m%d-%H%M%S.json"))
+
+        with open(path, "w", encoding="utf-8") as f:
+            json.dump(self.trace(), f)
+
+        dropped = max(0, self.count - self.capacity)
+        self.logger.success(
+            f"Profile of {min(self.count, self.capacity)} zones written to {path}"
+            + (f" ({dropped} older zones overwritten)" if dropped else "")
+        )
+        return path
+
+    def summary(self) -> dict[str, dict[str, float]]:
+        """
+        summary - Nombre d'appels, temps moyen et maximal (ms) de chaque zone gardée
+        """
+
+        totals: dict[str, list[float]] = {}
+        for name, start, end, _ in self.records():
+            total = totals.setdefault(name, [0, 0.0, 0.0])
+            duration = (end - start) / 1e6
+            total[0] += 1
+            total[1] += duration
+            total[2] = max(total[2], duration)
+        return {
+            name: {"calls": calls, "mean_ms": total / calls, "max_ms": peak}
+            for name, (calls, total, peak) in totals.items()
+        }
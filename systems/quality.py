@@ -0,0 +1,195 @@
+"""
+systems.quality - Qualité graphique adaptée au temps de calcul des frames
+
+Contenu:
+
+Classe QualityLevel
+Classe QualityChange
+Classe QualityGovernor
+
+Le gouverneur observe le temps de travail des dernières frames (sans l'attente de l'écran ni
+celle de clock.tick). Quand le budget de graphics.fps est dépassé, il baisse la qualité d'un
+niveau : chaîne de post-traitement à plus basse résolution (agrandie par le Renderer), traînée de
+la balle plus courte, puis shader crt désactivé. Il remonte d'un niveau quand il reste de la
+marge, avec des seuils et un délai différents pour ne pas osciller entre deux niveaux.
+
+Limite : les scènes dessinent toujours sur le CPU dans Game.window à la taille graphics.render,
+et cette image complète est envoyée au GPU à chaque frame. render_scale n'allège que le travail
+du GPU (shaders, cibles du sprite batch) ; sur une machine limitée par le CPU ou par l'envoi de
+texture, les niveaux medium et low gagnent surtout par la traînée plus courte et sans crt.
+
+EwoFluffy - BrokeTeam - 2025
+"""
+
+import time
+from collections import deque
+from dataclasses import dataclass
+
+from systems.config import config
+from systems.logging import Logger
+
+
+@dataclass(frozen=True)
+class QualityLevel:
+    """
+    QualityLevel - Réglages graphiques d'un niveau de qualité
+    """
+    name: str
+    # Résolution de la chaîne de post-traitement (pas celle du dessin des scènes ni de l'envoi)
+    render_scale: float = 1.0
+    trail_scale: float = 1.0  # Longueur de la traînée de la balle par rapport à la configuration
+    disabled_passes: tuple[str, ...] = ()  # Étapes de post-traitement ignorées
+
+
+# Du plus beau au plus rapide, le gouverneur se déplace d'un niveau à la fois
+QUALITY_LEVELS: list[QualityLevel] = [
+    QualityLevel("high"),
+    QualityLevel("medium", render_scale=0.75, trail_scale=0.5),
+    QualityLevel("low", render_scale=0.5, trail_scale=0.25, disabled_passes=("crt",)),
+]
+
+
+@dataclass(frozen=True)
+class QualityChange:
+    """
+    QualityChange - Changement de niveau enregistré par le gouverneur
+    """
+    frame: int
+    time: float  # Secondes depuis la création du gouverneur
+    previous: str
+    level: str
+    frame_time: float  # Temps de frame médian qui a déclenché le changement, en secondes
+    reason: str
+
+
+class QualityGovernor:
+    """
+    QualityGovernor - Choisir le niveau de qualité à partir d'une fenêtre glissante de temps de frame
+
+    Le niveau courant est lisible dans level / settings, l'historique des changements dans changes.
+    """
+
+    def __init__(
+        self, levels: list[QualityLevel] | None = None, fps: int | None = None
+    ) -> None:
+        """
+        params:
+            - levels: list[QualityLevel] | None = Niveaux du plus beau au plus rapide
+            - fps: int | None = Fréquence visée, graphics.fps par défaut (la fréquence de simulation
+              si l'affichage n'est pas limité)
+        """
+
+        self.logger = Logger("systems.quality")
+
+        settings = config.graphics.quality
+
+        self.levels: list[QualityLevel] = levels or QUALITY_LEVELS
+        self.budget: float = 1.0 / (fps or config.graphics.fps or config.engine.simulation.tick_rate)
+        self.adaptive: bool = settings.adaptive
+
+        self.downgrade: float = settings.downgrade  # Fraction du budget au-delà de laquelle on baisse
+        self.upgrade: float = settings.upgrade  # Fraction du budget en dessous de laquelle on remonte
+        self.upgrade_delay: int = settings.upgrade_delay  # Frames sous le seuil avant de remonter
+
+        self.samples: deque[float] = deque(maxlen=settings.window)
+        self.frame: int = 0
+        self.calm_frames: int = 0
+        self.backoff: int = 1  # Multiplie upgrade_delay après une remontée aussitôt annulée
+        self.last_upgrade: int | None = None
+        self.frame_time: float = 0.0
+        self.start_time: float = time.perf_counter()
+
+        self.changes: list[QualityChange] = []
+        self.level: int = self.index(settings.level)
+
+        self.logger.log(
+            f"Quality level {self.settings.name} ({'adaptive' if self.adaptive else 'fixed'}), "
+            f"budget {self.budget * 1000:.1f} ms"
+        )
+
+    @property
+    def settings(self) -> QualityLevel:
+        return self.levels[self.level]
+
+    @property
+    def trail_length(self) -> int:
+        """
+        trail_length - Nombre de positions gardées dans la traînée de la balle
+        """
+
+        return max(1, round(config.graphics.ball.trail_length * self.settings.trail_scale))
+
+    def index(self, name: str) -> int:
+        for index, level in enumerate(self.levels):
+            if level.name == name:
+                return index
+        raise ValueError(
+            f"Unknown quality level {name}, expected one of {[level.name for level in self.levels]}"
+        )
+
+    def set_level(self, level: int | str, reason: str = "requested") -> None:
+        """
+        set_level - Passer à un niveau de qualité, par son nom ou son indice
+        La fenêtre de mesure est vidée : les frames précédentes ne représentent plus le coût actuel.
+        """
+
+        if isinstance(level, str):
+            level = self.index(level)
+        level = max(0, min(level, len(self.levels) - 1))
+        if level == self.level:
+            return
+
+        change = QualityChange(
+            self.frame,
+            time.perf_counter() - self.start_time,
+            self.settings.name,
+            self.levels[level].name,
+            self.frame_time,
+            reason,
+        )
+        self.changes.append(change)
+        self.level = level
+
+        self.samples.clear()
+        self.calm_frames = 0
+
+        self.logger.warn(
+            f"Quality {change.previous} -> {change.level} ({reason}, "
+            f"median frame {change.frame_time * 1000:.1f} ms for a {self.budget * 1000:.1f} ms budget)"
+        )
+
+    def record(self, frame_time: float) -> None:
+        """
+        record - Ajouter le temps de travail d'une frame et changer de niveau si nécessaire
+        ---
+        params:
+            - frame_time: float = Durée de la frame en secondes, sans l'attente de l'écran
+              (flip avec synchronisation verticale) ni celle du limiteur de fps
+        """
+
+        self.frame += 1
+        self.samples.append(frame_time)
+
+        if not self.adaptive or len(self.samples) < self.samples.maxlen:
+            return
+
+        # Médiane : un pic isolé (chargement d'une scène) ne doit pas faire baisser la qualité
+        self.frame_time = sorted(self.samples)[len(self.samples) // 2]
+
+        if self.frame_time > self.budget * self.downgrade:
+            self.calm_frames = 0
+            if self.level < len(self.levels) - 1:
+                # Le niveau au dessus ne tient pas le budget : attendre plus longtemps avant d'y revenir
+                if (
+                    self.last_upgrade is not None
+                    and self.frame - self.last_upgrade <= 2 * self.samples.maxlen
+                ):
+                    self.backoff = min(self.backoff * 2, 32)
+                self.set_level(self.level + 1, "over budget")
+        elif self.frame_time < self.budget * self.upgrade:
+            self.calm_frames += 1
+            if self.calm_frames >= self.upgrade_delay * self.backoff and self.level > 0:
+                self.last_upgrade = self.frame
+                self.set_level(self.level - 1, "headroom")
+        else:
+            self.calm_frames = 0
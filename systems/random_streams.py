@@ -0,0 +1,73 @@
+"""
+systems.random_streams - Générateurs aléatoires séparés par sous système, issus d'une seule graine
+
+Contenu:
+
+Classe RandomStreams
+
+Chaque sous système (briques, rebonds de la balle, tremblement de l'écran, messages...) tire ses
+nombres dans son propre random.Random, dont la graine est dérivée de la graine de la partie et du
+nom du flux. Tirer un nombre de plus dans un flux (un effet visuel ajouté, une image dessinée en
+plus) ne décale donc pas les tirages des autres : une partie rejouée avec la même graine et les
+mêmes entrées redonne exactement les mêmes briques et les mêmes rebonds.
+
+EwoFluffy - BrokeTeam - 2025
+"""
+
+import random
+
+from systems.logging import Logger
+
+
+class RandomStreams:
+    """
+    RandomStreams - Flux aléatoires nommés, créés à la première utilisation
+    """
+
+    def __init__(self, seed: int | None = None) -> None:
+        """
+        params:
+            - seed: int | None = Graine de la partie, None pour une graine tirée au hasard
+        """
+
+        self.logger = Logger("systems.random_streams")
+
+        self.streams: dict[str, random.Random] = {}
+        self.seed(seed)
+
+    def seed(self, seed: int | None = None) -> int:
+        """
+        seed - Changer la graine de la partie et repartir du début de chaque flux
+        Retourne la graine utilisée (tirée au hasard si seed est None), à enregistrer pour rejouer
+        ---
+        params:
+            - seed: int | None = Nouvelle graine
+        """
+
+        self.value = seed if seed is not None else random.SystemRandom().getrandbits(32)
+        # Les flux déjà distribués restent les mêmes objets : seul leur état repart de zéro
+        for name, stream in self.streams.items():
+            stream.seed(self.derive(name))
+
+        self.logger.log(f"Random streams seeded with {self.value}")
+        return self.value
+
+    def derive(self, name: str) -> str:
+        """
+        derive - Graine du flux name (une chaîne : random la hache en SHA-512, stable entre versions)
+        """
+
+        return f"{self.value}:{name}"
+
+    def stream(self, name: str) -> random.Random:
+        """
+        stream - Générateur du flux name
+        ---
+        params:
+            - name: str = Nom du sous système ("bricks", "ball", "shake"...)
+        """
+
+        stream = self.streams.get(name)
+        if stream is None:
+            stream = self.streams[name] = random.Random(self.derive(name))
+        return stream
@@ -0,0 +1,222 @@
+"""
+systems.recorder - Enregistrement vidéo du jeu sans ralentir la boucle principale
+
+Contenu:
+
+Classe Recorder
+
+L'image finale est copiée par le GPU dans des pixel buffers utilisés à tour de rôle : la frame
+lue sur le CPU a été demandée plusieurs frames plus tôt, la lecture n'attend donc jamais le GPU.
+Les images passent ensuite par une file bornée à un thread qui les encode avec cv2.VideoWriter.
+Si l'encodeur ne suit pas, les images sont abandonnées (et comptées), jamais la boucle du jeu.
+
+EwoFluffy - BrokeTeam - 2025
+"""
+
+import os
+import queue
+import threading
+import time
+
+import moderngl
+import numpy as np
+
+from systems.logging import Logger
+
+
+class Recorder:
+    """
+    Recorder - Enregistreur vidéo de l'image finale d'un RenderDevice
+    Appeler capture une fois par frame, après le rendu et avant pygame.display.flip.
+    """
+
+    def __init__(
+        self,
+        device,
+        fps: int,
+        directory: str = "recordings",
+        codec: str = "mp4v",
+        queue_size: int = 8,
+        buffers: int = 3,
+    ) -> None:
+        """
+        params:
+            - device: RenderDevice = Device dont l'image finale (device.screen) est enregistrée
+            - fps: int = Fréquence de la vidéo
+            - directory: str = Dossier des vidéos
+            - codec: str = Code FourCC du codec (mp4v, MJPG, XVID...)
+            - queue_size: int = Images en attente d'encodage au maximum
+            - buffers: int = Pixel buffers utilisés à tour de rôle (latence de lecture en frames)
+        """
+
+        self.logger = Logger("systems.recorder")
+
+        self.device = device
+        self.fps = fps
+        self.directory = directory
+        self.codec = codec
+        self.buffer_count = max(2, buffers)
+
+        self.frames: queue.Queue = queue.Queue(maxsize=queue_size)
+        self.thread: threading.Thread | None = None
+        self.writer = None
+        self.path: str | None = None
+
+        self.size: tuple[int, int] = (0, 0)
+        self.buffers: list[moderngl.Buffer] = []
+        self.pending: list[bool] = []
+        self.index = 0
+
+        self.captured = 0
+        self.dropped = 0
+        self.written = 0
+
+    @property
+    def recording(self) -> bool:
+        return self.writer is not None
+
+    def toggle(self) -> None:
+        if self.recording:
+            self.stop()
+        else:
+            self.start()
+
+    def start(self, path: str | None = None) -> bool:
+        """
+        start - Ouvrir une vidéo et démarrer le thread d'encodage
+        Retourne False si la vidéo ne peut pas être ouverte (OpenCV absent, codec indisponible...)
+        """
+
+        if self.recording:
+            self.logger.warn("Recorder already running")
+            return True
+
+        try:
+            import cv2  # Dépendance lourde, chargée seulement pour enregistrer
+        except ImportError as e:
+            self.logger.error(f"Recording unavailable: {e}")
+            return False
+
+        self.size = tuple(self.device.screen.size)
+        if path is None:
+            os.makedirs(self.directory, exist_ok=True)
+            path = os.path.join(self.directory, time.strftime("brokeout-%Y%m%d-%H%M%S.mp4"))
+
+        writer = cv2.VideoWriter(path, cv2.VideoWriter_fourcc(*self.codec), self.fps, self.size)
+        if not writer.isOpened():
+            self.logger.error(f"Could not open {path} with codec {self.codec}")
+            return False
+
+        # RGBA : format natif du framebuffer, copié sans conversion par le pilote
+        frame_bytes = self.size[0] * self.size[1] * 4
+        self.buffers = [
+            self.device.resources.track(self.device.ctx.buffer(reserve=frame_bytes), "recorder")
+            for _ in range(self.buffer_count)
+        ]
+        self.pending = [False] * self.buffer_count
+        self.index = 0
+        self.captured = self.dropped = self.written = 0
+
+        self.writer = writer
+        self.path = path
+        self.thread = threading.Thread(target=self._encode, name="recorder", daemon=True)
+        self.thread.start()
+
+        self.logger.success(f"Recording {self.size[0]}x{self.size[1]} at {self.fps} fps to {path}")
+        return True
+
+    def capture(self) -> None:
+        """
+        capture - Demander la copie de l'image finale et transmettre celle demandée le plus tôt
+        """
+
+        if not self.recording:
+            return
+
+        slot = self.index % self.buffer_count
+        if self.pending[slot]:
+            self._collect(slot)
+
+        # Copie asynchrone côté GPU vers le pixel buffer, sans attendre
+        self.device.screen.read_into(
+            self.buffers[slot], viewport=(0, 0, *self.size), components=4, alignment=4
+        )
+        self.pending[slot] = True
+        self.index += 1
+        self.captured += 1
+
+    def _collect(self, slot: int) -> None:
+        """
+        _collect - Lire un pixel buffer rempli plusieurs frames plus tôt et le mettre dans la file
+        """
+
+        self.pending[slot] = False
+
+        # Vérifié avant la lecture : une image abandonnée ne coûte pas de copie
+        if self.frames.full():
+            self.dropped += 1
+            return
+
+        try:
+            self.frames.put_nowait(self.buffers[slot].read())
+        except queue.Full:
+            self.dropped += 1
+
+    def _encode(self) -> None:
+        """
+        _encode - Boucle du thread d'encodage : retourner, convertir en BGR et écrire chaque image
+        """
+
+        import cv2
+
+        width, height = self.size
+        while (data := self.frames.get()) is not None:
+            frame = np.frombuffer(data, dtype=np.uint8).reshape(height, width, 4)
+            # OpenGL lit la ligne du bas en premier et en RGBA, OpenCV attend le haut et du BGR
+            self.writer.write(cv2.cvtColor(frame[::-1], cv2.COLOR_RGBA2BGR))
+            self.written += 1
+
+    def stop(self) -> dict[str, int]:
+        """
+        stop - Transmettre les images encore dans les pixel buffers, finir l'encodage et fermer
+        Retourne les compteurs de l'enregistrement (stats)
+        """
+
+        if not self.recording:
+            return self.stats()
+
+        for offset in range(self.buffer_count):
+            slot = (self.index + offset) % self.buffer_count
+            if self.pending[slot]:
+                self._collect(slot)
+
+        self.frames.put(None)  # Attend une place : l'encodeur vide la file
+        self.thread.join()
+        self.writer.release()
+        self.writer = None
+
+        self.device.resources.release_owner("recorder")
+        self.buffers = []
+
+        stats = self.stats()
+        report = (
+            f"Recording saved to {self.path}: {stats['written']} frames written, "
+            f"{stats['dropped']} dropped out of {stats['captured']}"
+        )
+        if stats["dropped"]:
+            self.logger.warn(report)
+        else:
+            self.logger.success(report)
+        return stats
+
+    def stats(self) -> dict[str, int]:
+        """
+        stats - Images capturées, abandonnées (encodeur en retard) et écrites, file actuelle
+        """
+
+        return {
+            "captured": self.captured,
+            "dropped": self.dropped,
+            "written": self.written,
+            "queued": self.frames.qsize(),
+        }
@@ -4,14 +4,605 @@ systems.renderer - Moteur de rendu de BrokeEngine
 EwoFluffy - BrokeTeam - 2025
 """
 
+import hashlib
+import sys
 import time
+from contextlib import contextmanager
+from dataclasses import dataclass, field
 
 import moderngl
 import numpy as np
 import pygame
 
 from core.context import Context
+from systems.gl_resources import GLRegistry
+from systems.gpu_timer import GpuTimer
 from systems.logging import Logger
+from systems.profiler import Profiler
+
+VERTEX_SHADER = """
+#version 330 core
+
+// Les textures (surfaces pygame comme cibles de rendu) sont stockées ligne du haut en premier :
+// l'axe vertical n'est inversé que pour le dessin à l'écran
+uniform bool flip_y = true;
+
+in vec2 in_vert;
+out vec2 v_texcoord;
+
+void main() {
+    v_texcoord = (in_vert + 1.0) / 2.0;
+    if (flip_y) {
+        v_texcoord.y = 1.0 - v_texcoord.y;
+    }
+    gl_Position = vec4(in_vert, 0.0, 1.0);
+}
+"""
+
+# Utilisé quand aucun shader n'est demandé (ou debug.shaders désactivé)
+PASSTHROUGH_SHADER = """
+#version 330 core
+
+uniform sampler2D iChannel0;
+
+in vec2 v_texcoord;
+out vec4 fragColor;
+
+void main() {
+    fragColor = texture(iChannel0, v_texcoord);
+}
+"""
+
+
+# Rectangles et cercles instanciés : une instance = rectangle en pixels + couleur RGBA
+SPRITE_VERTEX_SHADER = """
+#version 330 core
+
+uniform vec2 resolution;
+
+in vec2 in_vert;
+in vec4 in_rect;
+in vec4 in_color;
+
+out vec4 v_color;
+out vec2 v_local;
+
+void main() {
+    vec2 pixel = in_rect.xy + (in_vert + 1.0) / 2.0 * in_rect.zw;
+    v_color = in_color;
+    v_local = in_vert;
+    // Pixel (0, 0) en haut à gauche, écrit en première ligne de la cible comme une surface pygame
+    gl_Position = vec4(pixel / resolution * 2.0 - 1.0, 0.0, 1.0);
+}
+"""
+
+SPRITE_FRAGMENT_SHADERS = {
+    "rect": """
+    #version 330 core
+
+    in vec4 v_color;
+    in vec2 v_local;
+    out vec4 fragColor;
+
+    void main() {
+        fragColor = v_color;
+    }
+    """,
+    "circle": """
+    #version 330 core
+
+    in vec4 v_color;
+    in vec2 v_local;
+    out vec4 fragColor;
+
+    void main() {
+        if (dot(v_local, v_local) > 1.0) {
+            discard;
+        }
+        fragColor = v_color;
+    }
+    """,
+}
+
+
+# Filtre de texture utilisé pour agrandir l'image à la taille de la fenêtre
+UPSCALE_FILTERS: dict[str, int] = {
+    "nearest": moderngl.NEAREST,
+    "bilinear": moderngl.LINEAR,
+    "integer": moderngl.NEAREST,  # Facteur entier uniquement, bandes noires autour de l'image
+}
+
+
+def fit_viewport(
+    window: tuple[int, int], resolution: tuple[int, int], integer: bool = False
+) -> tuple[int, int, int, int]:
+    """
+    fit_viewport - Zone de la fenêtre où afficher une image de taille resolution sans la déformer
+    ---
+    params:
+        - window: tuple = Taille de la fenêtre
+        - resolution: tuple = Taille de l'image rendue
+        - integer: bool = Limiter l'agrandissement à un facteur entier (pixels tous identiques) ;
+          une fenêtre plus petite que l'image garde une réduction fractionnaire
+    Retourne (x, y, largeur, hauteur) en pixels, y compté depuis le haut de la fenêtre
+    """
+
+    scale = min(window[0] / resolution[0], window[1] / resolution[1])
+    # Sous x1, aucun facteur entier ne tient dans la fenêtre : l'image serait coupée
+    if integer and scale >= 1:
+        scale = int(scale)
+
+    width, height = round(resolution[0] * scale), round(resolution[1] * scale)
+    return (window[0] - width) // 2, (window[1] - height) // 2, width, height
+
+
+def create_standalone_context() -> moderngl.Context:
+    """
+    create_standalone_context - Contexte OpenGL sans fenêtre (benchmarks, mode sans affichage)
+    Sans serveur X, le contexte est créé avec EGL.
+    """
+
+    try:
+        return moderngl.create_standalone_context()
+    except Exception:
+        return moderngl.create_standalone_context(backend="egl")
+
+
+class RenderDevice:
+    """
+    RenderDevice - Contexte OpenGL unique du jeu et ressources partagées entre les scènes
+
+    Créé par Game.run une fois la fenêtre ouverte. Les programmes sont compilés une seule fois
+    par couple (nom du shader, empreinte du source) : changer de scène ne recompile rien.
+    """
+
+    def __init__(
+        self,
+        ctx: moderngl.Context | None = None,
+        resolution: tuple[int, int] | None = None,
+        upscale: str = "bilinear",
+        gpu_timing: bool = False,
+        screen: moderngl.Framebuffer | None = None,
+        profiler: Profiler | None = None,
+    ) -> None:
+        """
+        params:
+            - ctx: moderngl.Context | None = Contexte à utiliser, celui de la fenêtre par défaut
+            - resolution: tuple | None = Résolution de rendu des scènes, celle de la fenêtre par défaut
+            - upscale: str = Agrandissement vers la fenêtre : nearest, bilinear ou integer
+            - gpu_timing: bool = Mesurer le temps GPU de chaque section du rendu (systems.gpu_timer)
+            - screen: moderngl.Framebuffer | None = Cible de l'image finale, la fenêtre par défaut
+            - profiler: Profiler | None = Profileur du jeu, qui reçoit les zones du rendu
+        """
+
+        self.logger: Logger = Logger("systems.renderer.device")
+
+        self.ctx = ctx if ctx is not None else moderngl.create_context()
+        # Aucun objet n'est libéré par le ramasse-miettes : tout passe par le registre
+        self.ctx.gc_mode = None
+        self.resources: GLRegistry = GLRegistry()
+
+        # Quad plein écran partagé par tous les programmes
+        self.quad = self.resources.track(
+            self.ctx.buffer(
+                np.array([-1.0, -1.0, 1.0, -1.0, -1.0, 1.0, 1.0, 1.0], dtype="f4").tobytes()
+            ),
+            "device",
+        )
+
+        # Framebuffer lié à la création du device : la fenêtre, ou la cible d'un contexte autonome
+        self.screen = screen if screen is not None else self.ctx.detect_framebuffer()
+        self.headless: bool = screen is not None
+        if self.headless:
+            for attachment in self.screen.color_attachments:
+                self.resources.track(attachment, "device")
+            self.resources.track(self.screen, "device")
+
+        if upscale not in UPSCALE_FILTERS:
+            raise ValueError(f"Unknown upscale filter {upscale}, expected one of {list(UPSCALE_FILTERS)}")
+
+        # L'image à la résolution de rendu est agrandie dans cette zone de la fenêtre
+        # Un contexte autonome sans framebuffer lié annonce une taille nulle
+        window = self.screen.size if all(self.screen.size) else resolution or (1, 1)
+        self.resolution: tuple[int, int] = tuple(resolution or window)
+        self.upscale_filter: int = UPSCALE_FILTERS[upscale]
+        self.viewport: tuple[int, int, int, int] = fit_viewport(
+            window, self.resolution, upscale == "integer"
+        )
+        x, y, width, height = self.viewport
+        self.screen.viewport = (x, window[1] - y - height, width, height)
+
+        self.programs: dict[tuple[str, str], moderngl.Program] = {}
+        self.quad_arrays: dict[tuple[str, str], moderngl.VertexArray] = {}
+        self.textures: dict[tuple[tuple[int, int], int], moderngl.Texture] = {}
+        self.targets: dict[tuple[str, tuple[int, int]], moderngl.Framebuffer] = {}
+        self.batch: "SpriteBatch | None" = None
+        self.timer: GpuTimer | None = (
+            GpuTimer(self.ctx, resources=self.resources) if gpu_timing else None
+        )
+        self.profiler: Profiler = profiler if profiler is not None else Profiler()
+
+        # Deux pixel buffers utilisés à tour de rôle : le CPU remplit l'un pendant que
+        # le GPU copie encore l'autre dans la texture
+        self.pixel_buffers: list[moderngl.Buffer | None] = [None, None]
+        self.upload_index: int = 0
+
+        self.logger.success(f"OpenGL context created ({self.ctx.info['GL_RENDERER']})")
+
+    @classmethod
+    def create_headless(cls, size: tuple[int, int], **options) -> "RenderDevice":
+        """
+        create_headless - Device sans fenêtre : contexte autonome (EGL sans serveur X) et image
+        finale dessinée dans un framebuffer hors écran de la taille de la fenêtre, relu avec read_frame
+        """
+
+        ctx = create_standalone_context()
+        screen = ctx.framebuffer(color_attachments=[ctx.renderbuffer(tuple(size), 4)])
+        return cls(ctx, screen=screen, **options)
+
+    def read_frame(self) -> np.ndarray:
+        """
+        read_frame - Relire l'image finale (bandes comprises) en RGB, ligne du haut en premier
+        Bloque jusqu'à ce que le GPU ait fini la frame : à réserver aux captures et aux tests.
+        """
+
+        width, height = self.screen.size
+        data = self.screen.read(viewport=(0, 0, width, height), components=3, alignment=1)
+        return np.frombuffer(data, dtype=np.uint8).reshape(height, width, 3)[::-1].copy()
+
+    def to_render(self, position: tuple[int, int]) -> tuple[int, int]:
+        """
+        to_render - Convertir une position dans la fenêtre (souris) en position dans l'image rendue
+        """
+
+        x, y, width, height = self.viewport
+        return (
+            int((position[0] - x) * self.resolution[0] / width),
+            int((position[1] - y) * self.resolution[1] / height),
+        )
+
+    def timed(self, name: str):
+        """
+        timed - Bloc with mesuré par le profileur (temps CPU) et par le GpuTimer
+        Sans effet si les deux sont désactivés.
+        """
+
+        zone = self.profiler.zone(name)
+        if self.timer is None:
+            return zone
+        return self._timed(zone, name)
+
+    @contextmanager
+    def _timed(self, zone, name: str):
+        with zone, self.timer.section(name):
+            yield
+
+    def compile(self, name: str, vertex_src: str, fragment_src: str) -> moderngl.Program:
+        """
+        compile - Programme compilé une seule fois par nom et empreinte des sources
+        Un shader modifié sur le disque est recompilé sous une nouvelle clé.
+        """
+
+        key = (name, hashlib.sha1((vertex_src + fragment_src).encode()).hexdigest())
+
+        if key not in self.programs:
+            start = time.perf_counter()
+            self.programs[key] = self.resources.track(
+                self.ctx.program(vertex_shader=vertex_src, fragment_shader=fragment_src), "device"
+            )
+            self.logger.log(
+                f"Compiled shader '{name}' in {(time.perf_counter() - start) * 1000:.1f} ms"
+            )
+
+        return self.programs[key]
+
+    def program(self, shader_name: str = "") -> tuple[moderngl.Program, moderngl.VertexArray]:
+        """
+        program - Programme d'un shader plein écran et son VAO sur le quad partagé
+        ---
+        params:
+            - shader_name: str = Nom du shader dans le dossier "shaders/", "" pour aucun effet
+        """
+
+        if shader_name:
+            with open(f"shaders/{shader_name}.glsl", encoding="utf-8") as f:
+                fragment_src = f.read()
+        else:
+            fragment_src = PASSTHROUGH_SHADER
+
+        prog = self.compile(shader_name or "passthrough", VERTEX_SHADER, fragment_src)
+        key = (shader_name, prog.glo)
+
+        if key not in self.quad_arrays:
+            self.quad_arrays[key] = self.resources.track(
+                self.ctx.simple_vertex_array(prog, self.quad, "in_vert"), "device"
+            )
+
+        return prog, self.quad_arrays[key]
+
+    def texture(self, size: tuple[int, int], components: int) -> moderngl.Texture:
+        """
+        texture - Texture partagée d'une taille et d'un nombre de composantes donnés
+        Une seule scène est dessinée par frame, elles peuvent donc utiliser la même texture.
+        """
+
+        key = (tuple(size), components)
+
+        if key not in self.textures:
+            texture = self.resources.track(self.ctx.texture(key[0], components), "device")
+            texture.repeat_x = False
+            texture.repeat_y = False
+            self.textures[key] = texture
+
+        return self.textures[key]
+
+    def render_target(
+        self, name: str, size: tuple[int, int], owner: str = "device"
+    ) -> moderngl.Framebuffer:
+        """
+        render_target - Framebuffer RGBA hors écran partagé, identifié par un nom et une taille
+        ---
+        params:
+            - name: str = Nom de la cible (post0, post1, scene...)
+            - size: tuple = Taille de la cible
+            - owner: str = Propriétaire ajouté à la cible, libérée quand tous l'ont rendue
+        """
+
+        key = (name, tuple(size))
+
+        if key not in self.targets:
+            texture = self.ctx.texture(key[1], 4)
+            texture.repeat_x = False
+            texture.repeat_y = False
+            target = self.ctx.framebuffer(color_attachments=[texture])
+            self.targets[key] = target
+
+            # La texture est libérée après le framebuffer, qui retire alors la cible du cache
+            self.resources.track(texture, owner)
+            self.resources.track(target, owner, on_release=lambda: self.targets.pop(key, None))
+
+        target = self.targets[key]
+        self.resources.track(target.color_attachments[0], owner)
+        return self.resources.track(target, owner)
+
+    def sprite_batch(self) -> "SpriteBatch":
+        """
+        sprite_batch - Lot de primitives partagé, une seule scène dessine par frame
+        """
+
+        if self.batch is None:
+            self.batch = SpriteBatch(self)
+        return self.batch
+
+    @staticmethod
+    def surface_swizzle(surface: pygame.Surface) -> str:
+        """
+        surface_swizzle - Swizzle qui relit une surface 32 bits envoyée telle quelle en RGBA
+        ---
+        Chaque masque donne l'octet de la couleur dans un pixel, par exemple "BGR1" pour XRGB8888
+        (sans alpha) ou "BGRA" pour ARGB8888
+        """
+
+        swizzle = ""
+        for mask in surface.get_masks():
+            if not mask:
+                swizzle += "1"
+                continue
+            byte = (mask & -mask).bit_length() // 8
+            if sys.byteorder == "big":
+                byte = 3 - byte
+            swizzle += "RGBA"[byte]
+        return swizzle
+
+    def upload(self, surface: pygame.Surface) -> moderngl.Texture:
+        """
+        upload - Envoyer une surface pygame dans une texture partagée de même taille
+        ---
+        Les surfaces 32 bits sont copiées directement depuis leur mémoire, sans conversion,
+        dans un pixel buffer ; la texture est remplie depuis ce buffer côté GPU.
+        """
+
+        size = surface.get_size()
+        texture = self.texture(size, 4)
+
+        if surface.get_bitsize() == 32 and surface.get_pitch() == size[0] * 4:
+            swizzle = self.surface_swizzle(surface)
+            data = surface.get_buffer()  # Verrouille la surface tant que la vue existe
+        else:
+            swizzle = "RGBA"
+            with self.profiler.zone("upload:tobytes"):
+                data = pygame.image.tobytes(surface, "RGBA")
+
+        if texture.swizzle != swizzle:
+            texture.swizzle = swizzle
+
+        pbo = self.pixel_buffers[self.upload_index]
+        if pbo is None or pbo.size != size[0] * size[1] * 4:
+            if pbo is not None:
+                self.resources.release(pbo)
+            pbo = self.resources.track(
+                self.ctx.buffer(reserve=size[0] * size[1] * 4, dynamic=True), "device"
+            )
+            self.pixel_buffers[self.upload_index] = pbo
+
+        # Orpheliner le buffer évite d'attendre une copie encore en cours sur le GPU
+        with self.profiler.zone("upload:write"):
+            pbo.orphan()
+            pbo.write(data)
+            del data
+
+        with self.profiler.zone("upload:texture"):
+            texture.write(pbo)
+        self.upload_index = 1 - self.upload_index
+        return texture
+
+    def release(self) -> None:
+        """
+        release - Libérer toutes les ressources et le contexte
+        Les objets encore gardés par un autre propriétaire que le device sont signalés comme fuites.
+        """
+
+        if self.batch is not None:
+            self.batch.release()
+            self.batch = None
+        if self.timer is not None:
+            self.timer.release()
+
+        leaks = self.resources.owners() - {"device"}
+        if leaks:
+            self.logger.warn(f"GL objects still owned by {sorted(leaks)} at release")
+        self.logger.log(self.resources.report())
+        self.resources.release_all()
+
+        self.pixel_buffers = [None, None]
+        self.programs.clear()
+        self.quad_arrays.clear()
+        self.textures.clear()
+        self.targets.clear()
+        self.ctx.release()
+
+
+class SpriteBatch:
+    """
+    SpriteBatch - Rectangles et cercles accumulés pendant la frame, dessinés sur le GPU
+    Chaque type de primitive est dessiné en un seul appel instancié, quel que soit leur nombre.
+    """
+
+    def __init__(self, device: RenderDevice, capacity: int = 256) -> None:
+        self.device = device
+        self.offset: tuple[float, float] = (0, 0)
+
+        # Par instance : x, y, largeur, hauteur (pixels) puis couleur RGBA entre 0 et 1
+        self.instances: dict[str, np.ndarray] = {
+            kind: np.zeros((capacity, 8), dtype="f4") for kind in SPRITE_FRAGMENT_SHADERS
+        }
+        self.counts: dict[str, int] = dict.fromkeys(SPRITE_FRAGMENT_SHADERS, 0)
+
+        self.programs: dict[str, moderngl.Program] = {
+            kind: device.compile(f"sprite_{kind}", SPRITE_VERTEX_SHADER, fragment_src)
+            for kind, fragment_src in SPRITE_FRAGMENT_SHADERS.items()
+        }
+        self.buffers: dict[str, moderngl.Buffer] = {}
+        self.arrays: dict[str, moderngl.VertexArray] = {}
+
+    def clear(self, offset: tuple[float, float] = (0, 0)) -> None:
+        """
+        clear - Vider le lot pour une nouvelle frame
+        ---
+        params:
+            - offset: tuple = Décalage ajouté à toutes les primitives (tremblement d'écran)
+        """
+
+        self.offset = offset
+        for kind in self.counts:
+            self.counts[kind] = 0
+
+    def add(self, kind: str, x: float, y: float, width: float, height: float, color) -> None:
+        """
+        add - Ajouter une instance, le tableau double de taille s'il est plein
+        """
+
+        count = self.counts[kind]
+        data = self.instances[kind]
+        if count == len(data):
+            data = self.instances[kind] = np.concatenate([data, np.zeros_like(data)])
+
+        alpha = color[3] if len(color) > 3 else 255
+        data[count] = (
+            x + self.offset[0],
+            y + self.offset[1],
+            width,
+            height,
+            color[0] / 255,
+            color[1] / 255,
+            color[2] / 255,
+            alpha / 255,
+        )
+
+        self.counts[kind] = count + 1
+
+    def rect(self, rect: pygame.Rect, color) -> None:
+        self.add("rect", rect.x, rect.y, rect.width, rect.height, color)
+
+    def circle(self, center, radius: float, color) -> None:
+        self.add("circle", center[0] - radius, center[1] - radius, 2 * radius, 2 * radius, color)
+
+    def draw(self, resolution: tuple[int, int]) -> None:
+        """
+        draw - Dessiner toutes les instances dans le framebuffer actif (rectangles puis cercles)
+        """
+
+        for kind, prog in self.programs.items():
+            count = self.counts[kind]
+            if not count:
+                continue
+
+            data = self.instances[kind]
+            buffer = self.buffers.get(kind)
+            if buffer is None or buffer.size < data.nbytes:
+                if buffer is not None:
+                    self.device.resources.release(self.arrays[kind])
+                    self.device.resources.release(buffer)
+                buffer = self.buffers[kind] = self.device.resources.track(
+                    self.device.ctx.buffer(reserve=data.nbytes, dynamic=True), "sprite_batch"
+                )
+                self.arrays[kind] = self.device.resources.track(
+                    self.device.ctx.vertex_array(
+                        prog,
+                        [
+                            (self.device.quad, "2f", "in_vert"),
+                            (buffer, "4f 4f/i", "in_rect", "in_color"),
+                        ],
+                    ),
+                    "sprite_batch",
+                )
+
+            buffer.orphan()
+            buffer.write(data[:count])
+            prog["resolution"].value = resolution
+            self.arrays[kind].render(moderngl.TRIANGLE_STRIP, instances=count)
+
+    def release(self) -> None:
+        self.device.resources.release_owner("sprite_batch")
+        self.arrays.clear()
+        self.buffers.clear()
+
+
+@dataclass
+class PostPass:
+    """
+    PostPass - Étape de la chaîne de post-traitement d'un Renderer
+
+    Les étapes sont appliquées dans l'ordre de la liste. Celles marquées under_ui sont appliquées à
+    la scène avant que la surface d'interface (menu pause) soit posée, les autres à l'image finale.
+    """
+    shader: str  # Nom du shader dans le dossier "shaders/"
+    name: str = ""  # Nom utilisé par Renderer.set_pass, le nom du shader par défaut
+    scale: float = 1.0  # Résolution de la cible par rapport à la résolution de rendu
+    enabled: bool = True
+    under_ui: bool = False
+    uniforms: dict = field(default_factory=dict)
+
+    def __post_init__(self) -> None:
+        self.name = self.name or self.shader
+
+
+def blur_passes(scale: float = 0.5, radius: float = 0.0, enabled: bool = False) -> list[PostPass]:
+    """
+    blur_passes - Flou gaussien séparable (horizontal puis vertical) appliqué sous l'interface
+    Le nombre d'échantillons est fixe : le coût ne dépend pas du rayon, seulement de scale.
+    """
+
+    return [
+        PostPass(
+            "blur",
+            scale=scale,
+            enabled=enabled,
+            under_ui=True,
+            uniforms={"direction": direction, "radius": radius},
+        )
+        for direction in ((1.0, 0.0), (0.0, 1.0))
+    ]
 
 
 # FIXME: Too many attributes for this class
@@ -19,173 +610,375 @@ class Renderer(Context):
     """
     Renderer - Instance du moteur de rendu de BrokeEngine
 
-    Une instance de ce moteur est créé pour chaques objets Scene
+    Une instance de ce moteur est créé pour chaques objets Scene. Le contexte OpenGL, les programmes
+    et les cibles hors écran appartiennent au RenderDevice du jeu, l'instance ne garde que sa chaîne
+    de post-traitement et ses uniforms. Les cibles qu'elle utilise sont enregistrées à son nom
+    (owner) et rendues par release quand sa scène devient inactive.
+
+    Sans RenderDevice (Game créé avec render=False), l'instance ne garde que sa chaîne : rien n'est
+    compilé ni dessiné, render_frame ne doit pas être appelé.
+
+    Avec graphics.sprite_batch, les rectangles et cercles passés à draw_rect / draw_circle pendant
+    une frame commencée par begin_frame sont dessinés sur le GPU, sous la surface de la scène.
     """
 
-    def __init__(self, shader_name: str | None = None) -> None:
+    def __init__(
+        self,
+        shader_name: str | None = None,
+        passes: list[PostPass] | None = None,
+        owner: str | None = None,
+    ) -> None:
+        """
+        params:
+            - shader_name: str | None = Shader unique à appliquer (raccourci pour passes)
+            - passes: list[PostPass] | None = Chaîne de post-traitement complète
+            - owner: str | None = Propriétaire des cibles hors écran dans le registre du device
+        """
+
         super().__init__()
 
         self.logger: Logger = Logger("systems.renderer")
 
-        self.shader_name: str = shader_name if self.game.config.debug.shaders else ""
-        self.ctx = moderngl.create_context()
-        self.ctx.gc_mode = "auto"
+        self.device: RenderDevice | None = self.game.render_device
+        self.ctx = self.device.ctx if self.device is not None else None
+        self.owner: str = owner or f"renderer:{id(self):x}"
         self.start_time = time.time()
-        self.setup_shaders()
-        self.logger.success(f"Renderer instance {self} initialised")
+        self.frames: int = 0
+        self.render_scale: float = 1.0
 
         self.update_values: bool = True
         self.last_warp: float = 0.0
+        self.scan: float = 0.1
+
+        self.batch: SpriteBatch | None = (
+            self.device.sprite_batch()
+            if self.device is not None and self.game.config.graphics.sprite_batch
+            else None
+        )
+        self.batching: bool = False
+        self.background: tuple = (0, 0, 0)
+
+        if passes is None:
+            passes = [PostPass(shader_name)] if shader_name else []
+        self.setup_passes(passes)
+        self.logger.success(f"Renderer instance {self} initialised")
 
     def change_shader(self, shader_name: str) -> None:
         """
-        change_shader - Changer le shader utilisé par le moteur de rendu
+        change_shader - Remplacer la chaîne de post-traitement par un seul shader
         ---
         params:
             shader_name: str = Nom du shader dans le dossier "shaders/"
         """
 
-        if self.shader_name != shader_name:
-            self.shader_name = shader_name
-            self.setup_shaders()
+        self.setup_passes([PostPass(shader_name)] if shader_name else [])
 
     # noinspection PyAttributeOutsideInit
-    def setup_shaders(self) -> None:
+    def setup_passes(self, passes: list[PostPass]) -> None:
         """
-        setup_shaders - Méthode d'initialisation des shaders
+        setup_passes - Récupérer les programmes partagés de chaque étape de la chaîne
+        Sans debug.shaders, seules les étapes sous l'interface (flou de pause) sont gardées.
         """
 
-        if self.shader_name:
-            with open(f"shaders/{self.shader_name}.glsl", encoding="utf-8") as f:
-                frag_shader_src = f.read()
-        else:
-            frag_shader_src = """
-            #version 330 core
-
-            uniform sampler2D iChannel0;
+        self.resolution: tuple[int, int] = (
+            self.game.config.graphics.render.width,
+            self.game.config.graphics.render.height,
+        )
 
-            in vec2 v_texcoord;
-            out vec4 fragColor;
+        if not self.game.config.debug.shaders:
+            passes = [post_pass for post_pass in passes if post_pass.under_ui]
+        self.passes: list[PostPass] = passes
 
-            void main() {
-                fragColor = texture(iChannel0, v_texcoord);
+        self.programs: dict[str, tuple[moderngl.Program, moderngl.VertexArray]] = (
+            {
+                shader: self.device.program(shader)
+                for shader in {post_pass.shader for post_pass in passes} | {""}
             }
-            """
+            if self.device is not None
+            else {}
+        )
+
+        self.has_warp: bool = any("warp" in prog for prog, _ in self.programs.values())
+
+        self.logger.success("Shaders initialised")
+
+    def has_pass(self, name: str) -> bool:
+        return any(post_pass.name == name for post_pass in self.passes)
 
-        vertex_shader_src = """
-        #version 330 core
+    def set_pass(self, name: str, enabled: bool | None = None, **uniforms) -> None:
+        """
+        set_pass - Activer, désactiver ou changer les uniforms des étapes d'un nom donné
+        Aucune recompilation : les programmes restent dans le cache du RenderDevice.
+        """
 
-        in vec2 in_vert;
-        out vec2 v_texcoord;
+        for post_pass in self.passes:
+            if post_pass.name == name:
+                if enabled is not None:
+                    post_pass.enabled = enabled
+                post_pass.uniforms.update(uniforms)
 
-        void main() {
-            v_texcoord = (in_vert + 1.0) / 2.0;
-            gl_Position = vec4(in_vert, 0.0, 1.0);
+    def set_curvature(self, curvature: float) -> None:
+        """
+        set_curvature - Changer la propriété "curvature" du shader crt
+        ---
+        params:
+            - curvature: float = Valeur à donner au moteur de rendu
+        """
+
+        if self.has_warp and self.last_warp != curvature:
+            self.logger.log(f"Screen curvature change requested to {curvature}")
+            self.last_warp = curvature
+
+    def apply_uniforms(
+        self, prog: moderngl.Program, source: moderngl.Texture, uniforms: dict | None = None
+    ) -> None:
+        """
+        apply_uniforms - Envoyer les uniforms de cette instance et d'une étape au programme partagé
+        Le programme peut avoir été utilisé par une autre scène ou étape depuis la dernière frame.
+        """
+
+        values = {
+            "warp": self.last_warp,
+            "scan": self.scan,
+            "iTime": self.frame_time(),
+            "iResolution": self.resolution,
+            "iChannelResolution": source.size,
+            "iChannel0": 0,
         }
+        if uniforms:
+            values.update(uniforms)
+
+        for name, value in values.items():
+            if name in prog:
+                prog[name].value = value
+
+    def frame_time(self) -> float:
+        """
+        frame_time - Temps donné aux shaders (iTime), en secondes
+        Sans affichage, il avance d'un tick de simulation par image : les captures sont reproductibles.
         """
 
-        if hasattr(self, "prog"):
-            self.prog.release()
-        if hasattr(self, "vao"):
-            self.vao.release()
-        if hasattr(self, "texture"):
-            self.texture.release()
+        if self.device.headless:
+            return self.frames / self.game.timestep.tick_rate
+        return time.time() - self.start_time
+
+    def draw_pass(
+        self,
+        shader: str,
+        source: moderngl.Texture,
+        target: moderngl.Framebuffer | None,
+        uniforms: dict | None = None,
+    ) -> None:
+        """
+        draw_pass - Dessiner source à travers un shader dans target (l'écran si None)
+        """
 
-        self.prog = self.ctx.program(
-            vertex_shader=vertex_shader_src, fragment_shader=frag_shader_src
-        )
+        prog, vao = self.programs[shader]
 
-        vertices = np.array(
-            [
-                -1.0,
-                -1.0,
-                1.0,
-                -1.0,
-                -1.0,
-                1.0,
-                1.0,
-                1.0,
-            ],
-            dtype="f4",
+        if target is None:
+            self.device.screen.use()
+            source.filter = (self.device.upscale_filter, self.device.upscale_filter)
+        else:
+            target.use()
+            source.filter = (moderngl.LINEAR, moderngl.LINEAR)
+
+        source.use(0)
+        self.apply_uniforms(prog, source, uniforms)
+        prog["flip_y"].value = target is None
+        vao.render(moderngl.TRIANGLE_STRIP)
+
+    def scaled(self, scale: float) -> tuple[int, int]:
+        return (
+            max(1, int(self.resolution[0] * scale)),
+            max(1, int(self.resolution[1] * scale)),
         )
 
-        vbo = self.ctx.buffer(vertices.tobytes())
-        self.vao = self.ctx.simple_vertex_array(self.prog, vbo, "in_vert")
+    def begin_frame(self, background, offset=(0, 0), batch: bool = True) -> bool:
+        """
+        begin_frame - Commencer une frame, en dessinant les primitives sur le GPU si possible
+        ---
+        params:
+            - background: list = Couleur de fond de la frame
+            - offset: tuple = Décalage des primitives (tremblement d'écran)
+            - batch: bool = Autoriser le dessin sur le GPU pour cette frame
+        Retourne True si les primitives sont dessinées sur le GPU : la scène doit alors passer
+        sa surface transparente à render_frame au lieu de dessiner dans la fenêtre.
+        """
 
-        self.texture = self.ctx.texture(
-            (
-                self.game.config.graphics.render.width,
-                self.game.config.graphics.render.height,
-            ),
-            3,
-        )
-        self.texture.repeat_x = False
-        self.texture.repeat_y = False
-
-        self.has_warp: bool = "warp" in self.prog
-        self.has_scan: bool = "scan" in self.prog
-        self.has_itime: bool = "iTime" in self.prog
-        self.has_iresolution: bool = "iResolution" in self.prog
-        self.has_ichannel0: bool = "iChannel0" in self.prog
-
-        if self.has_warp:
-            self.prog["warp"].value = 0.0
-        if self.has_scan:
-            self.prog["scan"].value = 0.1
-        if self.has_itime:
-            self.prog["iTime"].value = 0.0
-        if self.has_iresolution:
-            self.prog["iResolution"].value = (
-                self.game.config.graphics.render.width,
-                self.game.config.graphics.render.height,
-            )
-        if self.has_ichannel0:
-            self.prog["iChannel0"].value = 0
+        self.batching = self.batch is not None and batch
+        if self.batching:
+            self.background = tuple(background)
+            self.batch.clear(offset)
+        return self.batching
 
-        self.logger.success("Shaders initialised")
+    def draw_rect(self, surface: pygame.Surface, color, rect: pygame.Rect) -> None:
+        """
+        draw_rect - Rectangle plein, ajouté au lot GPU ou dessiné dans surface
+        """
 
-    def set_curvature(self, curvature: float) -> None:
+        if self.batching:
+            self.batch.rect(rect, color)
+        else:
+            pygame.draw.rect(surface, color, rect, 0)
+
+    def draw_circle(self, surface: pygame.Surface, color, center, radius: float) -> None:
         """
-        set_curvature - Changer la propriété "curvature" du shader crt
+        draw_circle - Disque plein, ajouté au lot GPU ou dessiné dans surface
+        """
+
+        if self.batching:
+            self.batch.circle(center, radius, color)
+        else:
+            pygame.draw.circle(surface, color, center, radius, 0)
+
+    def compose_batch(
+        self, overlay: pygame.Surface | None, scale: float = 1.0
+    ) -> moderngl.Texture:
+        """
+        compose_batch - Dessiner le fond, les primitives du lot puis la surface transparente
+        de la scène dans une cible hors écran, et retourner sa texture
         ---
         params:
-            - curvature: float = Valeur à donner au moteur de rendu
+            - overlay: pygame.Surface | None = Surface transparente de la scène
+            - scale: float = Résolution de la cible par rapport à la résolution de rendu
         """
 
-        if self.has_warp and self.last_warp != curvature:
-            self.logger.log(f"Screen curvature change requested to {curvature}")
-            self.prog["warp"].value = curvature
-            self.last_warp = curvature
+        target = self.device.render_target("scene", self.scaled(scale), self.owner)
+        target.use()
+        target.clear(*(c / 255 for c in self.background), 1.0)
+
+        self.ctx.enable(moderngl.BLEND)
+        self.ctx.blend_func = moderngl.SRC_ALPHA, moderngl.ONE_MINUS_SRC_ALPHA
+
+        self.batch.draw(self.resolution)
+        if overlay is not None:
+            self.draw_pass("", self.device.upload(overlay), target)
+
+        self.ctx.disable(moderngl.BLEND)
+        self.batching = False
+        return target.color_attachments[0]
+
+    def compose_ui(self, source: moderngl.Texture, ui: pygame.Surface, name: str):
+        """
+        compose_ui - Poser la surface d'interface par dessus source, à la résolution de rendu
+        """
+
+        target = self.device.render_target(name, self.resolution, self.owner)
+        self.draw_pass("", source, target)
+
+        self.ctx.enable(moderngl.BLEND)
+        self.ctx.blend_func = moderngl.SRC_ALPHA, moderngl.ONE_MINUS_SRC_ALPHA
+        self.draw_pass("", self.device.upload(ui), target)
+        self.ctx.disable(moderngl.BLEND)
+
+        return target.color_attachments[0]
 
-    def render_frame(self) -> None:
+    def render_frame(
+        self, overlay: pygame.Surface | None = None, ui: pygame.Surface | None = None
+    ) -> None:
         """
         render_frame - méthode executé à chaque frames pour la générer
+        ---
+        params:
+            - overlay: pygame.Surface | None = Surface transparente dessinée par dessus le lot GPU
+              (uniquement après un begin_frame qui a retourné True)
+            - ui: pygame.Surface | None = Surface transparente posée après les étapes under_ui
+
+        La chaîne suit le niveau de qualité du jeu (systems.quality) : sous render_scale 1, toutes
+        les étapes sont dessinées hors écran à résolution réduite puis l'image est agrandie.
+        La surface de la scène reste dessinée et envoyée à la résolution de rendu complète.
         """
 
-        flipped = pygame.transform.flip(self.game.window, False, True)
-        texture_data = pygame.image.tobytes(flipped, "RGB")
+        with self.device.profiler.zone("render_frame"):
+            self._render_frame(overlay, ui)
+
+    def _render_frame(self, overlay: pygame.Surface | None, ui: pygame.Surface | None) -> None:
+        quality = self.game.quality.settings
+        scale = quality.render_scale
+        self.frames += 1
+
+        # Les cibles de l'ancienne résolution ne serviront plus : les rendre avant d'en créer
+        if scale != self.render_scale:
+            self.release()
+            self.render_scale = scale
+
+        if self.device.timer is not None:
+            self.device.timer.begin_frame()
+
+        if self.batching:
+            with self.device.timed("batch"):
+                source = self.compose_batch(overlay, scale)
+        else:
+            with self.device.timed("upload"):
+                source = self.device.upload(self.game.window)
+
+        # Lissage de 5 % par tick de simulation, quelle que soit la fréquence d'affichage
+        if self.has_warp and self.update_values and self.last_warp < 0.5:
+            self.last_warp += (0.5 - self.last_warp) * (1 - 0.95 ** self.game.timestep.frame_ticks)
+
+        passes = [
+            post_pass
+            for post_pass in self.passes
+            if post_pass.enabled and post_pass.name not in quality.disabled_passes
+        ]
+        under_ui = [post_pass for post_pass in passes if post_pass.under_ui]
+        over_ui = [post_pass for post_pass in passes if not post_pass.under_ui]
+
+        # Deux cibles par résolution utilisées à tour de rôle : une étape lit l'une, écrit l'autre
+        flip = 0
+        for post_pass in under_ui:
+            target = self.device.render_target(
+                f"post{flip}", self.scaled(post_pass.scale * scale), self.owner
+            )
+            with self.device.timed(post_pass.name):
+                self.draw_pass(post_pass.shader, source, target, post_pass.uniforms)
+            source = target.color_attachments[0]
+            flip = 1 - flip
+
+        # L'interface est posée à la résolution complète pour rester nette
+        if ui is not None:
+            with self.device.timed("ui"):
+                source = self.compose_ui(source, ui, f"post{flip}")
+            flip = 1 - flip
+
+        # La dernière étape est dessinée directement à l'écran, sauf s'il faut encore agrandir
+        offscreen = over_ui[:-1] if scale == 1.0 else over_ui
+        for post_pass in offscreen:
+            target = self.device.render_target(
+                f"post{flip}", self.scaled(post_pass.scale * scale), self.owner
+            )
+            with self.device.timed(post_pass.name):
+                self.draw_pass(post_pass.shader, source, target, post_pass.uniforms)
+            source = target.color_attachments[0]
+            flip = 1 - flip
+
+        last = over_ui[-1] if over_ui and scale == 1.0 else PostPass("", "passthrough")
 
-        self.texture.write(texture_data)
-        self.texture.use(0)
+        # Toute la fenêtre est effacée (bandes autour de l'image), le dessin reste dans le viewport
+        with self.device.timed(f"present:{last.name}"):
+            self.device.screen.use()
+            self.device.screen.clear(0.0, 0.0, 0.0)
+            self.draw_pass(last.shader, source, None, last.uniforms)
 
-        if self.has_itime:
-            current_time = time.time() - self.start_time
-            self.prog["iTime"].value = current_time
+    def release(self) -> None:
+        """
+        release - Rendre les cibles hors écran de l'instance (scène devenue inactive)
+        Les cibles encore utilisées par une autre instance sont gardées. L'instance reste
+        utilisable : les cibles sont recréées à la frame suivante.
+        """
 
-        if self.has_warp and self.update_values:
-            current_warp = self.prog["warp"].value
-            if current_warp < 0.5:
-                new_warp = current_warp + (0.5 - current_warp) * 0.05
-                self.prog["warp"].value = new_warp
-                self.last_warp = new_warp
+        if self.device is not None:
+            self.device.resources.release_owner(self.owner)
 
-        self.ctx.clear(0.0, 0.0, 0.0)
-        self.vao.render(moderngl.TRIANGLE_STRIP)
+    def gpu_stats(self) -> dict[str, dict[str, float]]:
+        """
+        gpu_stats - Temps GPU et CPU moyens et p95 (ms) de chaque section du rendu
+        ---
+        Vide sans debug.gpu_timing. Les sections sont "upload" (ou "batch"), le nom de chaque
+        étape dessinée hors écran, "ui", "present:<étape>" pour le dessin final à l'écran
+        et "frame" pour leur somme. Les mesures ont quelques frames de retard.
+        """
 
-    def __del__(self) -> None:
-        if hasattr(self, "prog"):
-            self.prog.release()
-        if hasattr(self, "vao"):
-            self.vao.release()
-        if hasattr(self, "texture"):
-            self.texture.release()
+        if self.device is None or self.device.timer is None:
+            return {}
+        return self.device.timer.summary()
@@ -0,0 +1,190 @@
+"""
+systems.replay - Enregistrement et relecture exacte des entrées du joueur
+
+Contenu:
+
+Fonction encode_event
+Fonction decode_event
+Classe InputRecorder
+Classe InputReplay
+
+Pour chaque image, l'enregistrement garde le nombre de ticks de simulation exécutés, la position de
+la souris relevée au début de l'image (None si la fenêtre n'a pas la souris) et les évènements
+pygame envoyés à au moins un abonné de l'EventManager. Avec la graine des flux aléatoires
+(systems.random_streams) et la scène de départ, c'est tout ce dont la logique du jeu dépend : la
+relecture redonne exactement la même partie, quelle que soit la vitesse de la machine.
+
+Les images identiques sans évènement (souris immobile) sont regroupées ; le tout est écrit en JSON
+compressé (gzip), quelques dizaines de Ko pour dix minutes de jeu.
+
+EwoFluffy - BrokeTeam - 2025
+"""
+
+import gzip
+import json
+import os
+import time
+
+import pygame
+
+from systems.logging import Logger
+
+VERSION = 1
+
+
+def encode_event(event: pygame.Event) -> list:
+    """
+    encode_event - Évènement pygame en [type, attributs], sans les attributs non sérialisables (window)
+    """
+
+    attributes = {}
+    for name, value in event.dict.items():
+        if isinstance(value, tuple):
+            value = list(value)
+        if value is None or isinstance(value, (bool, int, float, str, list)):
+            attributes[name] = value
+    return [event.type, attributes]
+
+
+def decode_event(encoded: list) -> pygame.Event:
+    """
+    decode_event - Évènement pygame depuis [type, attributs] (les listes redeviennent des tuples)
+    """
+
+    event_type, attributes = encoded
+    return pygame.event.Event(
+        event_type,
+        {name: tuple(value) if isinstance(value, list) else value for name, value in attributes.items()},
+    )
+
+
+class InputRecorder:
+    """
+    InputRecorder - Entrées de chaque image, gardées en mémoire puis écrites avec save
+    """
+
+    def __init__(self, seed: int, tick_rate: int, scene: str, directory: str = "replays") -> None:
+        """
+        params:
+            - seed: int = Graine des flux aléatoires de la partie
+            - tick_rate: int = Ticks de simulation par seconde (la relecture doit utiliser le même)
+            - scene: str = Scène de départ
+            - directory: str = Dossier des enregistrements
+        """
+
+        self.logger = Logger("systems.replay")
+
+        self.seed = seed
+        self.tick_rate = tick_rate
+        self.scene = scene
+        self.directory = directory
+
+        # [répétitions, ticks, souris, évènements] ; évènements absent quand il n'y en a pas
+        self.frames: list[list] = []
+        self.ticks = 0
+
+        self.logger.log(f"Recording inputs from scene {scene} with seed {seed}")
+
+    def record(self, ticks: int, mouse: tuple[int, int] | None, events: list[pygame.Event]) -> None:
+        """
+        record - Ajouter une image
+        ---
+        params:
+            - ticks: int = Ticks de simulation exécutés pendant l'image
+            - mouse: tuple[int, int] | None = Position de la souris, None si elle est hors de la fenêtre
+            - events: list[pygame.Event] = Évènements envoyés aux abonnés pendant l'image
+        """
+
+        self.ticks += ticks
+        mouse = list(mouse) if mouse is not None else None
+
+        if not events:
+            last = self.frames[-1] if self.frames else None
+            if last is not None and len(last) == 3 and last[1] == ticks and last[2] == mouse:
+                last[0] += 1
+                return
+            self.frames.append([1, ticks, mouse])
+        else:
+            self.frames.append([1, ticks, mouse, [encode_event(event) for event in events]])
+
+    def save(self, path: str | None = None) -> str:
+        """
+        save - Écrire l'enregistrement et retourner son chemin
+        """
+
+        if path is None:
+            os.makedirs(self.directory, exist_ok=True)
+            path = os.path.join(self.directory, time.strftime("brokeout-%Y%m%d-%H%M%S.json.gz"))
+
+        recording = {
+            "version": VERSION,
+            "seed": self.seed,
+            "tick_rate": self.tick_rate,
+            "scene": self.scene,
+            "frames": self.frames,
+        }
+        with gzip.open(path, "wt", encoding="utf-8") as f:
+            json.dump(recording, f, separators=(",", ":"))
+
+        self.logger.success(f"Inputs of {self.ticks} ticks written to {path}")
+        return path
+
+
+class InputReplay:
+    """
+    InputReplay - Entrées enregistrées, rendues image par image avec next_frame
+    """
+
+    def __init__(self, path: str) -> None:
+        """
+        params:
+            - path: str = Fichier écrit par InputRecorder.save
+        """
+
+        self.logger = Logger("systems.replay")
+
+        with gzip.open(path, "rt", encoding="utf-8") as f:
+            recording = json.load(f)
+        if recording["version"] != VERSION:
+            raise ValueError(f"Unsupported replay version {recording['version']} in {path}")
+
+        self.path = path
+        self.seed: int = recording["seed"]
+        self.tick_rate: int = recording["tick_rate"]
+        self.scene: str = recording["scene"]
+        self.frames: list[list] = recording["frames"]
+        self.total_ticks = sum(frame[0] * frame[1] for frame in self.frames)
+
+        self.index = 0
+        self.repeat = 0  # Images restantes de l'entrée en cours
+
+        # Image en cours
+        self.ticks = 0
+        self.mouse: tuple[int, int] | None = None
+        self.events: list[pygame.Event] = []
+        self.finished = False
+
+        self.logger.log(
+            f"Replaying {self.total_ticks} ticks from {path} (scene {self.scene}, seed {self.seed})"
+        )
+
+    def next_frame(self) -> bool:
+        """
+        next_frame - Passer à l'image suivante : ticks, mouse et events sont mis à jour
+        Retourne False (sans tick ni évènement) une fois l'enregistrement terminé
+        """
+
+        if self.repeat == 0:
+            if self.index >= len(self.frames):
+                self.ticks, self.events, self.finished = 0, [], True
+                return False
+
+            frame = self.frames[self.index]
+            self.index += 1
+            self.repeat = frame[0]
+            self.ticks = frame[1]
+            self.mouse = tuple(frame[2]) if frame[2] is not None else None
+            self.events = [decode_event(event) for event in frame[3]] if len(frame) > 3 else []
+
+        self.repeat -= 1
+        return True
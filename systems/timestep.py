@@ -0,0 +1,88 @@
+"""
+systems.timestep - Horloge de simulation à pas fixe
+
+Contenu:
+
+Classe FixedTimestep
+
+La logique du jeu (vitesse de la balle, lissages, minuteurs) est mesurée en ticks de durée fixe.
+Le temps réel écoulé entre deux images s'accumule et la simulation avance d'autant de ticks
+entiers qu'il contient ; le reste (alpha, entre 0 et 1) sert à interpoler l'affichage entre
+l'avant dernier et le dernier tick. Le jeu peut ainsi être affiché à 30, 60 ou 144 images par
+seconde sans changer sa vitesse.
+
+EwoFluffy - BrokeTeam - 2025
+"""
+
+from systems.logging import Logger
+
+
+class FixedTimestep:
+    """
+    FixedTimestep - Accumulateur de temps réel converti en ticks de simulation
+    """
+
+    def __init__(self, tick_rate: int = 60, max_ticks: int = 5) -> None:
+        """
+        params:
+            - tick_rate: int = Ticks de simulation par seconde
+            - max_ticks: int = Ticks exécutés par image au maximum : au delà (machine trop lente,
+              fenêtre déplacée), le temps en trop est abandonné et le jeu ralentit au lieu de geler
+        """
+
+        self.logger = Logger("systems.timestep")
+
+        self.tick_rate = tick_rate
+        self.dt: float = 1.0 / tick_rate
+        self.max_ticks = max(1, max_ticks)
+
+        self.accumulator: float = 0.0
+        self.alpha: float = 1.0  # Position de l'image entre le tick précédent (0) et le dernier (1)
+
+        self.ticks: int = 0  # Ticks exécutés depuis le démarrage
+        self.frame_ticks: int = 0  # Ticks exécutés pour l'image en cours
+        self.dropped: float = 0.0  # Temps abandonné, en secondes
+
+    def advance(self, elapsed: float) -> int:
+        """
+        advance - Ajouter le temps écoulé depuis l'image précédente
+        Retourne le nombre de ticks à exécuter avant de dessiner l'image
+        ---
+        params:
+            - elapsed: float = Temps réel écoulé en secondes
+        """
+
+        self.accumulator += elapsed
+        ticks = int(self.accumulator / self.dt)
+
+        if ticks > self.max_ticks:
+            self.dropped += (ticks - self.max_ticks) * self.dt
+            self.logger.warn(f"Simulation {ticks - self.max_ticks} ticks behind, dropped")
+            ticks = self.max_ticks
+            self.accumulator = self.max_ticks * self.dt
+
+        self.accumulator -= ticks * self.dt
+        self.alpha = min(1.0, self.accumulator / self.dt)
+
+        self.ticks += ticks
+        self.frame_ticks = ticks
+        return ticks
+
+    def step(self, ticks: int = 1) -> int:
+        """
+        step - Avancer d'exactement ticks ticks, alpha à 1 (mode sans affichage, images reproductibles,
+        relecture des entrées)
+        """
+
+        self.accumulator = 0.0
+        self.alpha = 1.0
+        self.ticks += ticks
+        self.frame_ticks = ticks
+        return ticks
+
+    def lerp(self, previous: float, current: float) -> float:
+        """
+        lerp - Valeur à afficher entre son état au tick précédent et au dernier tick
+        """
+
+        return previous + (current - previous) * self.alpha